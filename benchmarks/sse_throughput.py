@@ -0,0 +1,56 @@
+import argparse
+import time
+
+import httpx
+
+from turnqey_demo_py.core import StreamResponse
+
+"""
+Throughput of the Server-Sent Events parser behind `StreamResponse`.
+
+Streams a synthetic body of small JSON events through `StreamResponse` for a
+range of event counts and chunk sizes, and prints the events parsed per second.
+The rate should stay flat as the event count grows, whatever the chunk size.
+
+    python benchmarks/sse_throughput.py --events 1000 10000 100000
+"""
+
+
+class _NoContext:
+    def __exit__(self, *args):
+        pass
+
+
+def make_body(events: int) -> bytes:
+    return b"".join(
+        b'id: %d\ndata: {"price": 1.5, "symbol": "BTC"}\n\n' % i
+        for i in range(events)
+    )
+
+
+def measure(body: bytes, chunk_size: int) -> float:
+    chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+    response = httpx.Response(200, content=iter(chunks))
+    start = time.perf_counter()
+    count = sum(1 for _ in StreamResponse(response, _NoContext(), dict))
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument(
+        "--chunk-sizes", type=int, nargs="+", default=[64, 4096, 65536, 1 << 20]
+    )
+    args = parser.parse_args()
+
+    print(f"{'events':>10} {'chunk size':>12} {'events/s':>12}")
+    for events in args.events:
+        body = make_body(events)
+        for chunk_size in args.chunk_sizes:
+            rate = measure(body, chunk_size)
+            print(f"{events:>10} {chunk_size:>12} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from turnqey_demo_py import AsyncClient, Client
+
+from .helpers import BASE_URL, TOKEN, Handler, with_token
+
+
+@pytest.fixture
+def make_client() -> Callable[..., Client]:
+    """
+    Returns a factory of clients sending their requests to a mock handler.
+
+    The handler does not see token requests unless `stub_token=False` is
+    given, other keyword arguments are passed on to the client.
+    """
+
+    def make(handler: Handler, *, stub_token: bool = True, **kwargs: Any) -> Client:
+        kwargs.setdefault("token", TOKEN)
+        transport = httpx.MockTransport(with_token(handler) if stub_token else handler)
+        return Client(
+            base_url=BASE_URL, httpx_client=httpx.Client(transport=transport), **kwargs
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_async_client() -> Callable[..., AsyncClient]:
+    """
+    Returns a factory of async clients sending their requests to a mock
+    handler, which may be a coroutine function.
+    """
+
+    def make(
+        handler: Handler, *, stub_token: bool = True, **kwargs: Any
+    ) -> AsyncClient:
+        kwargs.setdefault("token", TOKEN)
+        transport = httpx.MockTransport(with_token(handler) if stub_token else handler)
+        return AsyncClient(
+            base_url=BASE_URL,
+            httpx_client=httpx.AsyncClient(transport=transport),
+            **kwargs,
+        )
+
+    return make
@@ -0,0 +1,26 @@
+from typing import Any, Callable
+
+import httpx
+
+"""
+Constants and mock transport helpers shared by the core tests.
+"""
+
+BASE_URL = "https://turnqey.test/api"
+CLIENT_ID = "3e4666bf-d5e5-4aa7-b8ce-cefe41c7568a"
+TOKEN = {"client_id": "OAUTH_CLIENT_ID", "client_secret": "OAUTH_CLIENT_SECRET"}
+
+Handler = Callable[[httpx.Request], Any]
+
+
+def with_token(handler: Handler) -> Handler:
+    """
+    Wraps a mock transport handler to answer `/NewAccessToken` requests itself.
+    """
+
+    def handle(request: httpx.Request) -> Any:
+        if request.url.path.endswith("/NewAccessToken"):
+            return httpx.Response(200, json={"access_token": "tok", "expires_in": 600})
+        return handler(request)
+
+    return handle
@@ -0,0 +1,259 @@
+import asyncio
+import concurrent.futures
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from turnqey_demo_py import RetryPolicy
+from turnqey_demo_py.core import OAuth2
+from turnqey_demo_py.types import models
+
+from tests.helpers import CLIENT_ID
+
+
+def token_handler(calls):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.path.endswith("/NewAccessToken"):
+            return httpx.Response(200, json={"access_token": "tok", "expires_in": 600})
+        assert request.headers["authorization"] == "Bearer tok"
+        return httpx.Response(200, json={"id": CLIENT_ID, "name": "Jane"})
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_await_token_fetched_on_async_client(monkeypatch, make_async_client):
+    """Tests that the async client fetches tokens without the blocking httpx.post."""
+
+    def blocking_post(**kwargs):
+        raise AssertionError("blocking token request made from the event loop")
+
+    monkeypatch.setattr(httpx, "post", blocking_post)
+    calls: list = []
+    client = make_async_client(token_handler(calls), stub_token=False)
+
+    res = await client.clients.get(client_id=CLIENT_ID)
+    await client.clients.get(client_id=CLIENT_ID)
+
+    assert isinstance(res, models.Client)
+    assert [r.url.path for r in calls] == [
+        "/api/NewAccessToken",
+        f"/api/clients/{CLIENT_ID}",
+        f"/api/clients/{CLIENT_ID}",
+    ]
+
+
+def test_token_requests_use_client_transport(monkeypatch, make_client):
+    """Tests that the sync client fetches tokens on its own pooled httpx client."""
+
+    def module_post(**kwargs):
+        raise AssertionError("token request bypassed the client's httpx_client")
+
+    monkeypatch.setattr(httpx, "post", module_post)
+    calls: list = []
+    client = make_client(token_handler(calls), stub_token=False)
+
+    res = client.clients.get(client_id=CLIENT_ID)
+
+    assert isinstance(res, models.Client)
+    assert [r.url.path for r in calls] == [
+        "/api/NewAccessToken",
+        f"/api/clients/{CLIENT_ID}",
+    ]
+    assert json.loads(calls[0].content) == {
+        "grant_type": "client_credentials",
+        "client_id": "OAUTH_CLIENT_ID",
+        "client_secret": "OAUTH_CLIENT_SECRET",
+    }
+
+
+def test_concurrent_threads_share_one_token_refresh(make_client):
+    """Tests that threads racing on an expired token trigger a single refresh."""
+    calls: list = []
+    handler = token_handler(calls)
+
+    def slow_handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/NewAccessToken"):
+            time.sleep(0.1)
+        return handler(request)
+
+    client = make_client(slow_handler, stub_token=False)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(
+            pool.map(lambda _: client.clients.get(client_id=CLIENT_ID), range(8))
+        )
+
+    assert all(isinstance(r, models.Client) for r in results)
+    assert [r.url.path for r in calls].count("/api/NewAccessToken") == 1
+
+
+def test_token_refresh_failure_reaches_all_waiting_threads(make_client):
+    """Tests that a failed single-flight refresh is raised to every waiting thread."""
+    token_calls: list = []
+
+    def failing_handler(request: httpx.Request) -> httpx.Response:
+        token_calls.append(request)
+        time.sleep(0.1)
+        raise httpx.ConnectError("token endpoint unreachable")
+
+    client = make_client(
+        failing_handler,
+        stub_token=False,
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+
+    def call(_):
+        try:
+            client.clients.get(client_id=CLIENT_ID)
+        except httpx.ConnectError as e:
+            return e
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        errors = list(pool.map(call, range(8)))
+
+    assert all(isinstance(e, httpx.ConnectError) for e in errors)
+    assert len(token_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_await_concurrent_tasks_share_one_token_refresh(make_async_client):
+    """Tests that tasks racing on an expired token trigger a single refresh."""
+    calls: list = []
+    handler = token_handler(calls)
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/NewAccessToken"):
+            await asyncio.sleep(0.1)
+        return handler(request)
+
+    client = make_async_client(slow_handler, stub_token=False)
+
+    results = await asyncio.gather(
+        *[client.clients.get(client_id=CLIENT_ID) for _ in range(8)]
+    )
+
+    assert all(isinstance(r, models.Client) for r in results)
+    assert [r.url.path for r in calls].count("/api/NewAccessToken") == 1
+
+
+@pytest.mark.asyncio
+async def test_await_token_refresh_failure_reaches_all_waiting_tasks(make_async_client):
+    """Tests that a failed single-flight refresh is raised to every waiting task."""
+    token_calls: list = []
+
+    async def failing_handler(request: httpx.Request) -> httpx.Response:
+        token_calls.append(request)
+        await asyncio.sleep(0.1)
+        return httpx.Response(401, json={"error": "invalid_client"})
+
+    client = make_async_client(failing_handler, stub_token=False)
+
+    results = await asyncio.gather(
+        *[client.clients.get(client_id=CLIENT_ID) for _ in range(8)],
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+    assert len(token_calls) == 1
+
+
+def test_token_renewed_in_background(make_client):
+    """Tests that an opted-in client renews its token before expiry without a request."""
+    tokens = iter(["tok", "renewed"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/NewAccessToken"):
+            return httpx.Response(
+                200, json={"access_token": next(tokens), "expires_in": 62}
+            )
+        return httpx.Response(200, json={"id": CLIENT_ID, "name": "Jane"})
+
+    client = make_client(handler, stub_token=False, token_refresh_ratio=0.1)
+    client.clients.get(client_id=CLIENT_ID)
+    auth = client._base_client._auths["clientCredentials"]
+    first_expiry = auth.expires_at
+
+    time.sleep(0.5)
+
+    assert auth.access_token == "renewed"
+    assert auth.expires_at > first_expiry
+
+
+def test_failed_background_renewal_is_retried(make_client):
+    """Tests that a failed background renewal re-arms the timer and renews later."""
+    responses = iter(
+        [
+            httpx.Response(200, json={"access_token": "tok", "expires_in": 62}),
+            httpx.Response(503),
+            httpx.Response(200, json={"access_token": "renewed", "expires_in": 62}),
+        ]
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/NewAccessToken"):
+            return next(responses)
+        return httpx.Response(200, json={"id": CLIENT_ID, "name": "Jane"})
+
+    client = make_client(
+        handler,
+        stub_token=False,
+        token_refresh_ratio=0.1,
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    client.clients.get(client_id=CLIENT_ID)
+    auth = client._base_client._auths["clientCredentials"]
+
+    time.sleep(0.5)
+    assert auth.access_token == "tok"
+    time.sleep(1.2)
+    assert auth.access_token == "renewed"
+
+
+def test_due_renewal_starts_one_background_thread(make_client, monkeypatch):
+    """Tests that requests racing on a due renewal start a single renewal thread."""
+    release = threading.Event()
+    renewals: list = []
+
+    def renew(self):
+        renewals.append(self)
+        release.wait(1)
+
+    monkeypatch.setattr(OAuth2, "_renew_in_background", renew)
+    client = make_client(
+        lambda request: httpx.Response(200, json={"id": CLIENT_ID, "name": "Jane"}),
+        token_refresh_ratio=0.5,
+    )
+    client.clients.get(client_id=CLIENT_ID)
+    client._base_client._auths["clientCredentials"].renew_at = time.monotonic()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: client.clients.get(client_id=CLIENT_ID), range(8)))
+    release.set()
+
+    assert len(renewals) == 1
+
+
+@pytest.mark.asyncio
+async def test_await_token_renewed_in_background(make_async_client):
+    """Tests that an opted-in async client renews its token on the event loop."""
+    tokens = iter(["tok", "renewed"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/NewAccessToken"):
+            return httpx.Response(
+                200, json={"access_token": next(tokens), "expires_in": 62}
+            )
+        return httpx.Response(200, json={"id": CLIENT_ID, "name": "Jane"})
+
+    client = make_async_client(handler, stub_token=False, token_refresh_ratio=0.1)
+    await client.clients.get(client_id=CLIENT_ID)
+    auth = client._base_client._auths["clientCredentials"]
+
+    await asyncio.sleep(0.5)
+
+    assert auth.access_token == "renewed"
@@ -0,0 +1,117 @@
+import httpx
+import pytest
+
+from turnqey_demo_py import ConditionalCache
+from turnqey_demo_py.types import models
+
+from tests.helpers import CLIENT_ID
+
+
+def handler(requests):
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(
+            200,
+            headers={"etag": '"v1"'},
+            json={"id": CLIENT_ID, "name": "Ada", "data": [], "pagination": {}},
+        )
+
+    return handle
+
+
+def test_not_modified_responses_are_served_from_cache(make_client):
+    """Tests that a 304 answer returns the result decoded for the first request."""
+    requests: list = []
+    cache = ConditionalCache(paths=["/clients/{clientId}"])
+    c = make_client(handler(requests), conditional_cache=cache)
+
+    first = c.clients.get(client_id=CLIENT_ID)
+    second = c.clients.get(client_id=CLIENT_ID)
+
+    assert isinstance(first, models.Client) and second == first
+    assert second is not first
+    assert [r.headers.get("if-none-match") for r in requests] == [None, '"v1"']
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+
+def test_hits_are_copies_seen_by_response_callbacks(make_client):
+    """Tests that cache hits return fresh copies and reach the `on_response` hook."""
+    requests: list = []
+    bodies: list = []
+    cache = ConditionalCache(paths=["/clients/{clientId}"])
+    c = make_client(handler(requests), conditional_cache=cache)
+    options = {"on_response": lambda response: bodies.append(response.json())}
+
+    first = c.clients.get(client_id=CLIENT_ID, request_options=options)
+    first.name = "Grace"
+    second = c.clients.get(client_id=CLIENT_ID, request_options=options)
+    second.name = "Alan"
+    third = c.clients.get(client_id=CLIENT_ID)
+
+    assert third.name == "Ada"
+    assert [r.headers.get("if-none-match") for r in requests] == [None, '"v1"', '"v1"']
+    assert [body["name"] for body in bodies] == ["Ada", "Ada"]
+
+
+def test_caller_validators_are_not_overwritten(make_client):
+    """Tests that validators given by the caller are sent instead of cached ones."""
+    requests: list = []
+    cache = ConditionalCache(paths=["/clients/{clientId}"])
+    c = make_client(handler(requests), conditional_cache=cache)
+
+    c.clients.get(client_id=CLIENT_ID)
+    res = c.clients.get(
+        client_id=CLIENT_ID,
+        request_options={"additional_headers": {"If-None-Match": '"v0"'}},
+    )
+
+    assert requests[-1].headers.get_list("if-none-match") == ['"v0"']
+    assert res.name == "Ada"
+    assert cache.stats()["hits"] == 0
+
+
+def test_cache_is_opt_in_per_endpoint_and_bounded(make_client):
+    """Tests that only opted-in endpoints are cached, and old entries are evicted."""
+    requests: list = []
+    cache = ConditionalCache(paths=["/clients/{clientId}"], max_entries=1)
+    c = make_client(handler(requests), conditional_cache=cache)
+
+    c.clients.list()
+    c.clients.list()
+    c.clients.get(client_id="a")
+    c.clients.get(client_id="b")
+    c.clients.get(client_id="a")
+
+    assert not any("if-none-match" in r.headers for r in requests)
+    assert cache.stats() == {"hits": 0, "misses": 3, "evictions": 2, "size": 1}
+
+
+def test_cache_entries_are_keyed_by_auth_identity(make_client):
+    """Tests that clients authenticating with other credentials do not share entries."""
+    requests: list = []
+    cache = ConditionalCache(paths=["/clients/{clientId}"])
+    other_token = {"client_id": "OTHER_CLIENT_ID", "client_secret": "SECRET"}
+
+    c = make_client(handler(requests), conditional_cache=cache)
+    other = make_client(handler(requests), token=other_token, conditional_cache=cache)
+    c.clients.get(client_id=CLIENT_ID)
+    other.clients.get(client_id=CLIENT_ID)
+
+    assert [r.headers.get("if-none-match") for r in requests] == [None, None]
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_await_not_modified_responses_are_served_from_cache(make_async_client):
+    """Tests that the async client serves 304 answers from the cache."""
+    requests: list = []
+    cache = ConditionalCache(paths=["/clients/{clientId}"])
+    c = make_async_client(handler(requests), conditional_cache=cache)
+
+    first = await c.clients.get(client_id=CLIENT_ID)
+    second = await c.clients.get(client_id=CLIENT_ID)
+
+    assert second == first and second is not first
+    assert cache.stats()["hits"] == 1
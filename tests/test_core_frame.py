@@ -0,0 +1,88 @@
+import httpx
+import pytest
+
+from turnqey_demo_py.types import frames
+
+from tests.helpers import CLIENT_ID
+
+np = pytest.importorskip("numpy")
+
+TRADES = [
+    {
+        "id": "t0",
+        "base_asset": "BTC",
+        "quote_asset": "USD",
+        "price": 42000.5,
+        "base_quantity": 0.5,
+        "timestamp": "2024-01-01T00:00:00Z",
+        "trade_type": "buy",
+    },
+    {"id": "t1", "base_asset": "ETH", "quote_asset": "USD", "trade_type": "sell"},
+    {"id": "t2", "base_asset": "SOL", "price": 100, "timestamp": "2024-01-01"},
+]
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    page = int(request.url.params["page"])
+    limit = int(request.url.params["limit"])
+    return httpx.Response(
+        200,
+        json={
+            "data": TRADES[(page - 1) * limit : page * limit],
+            "pagination": {"page": page, "limit": limit, "total": len(TRADES)},
+        },
+    )
+
+
+def test_records_decode_into_typed_columns():
+    """Tests that each field is decoded into an array of the expected type."""
+    frame = frames.TradeFrame.from_records(TRADES)
+
+    assert len(frame) == 3
+    assert frame.price.values.dtype == np.float64
+    assert frame.price.mask.tolist() == [False, True, False]
+    assert frame.price.values[0] == 42000.5
+    assert frame.timestamp.values.dtype == np.int64
+    assert frame.timestamp.values[0] == 1704067200 * 10**6
+    assert frame.timestamp.values[2] == frame.timestamp.values[0]
+    assert frame.trade_type.values.dtype == np.int8
+    assert frame.trade_type.to_list() == ["buy", "sell", None]
+    assert frame.base_asset.categories == ("BTC", "ETH", "SOL")
+    assert frame.quote_asset.values.tolist() == [0, 0, -1]
+    assert frame["id"].to_list() == ["t0", "t1", "t2"]
+
+
+def test_concat_merges_symbol_dictionaries():
+    """Tests that concatenated frames remap their dictionary-encoded symbols."""
+    first = frames.TradeFrame.from_records(TRADES[:2])
+    second = frames.TradeFrame.from_records(list(reversed(TRADES)))
+
+    frame = frames.TradeFrame.concat([first, second])
+
+    assert len(frame) == 5
+    assert frame.base_asset.to_list() == ["BTC", "ETH", "SOL", "ETH", "BTC"]
+    assert frame.base_asset.values.dtype == np.int32
+    assert frame.quote_asset.to_list() == ["USD", "USD", None, "USD", "USD"]
+    assert frame.trade_type.to_list() == ["buy", "sell", None, "sell", "buy"]
+
+
+def test_get_frame_decodes_every_page(make_client):
+    """Tests that `get_frame` requests every page and decodes it into one frame."""
+    client = make_client(handler)
+
+    frame = client.clients.trades.get_frame(client_id=CLIENT_ID, page_size=2)
+
+    assert isinstance(frame, frames.TradeFrame)
+    assert frame["id"].to_list() == ["t0", "t1", "t2"]
+    assert frame.base_asset.categories == ("BTC", "ETH", "SOL")
+
+
+@pytest.mark.asyncio
+async def test_await_get_frame_decodes_every_page(make_async_client):
+    """Tests that the async `get_frame` decodes every page into one frame."""
+    client = make_async_client(handler)
+
+    frame = await client.clients.trades.get_frame(client_id=CLIENT_ID, page_size=2)
+
+    assert frame["id"].to_list() == ["t0", "t1", "t2"]
+    assert np.isnan(frame.price.values[1])
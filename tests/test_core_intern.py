@@ -0,0 +1,67 @@
+import httpx
+
+from turnqey_demo_py import InternTable
+
+from tests.helpers import CLIENT_ID
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    page = int(request.url.params["page"])
+    return httpx.Response(
+        200,
+        json={
+            "data": [
+                {"id": f"t{page}{i}", "client_id": CLIENT_ID, "base_asset": "BTC"}
+                for i in range(2)
+            ],
+            "pagination": {"page": page, "pages": 2},
+        },
+    )
+
+
+def test_table_interns_configured_fields_up_to_max_size():
+    """Tests that only configured fields are interned, and only while there is room."""
+    table = InternTable(fields=["asset"], max_size=1)
+    first = table.intern_fields([{"asset": "".join("BTC"), "id": "".join("x")}])
+    second = table.intern_fields(
+        {"data": [{"asset": "".join("BTC")}, {"asset": "".join("ETH")}]}
+    )
+
+    assert second["data"][0]["asset"] is first[0]["asset"]
+    assert second["data"][1]["asset"] == "ETH"
+    assert table.intern("".join("ETH")) is not second["data"][1]["asset"]
+    assert len(table) == 1
+
+
+def test_client_table_shares_strings_across_pages(make_client):
+    """Tests that a client-wide table shares repeated values between all items."""
+    trades = list(
+        make_client(handler, intern_table=InternTable()).clients.trades.iter_get(
+            client_id=CLIENT_ID, page_size=2
+        )
+    )
+    plain = list(
+        make_client(handler, response_mode="lazy").clients.trades.iter_get(
+            client_id=CLIENT_ID, page_size=2
+        )
+    )
+
+    assert len(trades) == 4
+    assert len({id(t.client_id) for t in trades}) == 1
+    assert len({id(t.base_asset) for t in trades}) == 1
+    assert len({id(t.client_id) for t in plain}) == 4
+
+
+def test_request_table_lasts_for_the_pagination(make_client):
+    """Tests that a table passed through the request options serves every page."""
+    table = InternTable()
+
+    trades = list(
+        make_client(handler, response_mode="construct").clients.trades.iter_get(
+            client_id=CLIENT_ID, page_size=2, request_options={"intern_table": table}
+        )
+    )
+
+    assert len({id(t.client_id) for t in trades}) == 1
+    assert trades[0].client_id is table.intern(CLIENT_ID)
+    assert len(table) == 2
@@ -0,0 +1,96 @@
+import json
+
+import httpx
+import pytest
+
+from turnqey_demo_py import ApiError
+from turnqey_demo_py.core import EnvelopeParser
+from turnqey_demo_py.types import models
+
+from tests.helpers import CLIENT_ID
+
+CHUNKS = [
+    b'{"pagination": {"page": 1, "pages": 1}, "data": [{"id": "t0", "pri',
+    b'ce": 1.5}, {"id": "t1", ',
+    b'"fee_asset": "a\\"]},"}',
+    b'], "meta": {"data": [1]}}',
+]
+
+
+def handler(pulled):
+    def chunks():
+        for chunk in CHUNKS:
+            pulled.append(chunk)
+            yield chunk
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("page") == "404":
+            return httpx.Response(404, json={"error": "not found"})
+        return httpx.Response(200, content=chunks())
+
+    return handle
+
+
+async def aiter(items):
+    for item in items:
+        yield item
+
+
+def test_parser_splits_items_at_any_chunk_boundary():
+    """Tests that items are split correctly whichever bytes a chunk ends on."""
+    body = b"".join(CHUNKS)
+    for size in range(1, 12):
+        parser = EnvelopeParser()
+        items = []
+        for i in range(0, len(body), size):
+            items += parser.feed(body[i : i + size])
+
+        assert [json.loads(item) for item in items] == [
+            {"id": "t0", "price": 1.5},
+            {"id": "t1", "fee_asset": 'a"]},'},
+        ]
+        assert parser.close() == {
+            "pagination": {"page": 1, "pages": 1},
+            "data": [],
+            "meta": {"data": [1]},
+        }
+
+
+def test_stream_yields_items_before_the_body_is_complete(make_client):
+    """Tests that the first item is validated once its own bytes have arrived."""
+    pulled: list = []
+    client = make_client(handler(pulled))
+
+    with client.clients.trades.stream_get(client_id=CLIENT_ID) as stream:
+        first = next(stream)
+        assert isinstance(first, models.Trade) and first.price == 1.5
+        assert len(pulled) == 2
+        rest = list(stream)
+
+    assert [t.id for t in rest] == ["t1"]
+    assert stream.envelope is not None
+    assert stream.envelope["pagination"] == {"page": 1, "pages": 1}
+    with pytest.raises(ApiError) as e:
+        client.clients.trades.stream_get(client_id=CLIENT_ID, page=404)
+    assert e.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_await_stream_yields_items(make_async_client):
+    """Tests that the async stream yields validated items and keeps the envelope."""
+    pulled: list = []
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        response = handler(pulled)(request)
+        if request.url.path.endswith("/trades"):
+            return httpx.Response(200, content=aiter(CHUNKS))
+        return response
+
+    client = make_async_client(handle)
+
+    stream = await client.clients.trades.stream_get(client_id=CLIENT_ID)
+    trades = [trade async for trade in stream]
+
+    assert [t.id for t in trades] == ["t0", "t1"]
+    assert trades[1].fee_asset == 'a"]},'
+    assert stream.envelope is not None and stream.envelope["data"] == []
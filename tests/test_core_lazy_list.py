@@ -0,0 +1,113 @@
+import copy
+import pickle
+
+import httpx
+import pydantic
+import pytest
+
+from turnqey_demo_py.core import LazyList, lazy_model
+from turnqey_demo_py.types import models
+
+from tests.helpers import CLIENT_ID
+
+PAGE = (
+    b'{"data": [{"id": "t0", "price": 1.5}, {"id": "t1"}, {"id": "t2", "price": "bad"}],'
+    b' "pagination": {"page": 1, "pages": 1}}'
+)
+
+LazyTradesResponse = lazy_model(models.ClientsTradesGetResponse)
+
+
+def test_items_validated_on_first_access():
+    """Tests that response items are only validated when accessed, then cached."""
+    res = LazyTradesResponse.model_validate_json(PAGE)
+
+    assert isinstance(res.data, LazyList)
+    assert res.pagination is not None and res.pagination.pages == 1
+    assert res.data.validated_count == 0
+
+    first = res.data[0]
+    assert isinstance(first, models.Trade)
+    assert first.price == 1.5
+    assert res.data[0] is first
+    assert res.data.validated_count == 1
+
+
+def test_lazy_response_mode_is_opt_in(make_client):
+    """Tests that responses hold plain lists unless the lazy mode is requested."""
+    page = PAGE.replace(b'"bad"', b"3")
+    client = make_client(
+        lambda request: httpx.Response(
+            200, content=page, headers={"content-type": "application/json"}
+        )
+    )
+
+    res = client.clients.trades.get(client_id=CLIENT_ID)
+    lazy = client.clients.trades.get(
+        client_id=CLIENT_ID, request_options={"response_mode": "lazy"}
+    )
+
+    assert type(res.data) is list
+    assert isinstance(lazy, models.ClientsTradesGetResponse)
+    assert isinstance(lazy.data, LazyList) and lazy.data.validated_count == 0
+    assert lazy.model_dump() == res.model_dump()
+    assert lazy_model(models.Trade) is models.Trade
+
+
+def test_invalid_items_raise_on_access():
+    """Tests that an invalid item only fails once it is accessed."""
+    res = LazyTradesResponse.model_validate_json(PAGE)
+
+    assert [t.id for t in res.data[:2]] == ["t0", "t1"]
+    with pytest.raises(pydantic.ValidationError):
+        res.data[2]
+
+
+def test_behaves_like_a_list():
+    """Tests that length, indexing, slicing, iteration and equality match a list."""
+    items = LazyList(["a", "b", "c", "d"], validate=str.upper)
+    expected = ["A", "B", "C", "D"]
+
+    assert len(items) == 4
+    assert items[-1] == "D"
+    assert items[1:3] == expected[1:3]
+    assert items[::-1] == expected[::-1]
+    assert list(items) == expected
+    assert items == expected
+    assert items + ["E"] == expected + ["E"]
+    with pytest.raises(IndexError):
+        items[4]
+
+    items.append("e")
+    items[0] = "z"
+    del items[1]
+    assert items == ["z", "C", "D", "e"]
+
+
+def test_serializes_like_a_list():
+    """Tests that dumping a response validates and serializes every item."""
+    res = LazyTradesResponse.model_validate(
+        {"data": [{"id": "t0", "price": 2}], "pagination": {"page": 1}}
+    )
+
+    assert res.model_dump(exclude_none=True) == {
+        "data": [{"id": "t0", "price": 2.0}],
+        "pagination": {"page": 1},
+    }
+    assert res.model_dump_json(exclude_none=True) == (
+        '{"data":[{"id":"t0","price":2.0}],"pagination":{"page":1}}'
+    )
+
+
+def test_pickles_as_a_materialized_list():
+    """Tests that responses with lazy lists pickle and copy with validated items."""
+    page = PAGE.replace(b'"bad"', b"3")
+    res = LazyTradesResponse.model_validate_json(page)
+
+    restored = pickle.loads(pickle.dumps(res))
+
+    assert isinstance(restored.data, LazyList)
+    assert restored.data.validated_count == 3
+    assert restored == res
+    assert [t.price for t in restored.data] == [1.5, None, 3.0]
+    assert copy.deepcopy(res.data) == res.data
@@ -0,0 +1,113 @@
+import httpx
+
+from turnqey_demo_py import PageSizeTuner
+
+from tests.helpers import CLIENT_ID
+
+TRADES = "/clients/{clientId}/trades"
+
+
+def paged_handler(calls, total, max_limit=None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        page = int(request.url.params["page"])
+        limit = min(int(request.url.params["limit"]), max_limit or total)
+        ids = range((page - 1) * limit, min(page * limit, total))
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"id": f"t{i}"} for i in ids],
+                "pagination": {
+                    "page": page,
+                    "limit": limit,
+                    "pages": -(-total // limit),
+                    "total": total,
+                },
+            },
+        )
+
+    return handler
+
+
+def test_tuner_scales_towards_target_latency():
+    """Tests that fast pages grow the page size and slow pages shrink it."""
+    tuner = PageSizeTuner(initial_size=100, target_latency=1.0)
+
+    tuner.record(TRADES, page_size=100, items=100, elapsed=0.1, num_bytes=None)
+    assert tuner.size_for(TRADES) == 200
+
+    tuner.record(TRADES, page_size=200, items=200, elapsed=2.5, num_bytes=None)
+    assert tuner.size_for(TRADES) == 100
+
+    tuner.record(TRADES, page_size=100, items=100, elapsed=0.95, num_bytes=None)
+    assert tuner.size_for(TRADES) == 100
+
+
+def test_tuner_respects_bytes_and_bounds():
+    """Tests that page sizes stay below the byte budget and within the bounds."""
+    tuner = PageSizeTuner(
+        initial_size=100, min_size=20, max_size=150, max_page_bytes=10_000
+    )
+
+    tuner.record(TRADES, page_size=100, items=100, elapsed=0.01, num_bytes=20_000)
+    assert tuner.size_for(TRADES) == 50
+
+    for _ in range(5):
+        tuner.record(TRADES, page_size=50, items=50, elapsed=0.01, num_bytes=1_000)
+    assert tuner.size_for(TRADES) == 150
+
+    for _ in range(5):
+        tuner.record(TRADES, page_size=150, items=150, elapsed=60, num_bytes=None)
+    assert tuner.size_for(TRADES) == 20
+
+
+def test_pinned_sizes_are_never_tuned():
+    """Tests that pinned sizes win over observations and show up as learned."""
+    tuner = PageSizeTuner(pinned={TRADES: 250})
+
+    tuner.record(TRADES, page_size=250, items=250, elapsed=0.01, num_bytes=None)
+    tuner.record("/advisors", page_size=100, items=100, elapsed=0.01, num_bytes=None)
+
+    assert tuner.size_for(TRADES) == 250
+    assert tuner.learned_sizes() == {TRADES: 250, "/advisors": 200}
+
+
+def test_adaptive_iteration_yields_every_item_once(make_client):
+    """Tests that tuned page sizes change between pages without gaps or repeats."""
+    calls: list = []
+    tuner = PageSizeTuner(initial_size=10, max_size=64)
+    client = make_client(paged_handler(calls, 300), page_size_tuner=tuner)
+
+    trades = list(client.clients.trades.iter_get(client_id=CLIENT_ID))
+
+    assert [t.id for t in trades] == [f"t{i}" for i in range(300)]
+    limits = [int(r.url.params["limit"]) for r in calls]
+    assert limits[0] == 10
+    assert limits == sorted(limits)
+    assert len(calls) < 300 // 10
+    assert tuner.learned_sizes() == {TRADES: 64}
+
+
+def test_adaptive_iteration_stays_within_a_capped_limit(make_client):
+    """Tests that tuned page sizes beyond the server's limit skip no items."""
+    calls: list = []
+    tuner = PageSizeTuner(initial_size=10, max_size=64)
+    client = make_client(paged_handler(calls, 300, max_limit=24), page_size_tuner=tuner)
+
+    trades = list(client.clients.trades.iter_get(client_id=CLIENT_ID))
+
+    assert [t.id for t in trades] == [f"t{i}" for i in range(300)]
+    assert max(int(r.url.params["limit"]) for r in calls[-3:]) <= 24
+
+
+def test_explicit_page_size_disables_tuning(make_client):
+    """Tests that an explicit page size is used for every page and not learned."""
+    calls: list = []
+    tuner = PageSizeTuner(initial_size=10)
+    client = make_client(paged_handler(calls, 50), page_size_tuner=tuner)
+
+    trades = list(client.clients.trades.iter_get(client_id=CLIENT_ID, page_size=20))
+
+    assert len(trades) == 50
+    assert [r.url.params["limit"] for r in calls] == ["20", "20", "20"]
+    assert tuner.learned_sizes() == {}
@@ -0,0 +1,289 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from turnqey_demo_py.types import models
+
+from tests.helpers import CLIENT_ID
+
+
+def paged_handler(calls, total, *, pages_field=True, max_limit=None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        page = int(request.url.params["page"])
+        limit = min(int(request.url.params["limit"]), max_limit or total or 1)
+        ids = range((page - 1) * limit, min(page * limit, total))
+        pagination = {"page": page, "limit": limit, "total": total}
+        if pages_field:
+            pagination["pages"] = -(-total // limit)
+        return httpx.Response(
+            200,
+            json={"data": [{"id": f"t{i}"} for i in ids], "pagination": pagination},
+        )
+
+    return handler
+
+
+def test_iter_yields_items_of_all_pages(make_client):
+    """Tests that the sync pager stops after the last page reported by the server."""
+    calls: list = []
+    client = make_client(paged_handler(calls, 7))
+
+    trades = list(client.clients.trades.iter_get(client_id=CLIENT_ID, page_size=3))
+
+    assert all(isinstance(t, models.Trade) for t in trades)
+    assert [t.id for t in trades] == [f"t{i}" for i in range(7)]
+    assert [r.url.params["page"] for r in calls] == ["1", "2", "3"]
+    assert all(r.url.params["limit"] == "3" for r in calls)
+
+
+def test_iter_follows_pages_of_a_capped_limit(make_client):
+    """Tests that pages are counted in the page size the server capped requests to."""
+    calls: list = []
+    client = make_client(paged_handler(calls, 120, max_limit=50))
+
+    trades = list(client.clients.trades.iter_get(client_id=CLIENT_ID, page_size=100))
+    later = list(
+        client.clients.trades.iter_get(client_id=CLIENT_ID, page_size=100, start_page=2)
+    )
+
+    assert [t.id for t in trades] == [f"t{i}" for i in range(120)]
+    assert [t.id for t in later] == [f"t{i}" for i in range(100, 120)]
+    assert [r.url.params["page"] for r in calls] == ["1", "2", "3", "2", "3"]
+
+
+def test_iter_realigns_once_to_a_capped_limit(make_client):
+    """Tests that a cap not dividing the start offset costs one extra request."""
+    calls: list = []
+    client = make_client(paged_handler(calls, 140, max_limit=7))
+
+    trades = list(
+        client.clients.trades.iter_get(client_id=CLIENT_ID, page_size=33, start_page=4)
+    )
+
+    assert [t.id for t in trades] == [f"t{i}" for i in range(99, 140)]
+    assert [(r.url.params["page"], r.url.params["limit"]) for r in calls] == [
+        ("4", "33"),
+        *[(str(page), "7") for page in range(15, 21)],
+    ]
+
+    calls.clear()
+    client = make_client(paged_handler(calls, 200, max_limit=30))
+    trades = list(
+        client.clients.trades.iter_get(client_id=CLIENT_ID, page_size=33, start_page=4)
+    )
+
+    assert [t.id for t in trades] == [f"t{i}" for i in range(99, 200)]
+    assert [r.url.params["page"] for r in calls] == ["4", "4", "5", "6", "7"]
+
+
+def test_iter_falls_back_to_total(make_client):
+    """Tests that the pager stops on the item total when the page count is missing."""
+    calls: list = []
+    client = make_client(paged_handler(calls, 6, pages_field=False))
+
+    trades = list(client.clients.trades.iter_get(client_id=CLIENT_ID, page_size=3))
+
+    assert len(trades) == 6
+    assert len(calls) == 2
+
+
+def test_iter_requests_pages_lazily(make_client):
+    """Tests that the next page is only requested once the current one is consumed."""
+    calls: list = []
+    client = make_client(paged_handler(calls, 10))
+
+    trades = iter(client.clients.trades.iter_get(client_id=CLIENT_ID, page_size=2))
+    assert calls == []
+
+    next(trades)
+    next(trades)
+    assert len(calls) == 1
+
+    next(trades)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_await_aiter_yields_items_of_all_pages(make_async_client):
+    """Tests that the async pager yields every item across pages."""
+    calls: list = []
+    client = make_async_client(paged_handler(calls, 5))
+
+    trades = [
+        t
+        async for t in client.clients.trades.aiter_get(
+            client_id=CLIENT_ID, page_size=2, start_page=2
+        )
+    ]
+
+    assert [t.id for t in trades] == ["t2", "t3", "t4"]
+    assert [r.url.params["page"] for r in calls] == ["2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_await_concurrent_fetches_pages_in_parallel(make_async_client):
+    """Tests that remaining pages are requested concurrently up to the limit."""
+    calls: list = []
+    in_flight = [0, 0]
+    handler = paged_handler(calls, 20)
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/NewAccessToken"):
+            return handler(request)
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        await asyncio.sleep(0.02)
+        in_flight[0] -= 1
+        return handler(request)
+
+    client = make_async_client(slow_handler)
+    pager = client.clients.transactions.aiter_get(client_id=CLIENT_ID, page_size=2)
+
+    ordered = [t.id async for t in pager.concurrent(concurrency=3)]
+    unordered = [t.id async for t in pager.concurrent(concurrency=3, ordered=False)]
+
+    assert ordered == [f"t{i}" for i in range(20)]
+    assert sorted(unordered) == sorted(ordered)
+    assert in_flight[1] == 3
+
+
+@pytest.mark.asyncio
+async def test_await_concurrent_follows_growing_total(make_async_client):
+    """Tests that pages added after the first response are fetched as well."""
+    calls: list = []
+    totals = iter([4] + [6] * 10)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/NewAccessToken"):
+            return paged_handler(calls, 0)(request)
+        return paged_handler(calls, next(totals))(request)
+
+    client = make_async_client(handler)
+    pager = client.clients.transactions.aiter_get(client_id=CLIENT_ID, page_size=2)
+
+    ids = [t.id async for t in pager.concurrent()]
+
+    assert ids == [f"t{i}" for i in range(6)]
+    assert sorted(r.url.params["page"] for r in calls) == ["1", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_await_concurrent_cancels_pages_on_early_exit(make_async_client):
+    """Tests that outstanding page requests are cancelled when iteration stops."""
+    calls: list = []
+    handler = paged_handler(calls, 100)
+    cancelled: list = []
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("page", "1") != "1":
+            try:
+                await asyncio.sleep(0.05 * int(request.url.params["page"]))
+            except asyncio.CancelledError:
+                cancelled.append(request)
+                raise
+        return handler(request)
+
+    client = make_async_client(slow_handler)
+    pager = client.clients.transactions.aiter_get(client_id=CLIENT_ID, page_size=10)
+
+    items = pager.concurrent(concurrency=4)
+    async for trade in items:
+        if trade.id == "t10":
+            break
+    await items.aclose()  # type: ignore[attr-defined]
+    await asyncio.sleep(0)
+
+    assert len(cancelled) == 4
+    assert len(calls) == 2
+
+
+def test_parallel_fetches_pages_on_threads(make_client):
+    """Tests that the sync pager fetches pages on worker threads in page order."""
+    calls: list = []
+    in_flight = [0, 0]
+    lock = threading.Lock()
+    handler = paged_handler(calls, 20)
+
+    def slow_handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/NewAccessToken"):
+            return handler(request)
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight[0] -= 1
+            return handler(request)
+
+    client = make_client(slow_handler)
+    pager = client.clients.transactions.iter_get(client_id=CLIENT_ID, page_size=2)
+
+    ids = [t.id for t in pager.parallel(workers=3)]
+
+    assert ids == [f"t{i}" for i in range(20)]
+    assert in_flight[1] == 3
+
+
+def test_parallel_cancels_pages_on_early_exit(make_client):
+    """Tests that pages not yet requested are cancelled when iteration stops."""
+    calls: list = []
+    handler = paged_handler(calls, 1000)
+
+    def slow_handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("page", "1") != "1":
+            time.sleep(0.05)
+        return handler(request)
+
+    client = make_client(slow_handler)
+    pager = client.clients.transactions.iter_get(client_id=CLIENT_ID, page_size=10)
+
+    items = pager.parallel(workers=2)
+    for trade in items:
+        if trade.id == "t10":
+            break
+    items.close()  # type: ignore[attr-defined]
+    time.sleep(0.2)
+
+    # the first page plus at most the window of pages scheduled ahead
+    assert len(calls) <= 1 + 2 * 2
+
+
+def test_prefetch_requests_pages_ahead_of_consumer(make_client):
+    """Tests that prefetching keeps at most `depth` pages ahead of the consumer."""
+    calls: list = []
+    client = make_client(paged_handler(calls, 30))
+    pager = client.clients.trades.iter_get(client_id=CLIENT_ID, page_size=5)
+
+    ids = []
+    ahead = []
+    for trade in pager.prefetch(depth=2):
+        time.sleep(0.005)
+        ids.append(trade.id)
+        ahead.append(len(calls) - (int(trade.id[1:]) // 5 + 1))
+
+    assert ids == [f"t{i}" for i in range(30)]
+    assert max(ahead) == 2
+    assert len(calls) == 6
+
+
+@pytest.mark.asyncio
+async def test_await_prefetch_requests_pages_ahead_of_consumer(make_async_client):
+    """Tests that async prefetching keeps at most `depth` pages ahead of the consumer."""
+    calls: list = []
+    client = make_async_client(paged_handler(calls, 30))
+    pager = client.clients.trades.aiter_get(client_id=CLIENT_ID, page_size=5)
+
+    ids = []
+    ahead = []
+    async for trade in pager.prefetch(depth=1):
+        await asyncio.sleep(0.005)
+        ids.append(trade.id)
+        ahead.append(len(calls) - (int(trade.id[1:]) // 5 + 1))
+
+    assert ids == [f"t{i}" for i in range(30)]
+    assert max(ahead) == 1
+    assert len(calls) == 6
@@ -0,0 +1,20 @@
+from turnqey_demo_py.core import compile_path_template
+
+
+def test_placeholders_match_a_single_segment():
+    """Tests that each placeholder matches exactly one non-empty path segment."""
+    pattern = compile_path_template("/clients/{clientId}/trades")
+
+    assert pattern.match("/clients/abc/trades")
+    assert pattern.match("clients/abc/trades/")
+    assert not pattern.match("/clients/trades")
+    assert not pattern.match("/clients/a/b/trades")
+    assert not pattern.match("/clients/abc/trades/123")
+
+
+def test_literal_segments_are_escaped():
+    """Tests that regex characters in literal segments only match themselves."""
+    pattern = compile_path_template("/prices.v1/{symbol}")
+
+    assert pattern.match("/prices.v1/BTC")
+    assert not pattern.match("/pricesXv1/BTC")
@@ -0,0 +1,73 @@
+import httpx
+import pytest
+
+from turnqey_demo_py import RateLimiter
+from turnqey_demo_py.core import TokenBucket
+
+from tests.helpers import CLIENT_ID
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"data": [], "pagination": {"page": 1}})
+
+
+class RecordingLimiter(RateLimiter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.paths: list = []
+
+    def reserve(self, path: str) -> float:
+        self.paths.append(path)
+        return super().reserve(path)
+
+
+def test_token_bucket_paces_after_burst():
+    """Tests that a bucket allows its burst and then spaces out reservations."""
+    now = [0.0]
+    bucket = TokenBucket(rate=2, burst=2, clock=lambda: now[0])
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    now[0] = 10.0
+    assert bucket.reserve() == 0
+
+
+def test_rate_limiter_path_templates():
+    """Tests that per-path buckets only apply to paths matching their template."""
+    limiter = RateLimiter(
+        path_limits={"/clients/{clientId}/trades": {"requests_per_second": 1}}
+    )
+
+    assert limiter.reserve(f"/clients/{CLIENT_ID}/trades") == 0
+    assert limiter.reserve(f"/clients/{CLIENT_ID}/trades") > 0
+    assert limiter.reserve(f"/clients/{CLIENT_ID}/transactions") == 0
+    assert limiter.reserve(f"/clients/{CLIENT_ID}") == 0
+
+
+def test_client_requests_pass_through_rate_limiter(make_client):
+    """Tests that the sync client reserves capacity before every request."""
+    limiter = RecordingLimiter(requests_per_second=1000)
+    client = make_client(handler, rate_limiter=limiter)
+
+    client.clients.trades.get(client_id=CLIENT_ID)
+    client.clients.transactions.get(client_id=CLIENT_ID)
+
+    assert limiter.paths == [
+        "/NewAccessToken",
+        f"/clients/{CLIENT_ID}/trades",
+        f"/clients/{CLIENT_ID}/transactions",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_await_client_requests_pass_through_rate_limiter(make_async_client):
+    """Tests that the async client reserves capacity before every request."""
+    limiter = RecordingLimiter(requests_per_second=1000)
+    client = make_async_client(handler, rate_limiter=limiter)
+
+    await client.clients.trades.get(client_id=CLIENT_ID)
+
+    assert limiter.paths == ["/NewAccessToken", f"/clients/{CLIENT_ID}/trades"]
@@ -0,0 +1,95 @@
+import httpx
+import pydantic
+import pytest
+from typing_extensions import get_args
+
+from turnqey_demo_py.core.record import record_types
+from turnqey_demo_py.types import models, records
+
+from tests.helpers import CLIENT_ID
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "data": [
+                {"id": "t1", "price": 1.5, "trade_type": "buy"},
+                {"id": "t2", "base_asset": "BTC"},
+            ],
+            "pagination": {"page": 1, "pages": 1},
+        },
+    )
+
+
+def _models_in(annotation):
+    args = get_args(annotation)
+    if args:
+        return [model for arg in args for model in _models_in(arg)]
+    return [annotation]
+
+
+def test_record_mode_decodes_items_into_records(make_client):
+    """Tests that the record mode builds slotted records per call or client-wide."""
+    client = make_client(handler, response_mode="record")
+
+    res = client.clients.trades.get(client_id=CLIENT_ID)
+    typed = client.clients.trades.get(
+        client_id=CLIENT_ID, request_options={"response_mode": "model"}
+    )
+
+    assert isinstance(res, records.ClientsTradesGetResponseRecord)
+    assert isinstance(res.pagination, models.Pagination)
+    assert res.data is not None and isinstance(res.data[0], records.TradeRecord)
+    assert res.data[0].price == 1.5
+    assert res.data[1].base_asset == "BTC"
+    assert res.data[1].trade_type is None
+    assert not hasattr(res.data[0], "__dict__")
+    assert typed.data is not None and isinstance(typed.data[0], models.Trade)
+    assert [t.id for t in client.clients.trades.iter_get(client_id=CLIENT_ID)] == [
+        "t1",
+        "t2",
+    ]
+
+
+def test_records_convert_to_and_from_models():
+    """Tests that records round-trip through their models with the same fields."""
+    price = models.HoldingPrice(symbol="BTC", price=42000.0)
+
+    record = records.HoldingPriceRecord.from_model(price)
+
+    assert record.symbol_field == "BTC"
+    assert record.market_cap is None
+    assert record.to_model() == price
+    assert record == records.HoldingPriceRecord(symbol_field="BTC", price=42000.0)
+    with pytest.raises(TypeError):
+        records.HoldingPriceRecord(symbol="BTC")
+
+
+def test_record_responses_convert_to_models(make_client):
+    """Tests that a record response validates into its model with its items."""
+    client = make_client(handler, response_mode="record")
+
+    res = client.clients.trades.get(client_id=CLIENT_ID)
+    typed = client.clients.trades.get(
+        client_id=CLIENT_ID, request_options={"response_mode": "model"}
+    )
+
+    assert res.to_model() == typed
+
+
+def test_models_holding_records_have_record_types():
+    """Tests that no model is constructed with records in a field typed as a model."""
+    holders = [
+        model
+        for model in vars(models).values()
+        if isinstance(model, type)
+        and issubclass(model, pydantic.BaseModel)
+        and any(
+            item in record_types
+            for field in model.model_fields.values()
+            for item in _models_in(field.annotation)
+        )
+    ]
+
+    assert holders and all(model in record_types for model in holders)
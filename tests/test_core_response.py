@@ -0,0 +1,116 @@
+from typing import Any
+
+import httpx
+import pydantic_core
+import pytest
+from pydantic import BaseModel
+
+from turnqey_demo_py import ApiError
+from turnqey_demo_py.core import from_sse_data
+from turnqey_demo_py.types import models
+
+from tests.helpers import CLIENT_ID
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/missing"):
+        return httpx.Response(404, json={"error": "not found"})
+    if request.url.path.endswith("/broken"):
+        return httpx.Response(502, content=b"<html>bad gateway</html>")
+    return httpx.Response(
+        200,
+        json={
+            "data": [{"id": "t1", "price": 1.5}, {"id": "t2"}],
+            "pagination": {"page": 1, "pages": 1},
+        },
+    )
+
+
+@pytest.fixture
+def client(monkeypatch, make_client):
+    def no_json(self, **kwargs):
+        raise AssertionError("response decoded through an intermediate dict")
+
+    monkeypatch.setattr(httpx.Response, "json", no_json)
+    return make_client(handler)
+
+
+def test_json_responses_validate_from_bytes(client):
+    """Tests that JSON responses are validated without building a dict first."""
+    res = client.clients.trades.get(client_id=CLIENT_ID)
+
+    assert isinstance(res, models.ClientsTradesGetResponse)
+    assert [t.id for t in res.data or []] == ["t1", "t2"]
+    assert res.data and res.data[0].price == 1.5
+
+
+def test_api_error_body_parsed_from_bytes(client):
+    """Tests that error bodies are decoded from bytes, and non-JSON bodies are None."""
+    with pytest.raises(ApiError) as missing:
+        client._base_client.request(method="GET", path="/missing", cast_to=dict)
+    with pytest.raises(ApiError) as broken:
+        client._base_client.request(method="GET", path="/broken", cast_to=dict)
+
+    assert missing.value.body == {"error": "not found"}
+    assert broken.value.body is None
+
+
+def test_sse_data_is_wrapped_unless_enveloped():
+    """Tests that SSE payloads are wrapped in a `data` object when needed."""
+    assert from_sse_data(data='{"data": [1, 2]}', load_with=dict) == {"data": [1, 2]}
+    assert from_sse_data(data="[1, 2]", load_with=dict) == {"data": [1, 2]}
+    assert from_sse_data(data="plain text", load_with=dict) == {"data": "plain text"}
+    assert from_sse_data(data='{"meta": {"data": 1}}', load_with=dict) == {
+        "data": {"meta": {"data": 1}}
+    }
+
+
+def test_enveloped_sse_data_is_validated_from_json(monkeypatch):
+    """Tests that SSE payloads already enveloped skip the intermediate decoding."""
+
+    class Event(BaseModel):
+        data: Any = None
+
+    def no_from_json(*args, **kwargs):
+        raise AssertionError("enveloped payload decoded before validation")
+
+    assert from_sse_data(data='{"n": 1}', load_with=Event).data == {"n": 1}
+    monkeypatch.setattr(pydantic_core, "from_json", no_from_json)
+    assert from_sse_data(data='{"data": {"n": 1}}', load_with=Event).data == {"n": 1}
+
+
+def test_raw_response_mode_skips_models(make_client):
+    """Tests that the raw mode returns decoded JSON per call or client-wide."""
+    client = make_client(handler, response_mode="raw")
+
+    res = client.clients.trades.get(client_id=CLIENT_ID)
+    typed = client.clients.trades.get(
+        client_id=CLIENT_ID, request_options={"response_mode": "model"}
+    )
+
+    assert res == {
+        "data": [{"id": "t1", "price": 1.5}, {"id": "t2"}],
+        "pagination": {"page": 1, "pages": 1},
+    }
+    assert isinstance(typed, models.ClientsTradesGetResponse)
+    assert [t["id"] for t in client.clients.trades.iter_get(client_id=CLIENT_ID)] == [
+        "t1",
+        "t2",
+    ]
+
+
+def test_construct_response_mode_builds_models_without_validation(make_client):
+    """Tests that the construct mode builds nested models from unvalidated data."""
+    client = make_client(handler)
+
+    res = client.clients.trades.get(
+        client_id=CLIENT_ID, request_options={"response_mode": "construct"}
+    )
+
+    assert isinstance(res, models.ClientsTradesGetResponse)
+    assert res.data is not None and isinstance(res.data[0], models.Trade)
+    assert res.data[0].price == 1.5
+    assert res.data[1].price is None
+    assert res.data[1].model_fields_set == {"id"}
+    assert isinstance(res.pagination, models.Pagination)
+    assert res.pagination.pages == 1
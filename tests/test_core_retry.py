@@ -0,0 +1,123 @@
+import httpx
+import pytest
+
+from turnqey_demo_py import ApiError, RetryPolicy
+from turnqey_demo_py.types import models
+
+from tests.helpers import CLIENT_ID
+
+
+def flaky_handler(calls, failures):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) <= len(failures):
+            failure = failures[len(calls) - 1]
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return httpx.Response(200, json={"id": CLIENT_ID, "name": "Jane"})
+
+    return handler
+
+
+def test_retry_policy_status_classes():
+    """Tests matching of exact status codes and status classes."""
+    policy = RetryPolicy(retry_statuses=[429, "5xx"])
+
+    assert policy.is_retryable_status(429)
+    assert policy.is_retryable_status(502)
+    assert not policy.is_retryable_status(404)
+
+
+def test_retry_policy_honors_retry_after():
+    """Tests that Retry-After replaces the backoff delay, capped by max_retry_after."""
+    policy = RetryPolicy(max_retry_after=5)
+
+    short = httpx.Response(503, headers={"retry-after": "2"})
+    long = httpx.Response(503, headers={"retry-after": "120"})
+
+    assert policy.compute_delay(attempt=1, response=short) == 2
+    assert policy.compute_delay(attempt=1, response=long) == 5
+
+
+def test_retry_policy_full_jitter_bound():
+    """Tests that backoff delays stay within the exponential bound."""
+    policy = RetryPolicy(initial_delay=1, backoff_factor=2, max_delay=3)
+
+    for _ in range(50):
+        assert 0 <= policy.compute_delay(attempt=1) <= 1
+        assert 0 <= policy.compute_delay(attempt=5) <= 3
+
+
+def test_get_retries_transient_errors(make_client):
+    """Tests that a GET succeeds after a transient 502 and a connection error."""
+    calls: list = []
+    failures = [httpx.Response(502), httpx.ConnectError("connection reset")]
+    client = make_client(
+        flaky_handler(calls, failures),
+        retry_policy=RetryPolicy(initial_delay=0),
+    )
+
+    res = client.clients.get(client_id=CLIENT_ID)
+
+    assert isinstance(res, models.Client)
+    assert len(calls) == 3
+
+
+def test_requests_are_sent_once_without_a_configured_policy(make_client):
+    """Tests that clients only retry requests once a retry policy is configured."""
+    calls: list = []
+    client = make_client(flaky_handler(calls, [httpx.Response(503)]))
+
+    with pytest.raises(ApiError):
+        client.clients.get(client_id=CLIENT_ID)
+    assert len(calls) == 1
+
+
+def test_post_is_not_retried_by_default(make_client):
+    """Tests that non-idempotent methods fail on the first retryable status."""
+    calls: list = []
+    client = make_client(
+        flaky_handler(calls, [httpx.Response(503)]),
+        retry_policy=RetryPolicy(initial_delay=0),
+    )
+
+    with pytest.raises(ApiError) as e:
+        client.clients.create(email_field="jane@example.com", name="Jane")
+
+    assert e.value.status_code == 503
+    assert len(calls) == 1
+
+
+def test_request_options_override_retry_policy(make_client):
+    """Tests that a per-call policy replaces the client-wide one."""
+    calls: list = []
+    failures = [httpx.Response(500), httpx.Response(500)]
+    client = make_client(
+        flaky_handler(calls, failures),
+        retry_policy=RetryPolicy(initial_delay=0),
+    )
+
+    with pytest.raises(ApiError):
+        client.clients.get(
+            client_id=CLIENT_ID,
+            request_options={"retry_policy": RetryPolicy(max_attempts=1)},
+        )
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_await_get_retries_transient_errors(make_async_client):
+    """Tests that the async client retries a 429 before succeeding."""
+    calls: list = []
+    failures = [httpx.Response(429, headers={"retry-after": "0"})]
+    client = make_async_client(
+        flaky_handler(calls, failures),
+        retry_policy=RetryPolicy(initial_delay=0),
+    )
+
+    res = await client.clients.get(client_id=CLIENT_ID)
+
+    assert isinstance(res, models.Client)
+    assert len(calls) == 2
@@ -0,0 +1,146 @@
+import datetime
+import sqlite3
+
+import httpx
+import pytest
+
+from turnqey_demo_py import Client, SettlementPriceCache
+from turnqey_demo_py.types import models
+
+from tests.helpers import BASE_URL, TOKEN, with_token
+
+TODAY = datetime.date(2024, 3, 1)
+
+
+def handler(requests):
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        params = request.url.params
+        return httpx.Response(
+            200,
+            json={"date": params["date"], "symbol": params["symbol"], "price": 1.5},
+        )
+
+    return handle
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SettlementPriceCache(str(tmp_path / "prices.sqlite3"), today=lambda: TODAY)
+
+
+def test_past_settlement_prices_are_fetched_once(cache, make_client):
+    """Tests that prices of past dates are served from the cache once fetched."""
+    requests: list = []
+    c = make_client(handler(requests), settlement_cache=cache)
+
+    first = c.prices.settlement.get(date="2024-02-29", symbol_field="BTC")
+    second = c.prices.settlement.get(date="2024-02-29", symbol_field="BTC")
+    raw = c.prices.settlement.get(
+        date="2024-02-29", symbol_field="BTC", request_options={"response_mode": "raw"}
+    )
+
+    assert len(requests) == 1
+    assert isinstance(second, models.SettlementPrice) and second == first
+    assert raw == {"date": "2024-02-29", "symbol": "BTC", "price": 1.5}
+
+
+def test_current_and_future_dates_bypass_the_cache(cache, make_client):
+    """Tests that prices of today, future dates or malformed dates are never cached."""
+    requests: list = []
+    c = make_client(handler(requests), settlement_cache=cache)
+
+    for date in ["2024-03-01", "2024-03-02", "yesterday"]:
+        c.prices.settlement.get(date=date, symbol_field="BTC")
+        c.prices.settlement.get(date=date, symbol_field="BTC")
+
+    assert len(requests) == 6
+    assert len(cache) == 0
+
+
+def test_requests_with_additional_params_bypass_the_cache(cache, make_client):
+    """Tests that prices fetched with extra query parameters are never cached."""
+    requests: list = []
+    c = make_client(handler(requests), settlement_cache=cache)
+    options = {"additional_params": {"currency": "EUR"}}
+
+    c.prices.settlement.get(date="2024-02-29", symbol_field="BTC")
+    c.prices.settlement.get(
+        date="2024-02-29", symbol_field="BTC", request_options=options
+    )
+    c.prices.settlement.get(
+        date="2024-01-31", symbol_field="BTC", request_options=options
+    )
+
+    assert len(requests) == 3
+    assert requests[1].url.params["currency"] == "EUR"
+    assert len(cache) == 1
+
+
+def test_cached_prices_persist_across_cache_instances(cache, make_client):
+    """Tests that prices stored by one cache are read by another using the file."""
+    c = make_client(handler([]), settlement_cache=cache)
+    c.prices.settlement.get(date="2024-01-31", symbol_field="ETH")
+    other = SettlementPriceCache(cache.path, today=lambda: TODAY)
+
+    assert other.get(BASE_URL, "2024-01-31", "ETH") is not None
+    assert other.get(BASE_URL, "2024-01-31", "BTC") is None
+
+
+def test_prices_are_cached_per_base_url(cache, make_client):
+    """Tests that clients of different API base URLs do not share cached prices."""
+    requests: list = []
+    c = make_client(handler(requests), settlement_cache=cache)
+    sandbox = Client(
+        base_url="https://sandbox.turnqey.test/api",
+        token=TOKEN,
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(with_token(handler(requests)))
+        ),
+        settlement_cache=cache,
+    )
+    c.prices.settlement.get(date="2024-01-31", symbol_field="ETH")
+    sandbox.prices.settlement.get(date="2024-01-31", symbol_field="ETH")
+
+    assert len(requests) == 2
+    assert len(cache) == 2
+
+
+def test_default_path_is_private_to_the_user(tmp_path, monkeypatch):
+    """Tests that the default database lives in a per-user cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache = SettlementPriceCache()
+
+    assert cache.path == str(tmp_path / "turnqey_demo_py" / "settlement-prices.sqlite3")
+    assert (tmp_path / "turnqey_demo_py").stat().st_mode & 0o077 == 0
+
+
+def test_tables_without_base_urls_are_replaced(tmp_path):
+    """Tests that entries cached before base URLs were part of the key are dropped."""
+    path = str(tmp_path / "prices.sqlite3")
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE settlement_prices (date TEXT, symbol TEXT, body BLOB)"
+        )
+        connection.execute(
+            "INSERT INTO settlement_prices VALUES ('2024-01-31', 'ETH', '')"
+        )
+
+    cache = SettlementPriceCache(path, today=lambda: TODAY)
+
+    assert len(cache) == 0
+    cache.put(BASE_URL, "2024-01-31", "ETH", b"{}")
+    assert SettlementPriceCache(path).get(BASE_URL, "2024-01-31", "ETH") == b"{}"
+
+
+@pytest.mark.asyncio
+async def test_await_past_settlement_prices_are_fetched_once(cache, make_async_client):
+    """Tests that the async client serves prices of past dates from the cache."""
+    requests: list = []
+    c = make_async_client(handler(requests), settlement_cache=cache)
+
+    first = await c.prices.settlement.get(date="2024-02-29", symbol_field="BTC")
+    second = await c.prices.settlement.get(date="2024-02-29", symbol_field="BTC")
+
+    assert len(requests) == 1
+    assert second == first
@@ -0,0 +1,169 @@
+import httpx
+import pytest
+
+from turnqey_demo_py.core import (
+    RetryPolicy,
+    SSEDecoder,
+    parse_sse_data,
+    parse_sse_event,
+)
+
+EVENTS = b'data: {"n": 1}\n\n: keep-alive\n\ndata: {"n": 2}\r\n\r\ndata: {"n": 3}'
+
+
+def resumed_chunks(request: httpx.Request):
+    # the first connection drops in the middle of an event
+    if "last-event-id" not in request.headers:
+        yield b'retry: 0\nid: 1\ndata: {"n": 1}\n\n'
+        yield b'event: tick\nid: 2\ndata: {"n": 2}\n\ndata: {"n": 9'
+        raise httpx.ReadError("connection reset")
+    yield b'id: 3\ndata: {"n": 3}\n\n'
+
+
+def resumable_handler(requests, asynchronous=False):
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        chunks = resumed_chunks(request)
+
+        async def achunks():
+            for chunk in chunks:
+                yield chunk
+
+        return httpx.Response(200, content=achunks() if asynchronous else chunks)
+
+    return handle
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    # one byte per chunk, splitting every boundary
+    return httpx.Response(
+        200,
+        headers={"content-type": "text/event-stream"},
+        content=iter([EVENTS[i : i + 1] for i in range(len(EVENTS))]),
+    )
+
+
+async def async_handler(request: httpx.Request) -> httpx.Response:
+    async def chunks():
+        for i in range(0, len(EVENTS), 5):
+            yield EVENTS[i : i + 5]
+
+    return httpx.Response(
+        200, headers={"content-type": "text/event-stream"}, content=chunks()
+    )
+
+
+@pytest.mark.parametrize("newline", [b"\n", b"\r\n", b"\r"])
+def test_decoder_splits_events_across_chunks(newline):
+    """Tests that events are split on blank lines of every line ending style."""
+    body = newline.join([b"event: a", b"data: 1", b"", b"data: 2", b"", b"data: 3"])
+    for size in (1, 2, 3, 7, len(body)):
+        decoder = SSEDecoder()
+        messages = []
+        for i in range(0, len(body), size):
+            messages.extend(decoder.feed(body[i : i + size]))
+        rest = decoder.flush()
+
+        assert [parse_sse_data(m) for m in messages] == ["1", "2"]
+        assert rest is not None and parse_sse_data(rest) == "3"
+
+
+def test_decoder_compacts_consumed_bytes():
+    """Tests that the decoder does not keep the bytes of returned events."""
+    decoder = SSEDecoder()
+    event = b"data: " + b"x" * 1000 + b"\n\n"
+    count = 0
+    for _ in range(500):
+        count += len(decoder.feed(event + b"data: partial"))
+        count += len(decoder.feed(b"\n\n"))
+
+    assert count == 1000
+    assert len(decoder._buffer) < 2 * len(event)
+    assert decoder.flush() is None
+
+
+def test_parse_sse_data_joins_data_lines():
+    """Tests that multi-line data is joined and messages without data are None."""
+    assert parse_sse_data("id: 1\ndata: a\ndata:\ndata: b") == "a\n\nb"
+    assert parse_sse_data(": comment") is None
+
+
+def test_parse_sse_event_reads_every_field():
+    """Tests that the event type, id and retry fields of a message are parsed."""
+    event = parse_sse_event("event: tick\r\nid: 7\r\nretry: 250\r\ndata: x")
+    unnamed = parse_sse_event("retry: soon\ndata: y")
+
+    assert (event.data, event.event, event.id, event.retry) == ("x", "tick", "7", 250)
+    assert (unnamed.event, unnamed.id, unnamed.retry) == ("message", None, None)
+
+
+def test_stream_response_yields_events(make_client):
+    """Tests that streamed events are parsed when every byte arrives separately."""
+    client = make_client(handler)
+    stream = client._base_client.stream_request(
+        method="GET", path="/events", cast_to=dict
+    )
+
+    assert [event["data"]["n"] for event in stream] == [1, 2, 3]
+    assert stream.response.is_closed
+
+
+@pytest.mark.asyncio
+async def test_await_stream_response_yields_events(make_async_client):
+    """Tests that streamed events are parsed by the async stream response."""
+    client = make_async_client(async_handler)
+    stream = await client._base_client.stream_request(
+        method="GET", path="/events", cast_to=dict
+    )
+
+    assert [event["data"]["n"] async for event in stream] == [1, 2, 3]
+
+
+def test_stream_response_resumes_after_dropped_connection(make_client):
+    """Tests that a dropped stream reconnects with the last event id and goes on."""
+    requests: list = []
+    client = make_client(resumable_handler(requests), retry_policy=RetryPolicy())
+    stream = client._base_client.stream_request(
+        method="GET", path="/events", cast_to=dict
+    )
+    events = list(stream.events())
+
+    assert [(e.data["data"]["n"], e.event, e.id) for e in events] == [
+        (1, "message", "1"),
+        (2, "tick", "2"),
+        (3, "message", "3"),
+    ]
+    assert [r.headers.get("last-event-id") for r in requests] == [None, "2"]
+    assert stream.last_event_id == "3" and stream.retry == 0
+
+
+def test_stream_response_raises_once_reconnects_run_out(make_client):
+    """Tests that a dropped stream is not reopened when retries are disabled."""
+    client = make_client(
+        resumable_handler([]),
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    stream = client._base_client.stream_request(
+        method="GET", path="/events", cast_to=dict
+    )
+
+    with pytest.raises(httpx.ReadError):
+        list(stream)
+    assert stream.response.is_closed
+
+
+@pytest.mark.asyncio
+async def test_await_stream_response_resumes_after_dropped_connection(
+    make_async_client,
+):
+    """Tests that a dropped async stream reconnects with the last event id."""
+    requests: list = []
+    client = make_async_client(
+        resumable_handler(requests, asynchronous=True), retry_policy=RetryPolicy()
+    )
+    stream = await client._base_client.stream_request(
+        method="GET", path="/events", cast_to=dict
+    )
+
+    assert [event["data"]["n"] async for event in stream] == [1, 2, 3]
+    assert [r.headers.get("last-event-id") for r in requests] == [None, "2"]
@@ -0,0 +1,153 @@
+import os
+import stat
+import time
+
+import httpx
+import pytest
+
+from turnqey_demo_py import FileTokenStore
+from turnqey_demo_py.core import token_store_key
+
+from tests.helpers import CLIENT_ID
+
+
+def token_handler(calls):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.path.endswith("/NewAccessToken"):
+            return httpx.Response(200, json={"access_token": "tok", "expires_in": 600})
+        return httpx.Response(200, json={"id": CLIENT_ID, "name": "Jane"})
+
+    return handler
+
+
+def test_token_store_key_excludes_secrets():
+    """Tests that store keys depend on the identity but never on its secrets."""
+    key = token_store_key(
+        token_url="https://turnqey.test/api/NewAccessToken",
+        client_id="OAUTH_CLIENT_ID",
+        scope=["read", "write"],
+    )
+
+    assert key == token_store_key(
+        token_url="https://turnqey.test/api/NewAccessToken",
+        client_id="OAUTH_CLIENT_ID",
+        scope=["write", "read"],
+    )
+    assert key != token_store_key(
+        token_url="https://turnqey.test/api/NewAccessToken",
+        client_id="OTHER_CLIENT_ID",
+        scope=["read", "write"],
+    )
+    assert "OAUTH_CLIENT_ID" not in key
+
+
+def test_file_token_store_round_trip(tmp_path):
+    """Tests that stored tokens are readable back and private to the user."""
+    store = FileTokenStore(str(tmp_path))
+
+    assert store.load("key") is None
+    with store.lock("key"):
+        store.save("key", {"access_token": "tok", "expires_at": 1700000000.0})
+
+    assert store.load("key") == {"access_token": "tok", "expires_at": 1700000000.0}
+    mode = os.stat(tmp_path / "key.json").st_mode
+    assert stat.S_IMODE(mode) == 0o600
+
+
+def test_file_token_store_defaults_to_a_private_user_directory(tmp_path, monkeypatch):
+    """Tests that the default directory is per-user and created private."""
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    store = FileTokenStore()
+
+    assert store.directory == str(tmp_path / ".cache" / "turnqey_demo_py" / "tokens")
+    assert stat.S_IMODE(os.stat(store.directory).st_mode) == 0o700
+
+
+def test_file_token_store_refuses_shared_directories(tmp_path):
+    """Tests that directories other users can access are never used."""
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    os.chmod(shared, 0o755)
+
+    with pytest.raises(PermissionError):
+        FileTokenStore(str(shared))
+
+
+def test_file_token_store_lock_gives_up_after_timeout(tmp_path):
+    """Tests that a lock held by another holder is not waited on forever."""
+    store = FileTokenStore(str(tmp_path), lock_timeout=0.1)
+
+    with store.lock("key") as held:
+        start = time.monotonic()
+        with store.lock("key") as waited:
+            assert held and not waited
+        assert time.monotonic() - start < 1
+    with store.lock("key") as released:
+        assert released
+
+
+def test_refresh_goes_without_the_store_when_locked_out(tmp_path, make_client):
+    """Tests that a client still gets a token while another holds the store lock."""
+    calls: list = []
+    store = FileTokenStore(str(tmp_path), lock_timeout=0.1)
+    client = make_client(token_handler(calls), stub_token=False, token_store=store)
+    key = client._base_client._auths["clientCredentials"]._token_store_key()
+
+    with store.lock(key):
+        client.clients.get(client_id=CLIENT_ID)
+
+    assert [r.url.path for r in calls].count("/api/NewAccessToken") == 1
+    assert store.load(key) is None
+
+
+def test_clients_share_stored_token(tmp_path, make_client):
+    """Tests that a second client adopts the token stored by the first one."""
+    first_calls: list = []
+    second_calls: list = []
+    store = FileTokenStore(str(tmp_path))
+    first = make_client(token_handler(first_calls), stub_token=False, token_store=store)
+    second = make_client(
+        token_handler(second_calls), stub_token=False, token_store=store
+    )
+
+    first.clients.get(client_id=CLIENT_ID)
+    second.clients.get(client_id=CLIENT_ID)
+
+    assert [r.url.path for r in first_calls].count("/api/NewAccessToken") == 1
+    assert [r.url.path for r in second_calls] == [f"/api/clients/{CLIENT_ID}"]
+    assert second_calls[0].headers["authorization"] == "Bearer tok"
+
+
+def test_expired_stored_token_is_not_adopted(tmp_path, make_client):
+    """Tests that a stored token about to expire triggers a new token request."""
+    calls: list = []
+    store = FileTokenStore(str(tmp_path))
+    client = make_client(token_handler(calls), stub_token=False, token_store=store)
+    key = client._base_client._auths["clientCredentials"]._token_store_key()
+    store.save(key, {"access_token": "stale", "expires_at": time.time() + 30})
+
+    client.clients.get(client_id=CLIENT_ID)
+
+    assert [r.url.path for r in calls].count("/api/NewAccessToken") == 1
+    assert store.load(key)["access_token"] == "tok"
+
+
+@pytest.mark.asyncio
+async def test_await_clients_share_stored_token(
+    tmp_path, make_client, make_async_client
+):
+    """Tests that an async client adopts a token stored by another client."""
+    calls: list = []
+    store = FileTokenStore(str(tmp_path))
+    first = make_client(token_handler([]), stub_token=False, token_store=store)
+    first.clients.get(client_id=CLIENT_ID)
+    client = make_async_client(
+        token_handler(calls), stub_token=False, token_store=store
+    )
+
+    await client.clients.get(client_id=CLIENT_ID)
+
+    assert [r.url.path for r in calls] == [f"/api/clients/{CLIENT_ID}"]
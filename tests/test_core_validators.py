@@ -0,0 +1,100 @@
+import threading
+
+import httpx
+
+from turnqey_demo_py.core import (
+    ValidatorRegistry,
+    from_encodable,
+    request_validators,
+    response_validators,
+    to_encodable,
+    type_utils,
+)
+from turnqey_demo_py.types import models, params
+
+
+def test_registry_caches_one_validator_per_type():
+    """Tests that a validator is built once per type and reused afterwards."""
+    registry = ValidatorRegistry()
+
+    first = registry.get(models.Pagination)
+    second = registry.get(models.Pagination)
+
+    assert first is second
+    assert registry.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    registry.clear()
+    assert registry.stats() == {"hits": 0, "misses": 0, "size": 0}
+
+
+def test_registry_counts_every_lookup_across_threads():
+    """Tests that concurrent lookups are all counted as hits or misses."""
+    registry = ValidatorRegistry()
+    registry.get(int)
+
+    def lookup() -> None:
+        for _ in range(1000):
+            registry.get(int)
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert registry.stats() == {"hits": 8000, "misses": 1, "size": 1}
+
+
+def test_from_encodable_uses_shared_registry():
+    """Tests that response decoding is served from the shared registry."""
+    from_encodable(data={"page": 1}, load_with=models.Pagination)
+    before = response_validators.stats()
+
+    res = from_encodable(data={"page": 2, "pages": 4}, load_with=models.Pagination)
+
+    assert res == models.Pagination(page=2, pages=4)
+    assert response_validators.stats()["hits"] == before["hits"] + 1
+    assert response_validators.stats()["misses"] == before["misses"]
+
+
+def test_process_response_uses_shared_registry(make_client):
+    """Tests that repeated calls to an endpoint do not rebuild validators."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"date": "2024-01-31", "price": 42000.5})
+
+    client = make_client(handler)
+    client.prices.settlement.get(date="2024-01-31", symbol_field="BTC")
+    before = response_validators.stats()
+
+    res = client.prices.settlement.get(date="2024-01-31", symbol_field="BTC")
+
+    assert isinstance(res, models.SettlementPrice)
+    assert response_validators.stats()["misses"] == before["misses"]
+
+
+def test_to_encodable_primitive_fast_path():
+    """Tests that exact primitive values skip validation entirely."""
+    before = request_validators.stats()
+
+    assert to_encodable(item=25, dump_with=int) == 25
+    assert to_encodable(item="2024-01-01", dump_with=str) == "2024-01-01"
+
+    assert request_validators.stats() == before
+
+
+def test_to_encodable_caches_body_adapter():
+    """Tests that request bodies are validated with a cached adapter."""
+    body = {
+        "email_field": "jane@example.com",
+        "name": "Jane",
+        "phone": type_utils.NOT_GIVEN,
+    }
+    to_encodable(item=body, dump_with=params._SerializerClientCreate)
+    before = request_validators.stats()
+
+    res = to_encodable(item=body, dump_with=params._SerializerClientCreate)
+
+    assert res == {"email": "jane@example.com", "name": "Jane"}
+    assert request_validators.stats()["hits"] == before["hits"] + 1
+    assert request_validators.stats()["misses"] == before["misses"]
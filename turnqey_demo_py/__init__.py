@@ -1,6 +1,31 @@
 from .client import AsyncClient, Client
-from .core import ApiError, BinaryResponse
+from .core import (
+    ApiError,
+    BinaryResponse,
+    ConditionalCache,
+    FileTokenStore,
+    InternTable,
+    PageSizeTuner,
+    RateLimiter,
+    RetryPolicy,
+    SettlementPriceCache,
+    TokenStore,
+)
 from .environment import Environment
 
 
-__all__ = ["ApiError", "AsyncClient", "BinaryResponse", "Client", "Environment"]
+__all__ = [
+    "ApiError",
+    "AsyncClient",
+    "BinaryResponse",
+    "Client",
+    "ConditionalCache",
+    "Environment",
+    "FileTokenStore",
+    "InternTable",
+    "PageSizeTuner",
+    "RateLimiter",
+    "RetryPolicy",
+    "SettlementPriceCache",
+    "TokenStore",
+]
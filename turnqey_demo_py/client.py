@@ -4,16 +4,25 @@ import typing
 from turnqey_demo_py.core import (
     AsyncBaseClient,
     AuthBearer,
+    ConditionalCache,
     GrantType,
+    InternTable,
     OAuth2,
     OAuth2ClientCredentialsForm,
+    PageSizeTuner,
+    RateLimiter,
+    ResponseMode,
+    RetryPolicy,
+    SettlementPriceCache,
     SyncBaseClient,
+    TokenStore,
 )
 from turnqey_demo_py.environment import Environment
 from turnqey_demo_py.resources.advisors import AdvisorsClient, AsyncAdvisorsClient
 from turnqey_demo_py.resources.auth import AsyncAuthClient, AuthClient
 from turnqey_demo_py.resources.clients import AsyncClientsClient, ClientsClient
 from turnqey_demo_py.resources.prices import AsyncPricesClient, PricesClient
+from turnqey_demo_py.types import records  # noqa: F401, registers the record types
 
 
 class Client:
@@ -25,6 +34,15 @@ class Client:
         httpx_client: typing.Optional[httpx.Client] = None,
         environment: Environment = Environment.PRODUCTION,
         token: typing.Optional[OAuth2ClientCredentialsForm] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        token_refresh_ratio: typing.Optional[float] = None,
+        token_store: typing.Optional[TokenStore] = None,
+        page_size_tuner: typing.Optional[PageSizeTuner] = None,
+        response_mode: ResponseMode = "model",
+        intern_table: typing.Optional[InternTable] = None,
+        conditional_cache: typing.Optional[ConditionalCache] = None,
+        settlement_cache: typing.Optional[SettlementPriceCache] = None,
     ):
         """Initialize root client"""
         self._base_client = SyncBaseClient(
@@ -32,11 +50,19 @@ class Client:
             httpx_client=httpx.Client(timeout=timeout)
             if httpx_client is None
             else httpx_client,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            page_size_tuner=page_size_tuner,
+            response_mode=response_mode,
+            intern_table=intern_table,
+            conditional_cache=conditional_cache,
+            settlement_cache=settlement_cache,
         )
         self._base_client.register_auth(
             "clientCredentials",
             OAuth2(
                 token_url=self._base_client.build_url("/NewAccessToken"),
+                token_path="/NewAccessToken",
                 access_token_pointer="/access_token",
                 expires_in_pointer="/expires_in",
                 credentials_location="request_body",
@@ -51,6 +77,11 @@ class Client:
                 client_secret=None if not token else token.get("client_secret"),
                 scope=None if not token else token.get("scope"),
                 request_mutator=AuthBearer(val=None),
+                retry_policy=self._base_client.retry_policy,
+                refresh_ratio=token_refresh_ratio,
+                rate_limiter=self._base_client.rate_limiter,
+                token_store=token_store,
+                httpx_client=self._base_client.httpx_client,
             ),
         )
         self.clients = ClientsClient(base_client=self._base_client)
@@ -68,6 +99,15 @@ class AsyncClient:
         httpx_client: typing.Optional[httpx.AsyncClient] = None,
         environment: Environment = Environment.PRODUCTION,
         token: typing.Optional[OAuth2ClientCredentialsForm] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        token_refresh_ratio: typing.Optional[float] = None,
+        token_store: typing.Optional[TokenStore] = None,
+        page_size_tuner: typing.Optional[PageSizeTuner] = None,
+        response_mode: ResponseMode = "model",
+        intern_table: typing.Optional[InternTable] = None,
+        conditional_cache: typing.Optional[ConditionalCache] = None,
+        settlement_cache: typing.Optional[SettlementPriceCache] = None,
     ):
         """Initialize root client"""
         self._base_client = AsyncBaseClient(
@@ -75,11 +115,19 @@ class AsyncClient:
             httpx_client=httpx.AsyncClient(timeout=timeout)
             if httpx_client is None
             else httpx_client,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            page_size_tuner=page_size_tuner,
+            response_mode=response_mode,
+            intern_table=intern_table,
+            conditional_cache=conditional_cache,
+            settlement_cache=settlement_cache,
         )
         self._base_client.register_auth(
             "clientCredentials",
             OAuth2(
                 token_url=self._base_client.build_url("/NewAccessToken"),
+                token_path="/NewAccessToken",
                 access_token_pointer="/access_token",
                 expires_in_pointer="/expires_in",
                 credentials_location="request_body",
@@ -94,6 +142,11 @@ class AsyncClient:
                 client_secret=None if not token else token.get("client_secret"),
                 scope=None if not token else token.get("scope"),
                 request_mutator=AuthBearer(val=None),
+                retry_policy=self._base_client.retry_policy,
+                refresh_ratio=token_refresh_ratio,
+                rate_limiter=self._base_client.rate_limiter,
+                token_store=token_store,
+                async_httpx_client=self._base_client.httpx_client,
             ),
         )
         self.clients = AsyncClientsClient(base_client=self._base_client)
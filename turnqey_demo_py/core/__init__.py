@@ -13,22 +13,53 @@ from .auth import (
 )
 from .base_client import AsyncBaseClient, BaseClient, SyncBaseClient
 from .binary_response import BinaryResponse
+from .conditional_cache import ConditionalCache, ConditionalCacheStats
+from .frame import Column, Frame
+from .intern import DEFAULT_INTERN_FIELDS, InternTable
+from .json_stream import AsyncItemStream, EnvelopeParser, ItemStream
+from .lazy_list import LazyList, lazy_model
+from .page_size import PageSizeTuner
+from .pagination import DEFAULT_PAGE_SIZE, AsyncPager, SyncPager
+from .path_template import compile_path_template
 from .query import encode_query_param, QueryParams
 from .request import (
     filter_not_given,
     to_content,
     to_encodable,
     RequestOptions,
+    ResponseMode,
     default_request_options,
 )
-from .response import from_encodable, AsyncStreamResponse, StreamResponse
+from .rate_limit import RateLimit, RateLimiter, TokenBucket
+from .record import Record
+from .retry import RetryPolicy, default_retry_policy
+from .settlement_cache import SettlementPriceCache, capture_body
+from .sse import SSEDecoder, ServerSentEvent, parse_sse_data, parse_sse_event
+from .token_store import FileTokenStore, StoredToken, TokenStore, token_store_key
+from .response import (
+    construct_encodable,
+    from_encodable,
+    from_json,
+    from_sse_data,
+    AsyncStreamResponse,
+    StreamResponse,
+)
+from .validators import (
+    ValidatorRegistry,
+    ValidatorStats,
+    request_validators,
+    response_validators,
+)
 
 __all__ = [
     "ApiError",
     "AsyncBaseClient",
     "BaseClient",
     "BinaryResponse",
+    "ConditionalCache",
+    "ConditionalCacheStats",
     "RequestOptions",
+    "ResponseMode",
     "default_request_options",
     "SyncBaseClient",
     "AuthKeyQuery",
@@ -45,8 +76,45 @@ __all__ = [
     "filter_not_given",
     "to_content",
     "encode_query_param",
+    "construct_encodable",
     "from_encodable",
+    "from_json",
+    "from_sse_data",
     "AsyncStreamResponse",
     "StreamResponse",
     "QueryParams",
+    "DEFAULT_PAGE_SIZE",
+    "AsyncPager",
+    "SyncPager",
+    "compile_path_template",
+    "Column",
+    "DEFAULT_INTERN_FIELDS",
+    "InternTable",
+    "Frame",
+    "AsyncItemStream",
+    "EnvelopeParser",
+    "ItemStream",
+    "LazyList",
+    "lazy_model",
+    "PageSizeTuner",
+    "RateLimit",
+    "RateLimiter",
+    "TokenBucket",
+    "Record",
+    "RetryPolicy",
+    "default_retry_policy",
+    "SettlementPriceCache",
+    "capture_body",
+    "SSEDecoder",
+    "ServerSentEvent",
+    "parse_sse_data",
+    "parse_sse_event",
+    "FileTokenStore",
+    "StoredToken",
+    "TokenStore",
+    "token_store_key",
+    "ValidatorRegistry",
+    "ValidatorStats",
+    "request_validators",
+    "response_validators",
 ]
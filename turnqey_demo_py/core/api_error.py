@@ -2,9 +2,9 @@
 Generated by Sideko (sideko.dev)
 """
 
-from json import JSONDecodeError
 import typing
 import httpx
+import pydantic_core
 
 
 class ApiError(Exception):
@@ -39,8 +39,8 @@ class ApiError(Exception):
             making the instantiation more explicit.
         """
         try:
-            self.body = response.json()
-        except JSONDecodeError:
+            self.body = pydantic_core.from_json(response.content)
+        except ValueError:
             self.body = None
         self.status_code = response.status_code
         self.response = response
@@ -1,11 +1,18 @@
 import abc
-import datetime
-from typing import Any, Dict, TypedDict, Optional, List, Tuple, Literal
+import asyncio
+import concurrent.futures
+import threading
+import time
+from typing import Any, Callable, Dict, TypedDict, Optional, List, Tuple, Literal
 
 import jsonpointer  # type: ignore
 import httpx
-from pydantic import BaseModel
+import pydantic_core
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from .rate_limit import RateLimiter
 from .request import RequestConfig
+from .retry import RetryPolicy, send_with_retry, send_with_retry_async
+from .token_store import TokenStore, token_store_key
 
 
 class AuthProvider(abc.ABC, BaseModel):
@@ -28,6 +35,15 @@ class AuthProvider(abc.ABC, BaseModel):
             The modified request configuration with authentication details added
         """
 
+    async def add_to_request_async(self, cfg: RequestConfig) -> RequestConfig:
+        """
+        Asynchronous version of `add_to_request` used by the async client.
+
+        Providers that need network access to authenticate override this so the
+        event loop is never blocked, all others reuse `add_to_request`.
+        """
+        return self.add_to_request(cfg)
+
     @abc.abstractmethod
     def set_value(self, val: Optional[str]) -> None:
         """
@@ -74,7 +90,7 @@ class AuthBearer(AuthProvider):
     the OAuth 2.0 Bearer Token scheme.
     """
 
-    val: Optional[str]
+    val: Optional[str] = Field(repr=False)
 
     def add_to_request(self, cfg: RequestConfig) -> RequestConfig:
         """
@@ -225,29 +241,73 @@ class OAuth2(AuthProvider):
     Implements OAuth2 token retrieval and refreshing.
     Currently supports `password` and `client_credentials`
     grant types.
+
+    Tokens are requested through `httpx_client` (sync) or `async_httpx_client`
+    (async) when given, so token requests share the API client's connection
+    pool, transport and timeouts, and never block the event loop. They are
+    also paced by `rate_limiter`, under `token_path` when given like the API
+    requests, and retried according to `retry_policy`.
+
+    Refreshes are single-flight: when the token expires under concurrent use,
+    one caller fetches a new token while every other thread or task waits for
+    that same result, including its failure.
+
+    With `refresh_ratio` set, the token is renewed in the background once that
+    fraction of its lifetime has passed, so requests keep using the current
+    token instead of waiting on the token request.
+
+    With a `token_store`, tokens are shared with other processes using the same
+    store: a refresh first adopts a newer token another process stored, and
+    only one process at a time requests a new one.
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     # OAuth2 provider configuration
     token_url: str
+    token_path: Optional[str] = None
     access_token_pointer: str
     expires_in_pointer: str
     credentials_location: CredentialsLocation
     body_content: BodyContent
     request_mutator: AuthProvider
+    retry_policy: Optional[RetryPolicy] = None
+    rate_limiter: Optional[RateLimiter] = None
+    token_store: Optional[TokenStore] = None
+    httpx_client: Optional[httpx.Client] = None
+    async_httpx_client: Optional[httpx.AsyncClient] = None
 
     # OAuth2 access token request values
     grant_type: GrantType
     username: Optional[str] = None
-    password: Optional[str] = None
+    password: Optional[str] = Field(default=None, repr=False)
     client_id: Optional[str] = None
-    client_secret: Optional[str] = None
+    client_secret: Optional[str] = Field(default=None, repr=False)
     scope: Optional[List[str]] = None
 
-    # access_token storage
-    access_token: Optional[str] = None
-    expires_at: Optional[datetime.datetime] = None
+    # proactive background renewal, as a fraction of the token lifetime
+    refresh_ratio: Optional[float] = Field(default=None, gt=0, lt=1)
+
+    # access_token storage, expiry and renewal times are `time.monotonic()` readings
+    access_token: Optional[str] = Field(default=None, repr=False)
+    expires_at: Optional[float] = None
+    renew_at: Optional[float] = None
 
-    def _refresh(self) -> Tuple[str, datetime.datetime]:
+    # in-flight token refreshes shared by concurrent callers
+    _flight_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _flight: Optional[concurrent.futures.Future] = PrivateAttr(default=None)
+    _async_flight: Optional[asyncio.Future] = PrivateAttr(default=None)
+
+    # scheduled background renewals
+    _renewal_timer: Optional[threading.Timer] = PrivateAttr(default=None)
+    _renewal_thread: Optional[threading.Thread] = PrivateAttr(default=None)
+    _renewal_handle: Optional[asyncio.TimerHandle] = PrivateAttr(default=None)
+    _renewal_task: Optional[asyncio.Future] = PrivateAttr(default=None)
+
+    def _token_request(self) -> Dict[str, Any]:
+        """
+        Builds the keyword arguments of the access token request.
+        """
         req_cfg: Dict[str, Any] = {"url": self.token_url}
         req_data: Dict[str, Any] = {"grant_type": self.grant_type}
 
@@ -274,12 +334,16 @@ class OAuth2(AuthProvider):
             req_cfg["data"] = req_data
             req_cfg["headers"] = {"content-type": "application/x-www-form-urlencoded"}
 
-        # make access token request
-        token_res = httpx.post(**req_cfg)
+        return req_cfg
+
+    def _parse_token_response(self, token_res: httpx.Response) -> Tuple[str, int]:
+        """
+        Extracts the access token and its lifetime in seconds from the access token response.
+        """
         token_res.raise_for_status()
 
         # retrieve access token & optional expiry seconds
-        token_res_json: Dict[str, Any] = token_res.json()
+        token_res_json: Dict[str, Any] = pydantic_core.from_json(token_res.content)
         access_token = str(
             jsonpointer.resolve_pointer(token_res_json, self.access_token_pointer)
         )
@@ -289,23 +353,308 @@ class OAuth2(AuthProvider):
         )
         if not isinstance(expires_in_secs, int):
             expires_in_secs = 600
-        expires_at = datetime.datetime.now() + datetime.timedelta(
-            seconds=(
-                expires_in_secs - 60
-            )  # subtract a minute from the expiry as a buffer
+
+        return (access_token, expires_in_secs)
+
+    def _token_store_key(self) -> str:
+        return token_store_key(
+            token_url=self.token_url,
+            client_id=self.client_id,
+            scope=self.scope,
+            username=self.username,
+        )
+
+    def _load_stored_token(self, key: str) -> Optional[Tuple[str, int]]:
+        """
+        Returns a usable token another process stored, skipping the token this
+        provider already holds since it is being refreshed.
+        """
+        assert self.token_store is not None
+        stored = self.token_store.load(key)
+        if stored is None or stored["access_token"] == self.access_token:
+            return None
+        expires_in_secs = int(stored["expires_at"] - time.time())
+        if expires_in_secs <= 60:
+            return None
+        return (stored["access_token"], expires_in_secs)
+
+    def _save_stored_token(self, key: str, token: Tuple[str, int]) -> None:
+        assert self.token_store is not None
+        access_token, expires_in_secs = token
+        self.token_store.save(
+            key,
+            {"access_token": access_token, "expires_at": time.time() + expires_in_secs},
         )
 
-        return (access_token, expires_at)
+    def _refresh(self) -> Tuple[str, int]:
+        if self.token_store is None:
+            return self._request_token()
+
+        key = self._token_store_key()
+        with self.token_store.lock(key) as locked:
+            if not locked:
+                # another process holds the lock for too long, go without the store
+                return self._request_token()
+            token = self._load_stored_token(key)
+            if token is None:
+                token = self._request_token()
+                self._save_stored_token(key, token)
+        return token
+
+    async def _refresh_async(self) -> Tuple[str, int]:
+        if self.token_store is None:
+            return await self._request_token_async()
+
+        # the token store does blocking file io, keep it off the event loop
+        loop = asyncio.get_running_loop()
+        key = self._token_store_key()
+        lock = self.token_store.lock(key)
+        acquire = loop.run_in_executor(None, lock.__enter__)
+        try:
+            locked = await asyncio.shield(acquire)
+        except asyncio.CancelledError:
+            acquire.add_done_callback(
+                lambda f: None
+                if f.cancelled() or f.exception() is not None
+                else lock.__exit__(None, None, None)
+            )
+            raise
+
+        try:
+            if not locked:
+                # another process holds the lock for too long, go without the store
+                return await self._request_token_async()
+            token = await loop.run_in_executor(None, self._load_stored_token, key)
+            if token is None:
+                token = await self._request_token_async()
+                await loop.run_in_executor(None, self._save_stored_token, key, token)
+        finally:
+            await loop.run_in_executor(None, lock.__exit__, None, None, None)
+        return token
+
+    def _rate_limit_path(self) -> str:
+        # the base client paces requests by their path relative to the base url
+        return self.token_path or httpx.URL(self.token_url).path
+
+    def _request_token(self) -> Tuple[str, int]:
+        req_cfg = self._token_request()
+
+        post = httpx.post if self.httpx_client is None else self.httpx_client.post
+
+        def send() -> httpx.Response:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self._rate_limit_path())
+            return post(**req_cfg)
+
+        # make access token request, token requests are always safe to repeat
+        if self.retry_policy is not None:
+            token_res = send_with_retry(
+                self.retry_policy, send, method="POST", force=True
+            )
+        else:
+            token_res = send()
+
+        return self._parse_token_response(token_res)
+
+    async def _request_token_async(self) -> Tuple[str, int]:
+        req_cfg = self._token_request()
+
+        if self.async_httpx_client is None:
+            async with httpx.AsyncClient() as client:
+                return await self._send_token_request_async(client, req_cfg)
+        return await self._send_token_request_async(self.async_httpx_client, req_cfg)
+
+    async def _send_token_request_async(
+        self, client: httpx.AsyncClient, req_cfg: Dict[str, Any]
+    ) -> Tuple[str, int]:
+        async def send() -> httpx.Response:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(self._rate_limit_path())
+            return await client.post(**req_cfg)
+
+        # make access token request, token requests are always safe to repeat
+        if self.retry_policy is not None:
+            token_res = await send_with_retry_async(
+                self.retry_policy, send, method="POST", force=True
+            )
+        else:
+            token_res = await send()
+
+        return self._parse_token_response(token_res)
+
+    def _store_token(self, access_token: str, expires_in_secs: int) -> None:
+        now = time.monotonic()
+        # subtract a minute from the expiry as a buffer
+        lifetime = max(0, expires_in_secs - 60)
+        self.access_token = access_token
+        self.expires_at = now + lifetime
+        self.renew_at = (
+            None if self.refresh_ratio is None else now + lifetime * self.refresh_ratio
+        )
 
-    def add_to_request(self, cfg: RequestConfig) -> RequestConfig:
-        token_expired = (
-            self.expires_at is not None and self.expires_at <= datetime.datetime.now()
+    def _needs_refresh(self) -> bool:
+        return self.access_token is None or (
+            self.expires_at is not None and self.expires_at <= time.monotonic()
         )
 
-        if self.access_token is None or token_expired:
-            access_token, expires_at = self._refresh()
-            self.expires_at = expires_at
-            self.access_token = access_token
+    def _renewal_due(self) -> bool:
+        return self.renew_at is not None and self.renew_at <= time.monotonic()
+
+    def _postpone_renewal(self, schedule: Callable[[], None]) -> None:
+        """
+        Pushes back a failed background renewal to halfway before expiry and
+        re-arms it with `schedule`. Once expired, the token is refreshed inline
+        again.
+        """
+        if self.expires_at is not None:
+            now = time.monotonic()
+            self.renew_at = now + max(1.0, (self.expires_at - now) / 2)
+            schedule()
+
+    def _ensure_token(self, *, renew: bool = False) -> None:
+        """
+        Refreshes the access token if needed, sharing a single in-flight refresh
+        between all threads.
+
+        Args:
+            renew: Also refresh a still valid token once its renewal is due
+        """
+
+        def refresh_due() -> bool:
+            return self._needs_refresh() or (renew and self._renewal_due())
+
+        if not refresh_due():
+            return
+
+        with self._flight_lock:
+            if not refresh_due():
+                return
+            flight = self._flight
+            leader = flight is None
+            if flight is None:
+                flight = self._flight = concurrent.futures.Future()
+
+        if not leader:
+            flight.result()
+            return
+
+        try:
+            self._store_token(*self._refresh())
+            flight.set_result(None)
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        finally:
+            with self._flight_lock:
+                self._flight = None
+        self._schedule_renewal()
+
+    async def _ensure_token_async(self, *, renew: bool = False) -> None:
+        """
+        Refreshes the access token if needed, sharing a single in-flight refresh
+        between all tasks.
+
+        Args:
+            renew: Also refresh a still valid token once its renewal is due
+        """
+        while self._needs_refresh() or (renew and self._renewal_due()):
+            flight = self._async_flight
+            if flight is not None:
+                await asyncio.wait({flight})
+                if flight.cancelled():
+                    # the refreshing task was cancelled, take over the refresh
+                    continue
+                flight.result()
+                return
+
+            flight = self._async_flight = asyncio.get_running_loop().create_future()
+            try:
+                self._store_token(*(await self._refresh_async()))
+                flight.set_result(None)
+            except asyncio.CancelledError:
+                flight.cancel()
+                raise
+            except BaseException as e:
+                flight.set_exception(e)
+                # mark retrieved, the error is re-raised to the refreshing task
+                flight.exception()
+                raise
+            finally:
+                self._async_flight = None
+            self._schedule_renewal_async()
+            return
+
+    def _renew_in_background(self) -> None:
+        try:
+            self._ensure_token(renew=True)
+        except Exception:
+            # the current token stays valid, retry renewing later
+            self._postpone_renewal(self._schedule_renewal)
+
+    async def _renew_in_background_async(self) -> None:
+        try:
+            await self._ensure_token_async(renew=True)
+        except Exception:
+            # the current token stays valid, retry renewing later
+            self._postpone_renewal(self._schedule_renewal_async)
+
+    def _schedule_renewal(self) -> None:
+        """
+        Starts a timer thread renewing the token once its renewal is due.
+        """
+        if self.renew_at is None:
+            return
+        if self._renewal_timer is not None:
+            self._renewal_timer.cancel()
+        timer = threading.Timer(
+            max(0.0, self.renew_at - time.monotonic()), self._renew_in_background
+        )
+        timer.daemon = True
+        timer.start()
+        self._renewal_timer = timer
+
+    def _schedule_renewal_async(self) -> None:
+        """
+        Schedules a task on the running event loop renewing the token once its
+        renewal is due.
+        """
+        if self.renew_at is None:
+            return
+        if self._renewal_handle is not None:
+            self._renewal_handle.cancel()
+        self._renewal_handle = asyncio.get_running_loop().call_later(
+            max(0.0, self.renew_at - time.monotonic()), self._start_renewal_task
+        )
+
+    def _start_renewal_task(self) -> None:
+        if self._renewal_task is None or self._renewal_task.done():
+            self._renewal_task = asyncio.ensure_future(
+                self._renew_in_background_async()
+            )
+
+    def _start_renewal_thread(self) -> None:
+        with self._flight_lock:
+            if self._renewal_thread is not None and self._renewal_thread.is_alive():
+                return
+            self._renewal_thread = threading.Thread(
+                target=self._renew_in_background, daemon=True
+            )
+            self._renewal_thread.start()
+
+    def add_to_request(self, cfg: RequestConfig) -> RequestConfig:
+        self._ensure_token()
+        if self._renewal_due() and self._flight is None:
+            # the renewal timer has not caught up yet, renew without waiting on it
+            self._start_renewal_thread()
+
+        self.request_mutator.set_value(self.access_token)
+        return self.request_mutator.add_to_request(cfg)
+
+    async def add_to_request_async(self, cfg: RequestConfig) -> RequestConfig:
+        await self._ensure_token_async()
+        if self._renewal_due() and self._async_flight is None:
+            # the renewal timer has not caught up yet, renew without waiting on it
+            self._start_renewal_task()
 
         self.request_mutator.set_value(self.access_token)
         return self.request_mutator.add_to_request(cfg)
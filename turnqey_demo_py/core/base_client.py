@@ -4,6 +4,7 @@ from typing import (
     TypeVar,
     Dict,
     Optional,
+    Tuple,
     Type,
     Union,
     cast,
@@ -11,12 +12,38 @@ from typing import (
 from typing_extensions import TypeGuard
 
 import httpx
+import pydantic_core
 from pydantic import BaseModel
 
 from .api_error import ApiError
 from .auth import AuthProvider
-from .request import RequestConfig, RequestOptions, default_request_options, QueryParams
-from .response import from_encodable, AsyncStreamResponse, StreamResponse
+from .conditional_cache import CacheEntry, CacheKey, ConditionalCache, cache_key
+from .intern import InternTable
+from .json_stream import AsyncItemStream, ItemStream
+from .lazy_list import lazy_model
+from .page_size import PageSizeTuner
+from .rate_limit import RateLimiter
+from .request import (
+    RequestConfig,
+    RequestOptions,
+    ResponseMode,
+    default_request_options,
+    QueryParams,
+)
+from .response import (
+    construct_encodable,
+    from_encodable,
+    from_json,
+    AsyncStreamResponse,
+    StreamResponse,
+)
+from .settlement_cache import SettlementPriceCache
+from .retry import (
+    RetryPolicy,
+    default_retry_policy,
+    send_with_retry,
+    send_with_retry_async,
+)
 from .utils import get_response_type, filter_binary_response
 from .binary_response import BinaryResponse
 
@@ -27,6 +54,18 @@ T = TypeVar(
 )
 
 
+def _resume_headers(
+    headers: Optional[Dict[str, str]], last_event_id: Optional[str]
+) -> Optional[Dict[str, str]]:
+    """
+    Adds the `Last-Event-ID` header resuming an SSE stream, when an id was
+    received.
+    """
+    if not last_event_id:
+        return headers
+    return {**(headers or {}), "Last-Event-ID": last_event_id}
+
+
 class BaseClient:
     """Base client class providing core HTTP client functionality.
 
@@ -36,20 +75,55 @@ class BaseClient:
     Attributes:
         _base_url: Base URL for the API endpoint
         _auths: Dictionary mapping auth provider IDs to AuthProvider instances
+        retry_policy: Retry policy applied to every request unless overridden
+        rate_limiter: Optional rate limiter pacing every request attempt
+        page_size_tuner: Optional tuner choosing page sizes of paginated endpoints
+        response_mode: How JSON responses are decoded unless overridden per request
+        intern_table: Optional table sharing repeated strings of every response
+        conditional_cache: Optional cache revalidating responses of polled endpoints
+        settlement_cache: Optional on-disk cache of historical settlement prices
     """
 
     def __init__(
         self,
         *,
         base_url: str,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        page_size_tuner: Optional[PageSizeTuner] = None,
+        response_mode: ResponseMode = "model",
+        intern_table: Optional[InternTable] = None,
+        conditional_cache: Optional[ConditionalCache] = None,
+        settlement_cache: Optional[SettlementPriceCache] = None,
     ):
         """Initialize the base client.
 
         Args:
             base_url: Base URL for the API endpoint
+            retry_policy: Retry policy for requests, defaults to sending every
+                request once
+            rate_limiter: Optional rate limiter pacing requests
+            page_size_tuner: Optional tuner choosing page sizes of paginated endpoints
+            response_mode: How JSON responses are decoded, one of "model" (typed
+                models), "lazy" (typed models validating list items on access),
+                "raw" (plain dicts/lists), "construct" (unvalidated models) or
+                "record" (unvalidated, with slotted records for hot models)
+            intern_table: Optional table sharing the strings of repeated values
+                of low-cardinality fields across responses
+            conditional_cache: Optional cache of the responses of opted-in `GET`
+                endpoints, revalidated with `ETag` / `Last-Modified`
+            settlement_cache: Optional on-disk cache of the settlement prices of
+                past dates, consulted before requesting them
         """
         self._base_url = base_url
         self._auths: Dict[str, AuthProvider] = {}
+        self.retry_policy = retry_policy or default_retry_policy()
+        self.rate_limiter = rate_limiter
+        self.page_size_tuner = page_size_tuner
+        self.response_mode = response_mode
+        self.intern_table = intern_table
+        self.conditional_cache = conditional_cache
+        self.settlement_cache = settlement_cache
 
     def register_auth(self, auth_id: str, provider: AuthProvider):
         """Register an authentication provider.
@@ -96,6 +170,99 @@ class BaseClient:
 
         return f"{base}/{path}"
 
+    def get_retry_policy(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> RetryPolicy:
+        """Get the retry policy for a request.
+
+        Args:
+            request_options: Request options that may override the client's policy
+
+        Returns:
+            Retry policy to apply
+        """
+        opts = request_options or default_request_options()
+        return opts.get("retry_policy", None) or self.retry_policy
+
+    def get_response_mode(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> ResponseMode:
+        """Get the response mode for a request.
+
+        Args:
+            request_options: Request options that may override the client's mode
+
+        Returns:
+            Response mode to decode the response with
+        """
+        opts = request_options or default_request_options()
+        return opts.get("response_mode", None) or self.response_mode
+
+    def get_intern_table(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> Optional[InternTable]:
+        """Get the intern table for a request.
+
+        Args:
+            request_options: Request options that may override the client's table
+
+        Returns:
+            Intern table to apply to the response, if any
+        """
+        opts = request_options or default_request_options()
+        # an empty table is falsy, so it is checked against None
+        intern_table = opts.get("intern_table", None)
+        return self.intern_table if intern_table is None else intern_table
+
+    def _lookup_cache(
+        self,
+        *,
+        method: str,
+        path: str,
+        cast_to: Union[Type[T], Any],
+        auth_names: Optional[List[str]],
+        req_cfg: RequestConfig,
+        request_options: Optional[RequestOptions],
+    ) -> Tuple[Optional[CacheKey], Optional[CacheEntry]]:
+        """Look up the cached response of a request to an opted-in endpoint.
+
+        When an entry is found, its validators are added to the request headers
+        the caller did not set. The entry is not returned when the caller set
+        validators of their own.
+
+        Returns:
+            The cache key of the request, None when it is not cached, and the
+            entry cached under it, if any
+        """
+        cache = self.conditional_cache
+        if (
+            cache is None
+            or not cache.matches(method, path)
+            or cast_to in (httpx.Response, BinaryResponse)
+        ):
+            return None, None
+
+        key = cache_key(
+            url=req_cfg["url"],
+            params=req_cfg.get("params"),
+            providers=[self._auths[n] for n in auth_names or [] if n in self._auths],
+            response_mode=self.get_response_mode(request_options),
+        )
+        entry = cache.get(key)
+        if entry is not None:
+            headers = req_cfg.get("headers", {})
+            given = {name.lower(): value for name, value in headers.items()}
+            validators = entry.conditional_headers()
+            req_cfg["headers"] = {
+                **headers,
+                **{n: v for n, v in validators.items() if n.lower() not in given},
+            }
+            # a 304 answering validators of the caller's own does not vouch
+            # for the cached result
+            if any(given.get(n.lower(), v) != v for n, v in validators.items()):
+                entry = None
+        return key, entry
+
     def _cast_to_raw_response(
         self, res: httpx.Response, cast_to: Union[Type[T], Any]
     ) -> TypeGuard[T]:
@@ -282,11 +449,41 @@ class BaseClient:
         Returns:
             Complete request configuration
         """
-        opts = request_options or default_request_options()
         req_cfg: RequestConfig = {"method": method, "url": self.build_url(path)}
         req_cfg = self._apply_auth(cfg=req_cfg, auth_names=auth_names or [])
+        return self._apply_request_parts(
+            cfg=req_cfg,
+            query_params=query_params,
+            headers=headers,
+            data=data,
+            files=files,
+            json=json,
+            content_type=content_type,
+            content=content,
+            request_options=request_options,
+        )
+
+    def _apply_request_parts(
+        self,
+        *,
+        cfg: RequestConfig,
+        query_params: Optional[QueryParams] = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[httpx._types.RequestData] = None,
+        files: Optional[httpx._types.RequestFiles] = None,
+        json: Optional[Any] = None,
+        content_type: Optional[str] = None,
+        content: Optional[httpx._types.RequestContent] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> RequestConfig:
+        """Apply everything but authentication to an authenticated request configuration.
+
+        Returns:
+            Complete request configuration
+        """
+        opts = request_options or default_request_options()
         req_cfg = self._apply_headers(
-            cfg=req_cfg, opts=opts, content_type=content_type, explicit_headers=headers
+            cfg=cfg, opts=opts, content_type=content_type, explicit_headers=headers
         )
         req_cfg = self._apply_query_params(
             cfg=req_cfg, opts=opts, query_params=query_params
@@ -303,12 +500,21 @@ class BaseClient:
         *,
         response=httpx.Response,
         cast_to: Union[Type[T], Any],
+        response_mode: ResponseMode = "model",
+        intern_table: Optional[InternTable] = None,
     ) -> T:
         """Process an HTTP response and convert it to the desired type.
 
         Args:
             response: HTTP response to process
             cast_to: Type to cast the response data to
+            response_mode: Whether JSON responses are validated into `cast_to`
+                ("model"), validated with lazily validated list items ("lazy"),
+                returned as decoded ("raw") or built into `cast_to` without
+                validation ("construct"), with records for models having a
+                record type ("record")
+            intern_table: Optional table interning the strings of repeated
+                values, which decodes the body before validating it
 
         Returns:
             Processed response data of the specified type
@@ -328,11 +534,24 @@ class BaseClient:
         response_type = get_response_type(response.headers)
 
         if response_type == "json":
-            if cast_to is type(Any):
-                return response.json()
-            return from_encodable(
-                data=response.json(), load_with=filter_binary_response(cast_to=cast_to)
-            )
+            raw = cast_to is type(Any) or response_mode == "raw"
+            load_with = filter_binary_response(cast_to=cast_to)
+            if response_mode == "lazy":
+                load_with = lazy_model(load_with)
+            if response_mode in ("model", "lazy") and intern_table is None and not raw:
+                return from_json(data=response.content, load_with=load_with)
+            data = pydantic_core.from_json(response.content)
+            if intern_table is not None:
+                data = intern_table.intern_fields(data)
+            if raw:
+                return data
+            if response_mode in ("construct", "record"):
+                return construct_encodable(
+                    data=data,
+                    load_with=filter_binary_response(cast_to=cast_to),
+                    records=response_mode == "record",
+                )
+            return from_encodable(data=data, load_with=load_with)
         elif response_type == "text":
             return cast(T, response.text)
         else:
@@ -341,6 +560,35 @@ class BaseClient:
                 BinaryResponse(content=response.content, headers=response.headers),
             )
 
+    def process_content(
+        self,
+        *,
+        content: bytes,
+        cast_to: Union[Type[T], Any],
+        request_options: Optional[RequestOptions] = None,
+    ) -> T:
+        """Decode a JSON body obtained without a request, e.g. from a cache.
+
+        The body is decoded like the response to a request with the given
+        options would be.
+
+        Args:
+            content: JSON body of an earlier response
+            cast_to: Type to cast the response data to
+            request_options: Request options that may override the response mode
+
+        Returns:
+            Processed response data of the specified type
+        """
+        return self.process_response(
+            response=httpx.Response(
+                200, content=content, headers={"content-type": "application/json"}
+            ),
+            cast_to=cast_to,
+            response_mode=self.get_response_mode(request_options),
+            intern_table=self.get_intern_table(request_options),
+        )
+
 
 class SyncBaseClient(BaseClient):
     """Synchronous HTTP client implementation.
@@ -353,16 +601,49 @@ class SyncBaseClient(BaseClient):
         *,
         base_url: str,
         httpx_client: httpx.Client,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        page_size_tuner: Optional[PageSizeTuner] = None,
+        response_mode: ResponseMode = "model",
+        intern_table: Optional[InternTable] = None,
+        conditional_cache: Optional[ConditionalCache] = None,
+        settlement_cache: Optional[SettlementPriceCache] = None,
     ):
         """Initialize the synchronous client.
 
         Args:
             base_url: Base URL for the API endpoint
             httpx_client: Synchronous HTTPX client instance
+            retry_policy: Retry policy for requests, defaults to sending every
+                request once
+            rate_limiter: Optional rate limiter pacing requests
+            page_size_tuner: Optional tuner choosing page sizes of paginated endpoints
+            response_mode: How JSON responses are decoded unless overridden per request
+            intern_table: Optional table sharing repeated strings of every response
+            conditional_cache: Optional cache revalidating responses of polled endpoints
+            settlement_cache: Optional on-disk cache of historical settlement prices
         """
-        super().__init__(base_url=base_url)
+        super().__init__(
+            base_url=base_url,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            page_size_tuner=page_size_tuner,
+            response_mode=response_mode,
+            intern_table=intern_table,
+            conditional_cache=conditional_cache,
+            settlement_cache=settlement_cache,
+        )
         self.httpx_client = httpx_client
 
+    def _throttle(self, path: str) -> None:
+        """Block until the rate limiter allows a request to the path.
+
+        Args:
+            path: API endpoint path
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(path)
+
     def request(
         self,
         *,
@@ -414,15 +695,47 @@ class SyncBaseClient(BaseClient):
             content=content,
             request_options=request_options,
         )
-        response = self.httpx_client.request(**req_cfg)
+        key, entry = self._lookup_cache(
+            method=method,
+            path=path,
+            cast_to=cast_to,
+            auth_names=auth_names,
+            req_cfg=req_cfg,
+            request_options=request_options,
+        )
+
+        def send() -> httpx.Response:
+            self._throttle(path)
+            return self.httpx_client.request(**req_cfg)
+
+        response = send_with_retry(
+            self.get_retry_policy(request_options), send, method=method
+        )
+
+        cache = self.conditional_cache
+        if cache is not None and entry is not None and response.status_code == 304:
+            if request_options and "on_response" in request_options:
+                request_options["on_response"](entry.revalidated(response))
+            return cast(T, cache.hit(entry))
 
         if not response.is_success:
             raise ApiError(response=response)
 
+        if request_options and "on_response" in request_options:
+            request_options["on_response"](response)
+
         if self._cast_to_raw_response(res=response, cast_to=cast_to):
             return response
 
-        return self.process_response(response=response, cast_to=cast_to)
+        result: T = self.process_response(
+            response=response,
+            cast_to=cast_to,
+            response_mode=self.get_response_mode(request_options),
+            intern_table=self.get_intern_table(request_options),
+        )
+        if cache is not None and key is not None:
+            cache.store(key, response, result)
+        return result
 
     def stream_request(
         self,
@@ -459,6 +772,80 @@ class SyncBaseClient(BaseClient):
         Returns:
             StreamResponse containing the streaming response
 
+        Raises:
+            ApiError: If the request fails
+        """
+
+        def open_stream(
+            stream_headers: Optional[Dict[str, str]],
+        ) -> Tuple[httpx.Response, Any]:
+            req_cfg = self.build_request(
+                method=method,
+                path=path,
+                auth_names=auth_names,
+                query_params=query_params,
+                headers=stream_headers,
+                data=data,
+                files=files,
+                json=json,
+                content_type=content_type,
+                content=content,
+                request_options=request_options,
+            )
+            return self._open_stream(
+                method=method,
+                path=path,
+                req_cfg=req_cfg,
+                request_options=request_options,
+            )
+
+        def reconnect(last_event_id: Optional[str]) -> Tuple[httpx.Response, Any]:
+            response, context = open_stream(_resume_headers(headers, last_event_id))
+            if not response.is_success:
+                try:
+                    response.read()
+                finally:
+                    context.__exit__(None, None, None)
+                raise ApiError(response=response)
+            return response, context
+
+        policy = self.get_retry_policy(request_options)
+        response, context = open_stream(headers)
+        return StreamResponse(
+            response,
+            context,
+            cast_to,
+            reconnect=reconnect if policy.is_retryable_method(method) else None,
+            retry_policy=policy,
+        )
+
+    def stream_items(
+        self,
+        *,
+        method: str,
+        path: str,
+        cast_to: Type[T],
+        auth_names: Optional[List[str]] = None,
+        query_params: Optional[QueryParams] = None,
+        headers: Optional[Dict[str, str]] = None,
+        request_options: Optional[RequestOptions] = None,
+        field: str = "data",
+    ) -> ItemStream[T]:
+        """Make a synchronous HTTP request streaming the items of a JSON envelope.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            cast_to: Type to cast every item to
+            auth_names: List of auth provider IDs
+            query_params: Query parameters
+            headers: Request headers
+            request_options: Additional request options
+            field: Name of the top-level array field holding the items
+
+        Returns:
+            ItemStream yielding the items as their bytes arrive
+
         Raises:
             ApiError: If the request fails
         """
@@ -468,16 +855,50 @@ class SyncBaseClient(BaseClient):
             auth_names=auth_names,
             query_params=query_params,
             headers=headers,
-            data=data,
-            files=files,
-            json=json,
-            content_type=content_type,
-            content=content,
             request_options=request_options,
         )
-        context = self.httpx_client.stream(**req_cfg)
-        response = context.__enter__()
-        return StreamResponse(response, context, cast_to)
+        response, context = self._open_stream(
+            method=method, path=path, req_cfg=req_cfg, request_options=request_options
+        )
+        if not response.is_success:
+            try:
+                response.read()
+            finally:
+                context.__exit__(None, None, None)
+            raise ApiError(response=response)
+        return ItemStream(response, context, cast_to, field)
+
+    def _open_stream(
+        self,
+        *,
+        method: str,
+        path: str,
+        req_cfg: RequestConfig,
+        request_options: Optional[RequestOptions],
+    ) -> Tuple[httpx.Response, Any]:
+        """Send a streaming request, retrying it according to the retry policy.
+
+        Returns:
+            The response and the context manager of its stream
+        """
+        context: Optional[Any] = None
+
+        def send() -> httpx.Response:
+            nonlocal context
+            if context is not None:
+                # release the stream of the previous, retried attempt
+                context.__exit__(None, None, None)
+                context = None
+            self._throttle(path)
+            stream_context = self.httpx_client.stream(**req_cfg)
+            response = stream_context.__enter__()
+            context = stream_context
+            return response
+
+        response = send_with_retry(
+            self.get_retry_policy(request_options), send, method=method
+        )
+        return response, context
 
 
 class AsyncBaseClient(BaseClient):
@@ -491,16 +912,115 @@ class AsyncBaseClient(BaseClient):
         *,
         base_url: str,
         httpx_client: httpx.AsyncClient,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        page_size_tuner: Optional[PageSizeTuner] = None,
+        response_mode: ResponseMode = "model",
+        intern_table: Optional[InternTable] = None,
+        conditional_cache: Optional[ConditionalCache] = None,
+        settlement_cache: Optional[SettlementPriceCache] = None,
     ):
         """Initialize the asynchronous client.
 
         Args:
             base_url: Base URL for the API endpoint
             httpx_client: Asynchronous HTTPX client instance
+            retry_policy: Retry policy for requests, defaults to sending every
+                request once
+            rate_limiter: Optional rate limiter pacing requests
+            page_size_tuner: Optional tuner choosing page sizes of paginated endpoints
+            response_mode: How JSON responses are decoded unless overridden per request
+            intern_table: Optional table sharing repeated strings of every response
+            conditional_cache: Optional cache revalidating responses of polled endpoints
+            settlement_cache: Optional on-disk cache of historical settlement prices
         """
-        super().__init__(base_url=base_url)
+        super().__init__(
+            base_url=base_url,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            page_size_tuner=page_size_tuner,
+            response_mode=response_mode,
+            intern_table=intern_table,
+            conditional_cache=conditional_cache,
+            settlement_cache=settlement_cache,
+        )
         self.httpx_client = httpx_client
 
+    async def _apply_auth_async(
+        self, *, cfg: RequestConfig, auth_names: List[str]
+    ) -> RequestConfig:
+        """Apply authentication to the request configuration without blocking the event loop.
+
+        Args:
+            cfg: Request configuration to modify
+            auth_names: List of auth provider IDs to apply
+
+        Returns:
+            Modified request configuration
+        """
+        for auth_name in auth_names:
+            auth_provider = self._auths.get(auth_name)
+            if auth_provider is not None:
+                cfg = await auth_provider.add_to_request_async(cfg)
+
+        return cfg
+
+    async def build_request_async(
+        self,
+        *,
+        method: str,
+        path: str,
+        auth_names: Optional[List[str]] = None,
+        query_params: Optional[QueryParams] = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[httpx._types.RequestData] = None,
+        files: Optional[httpx._types.RequestFiles] = None,
+        json: Optional[Any] = None,
+        content_type: Optional[str] = None,
+        content: Optional[httpx._types.RequestContent] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> RequestConfig:
+        """Build a complete request configuration, awaiting asynchronous auth providers.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            auth_names: List of auth provider IDs
+            query_params: Query parameters
+            headers: Request headers
+            data: Form data
+            files: Files to upload
+            json: JSON data
+            content_type: Content type header
+            content: Raw content
+            request_options: Additional request options
+
+        Returns:
+            Complete request configuration
+        """
+        req_cfg: RequestConfig = {"method": method, "url": self.build_url(path)}
+        req_cfg = await self._apply_auth_async(cfg=req_cfg, auth_names=auth_names or [])
+        return self._apply_request_parts(
+            cfg=req_cfg,
+            query_params=query_params,
+            headers=headers,
+            data=data,
+            files=files,
+            json=json,
+            content_type=content_type,
+            content=content,
+            request_options=request_options,
+        )
+
+    async def _throttle(self, path: str) -> None:
+        """Wait until the rate limiter allows a request to the path.
+
+        Args:
+            path: API endpoint path
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(path)
+
     async def request(
         self,
         *,
@@ -539,7 +1059,7 @@ class AsyncBaseClient(BaseClient):
         Raises:
             ApiError: If the request fails
         """
-        req_cfg = self.build_request(
+        req_cfg = await self.build_request_async(
             method=method,
             path=path,
             auth_names=auth_names,
@@ -552,15 +1072,47 @@ class AsyncBaseClient(BaseClient):
             content=content,
             request_options=request_options,
         )
-        response = await self.httpx_client.request(**req_cfg)
+        key, entry = self._lookup_cache(
+            method=method,
+            path=path,
+            cast_to=cast_to,
+            auth_names=auth_names,
+            req_cfg=req_cfg,
+            request_options=request_options,
+        )
+
+        async def send() -> httpx.Response:
+            await self._throttle(path)
+            return await self.httpx_client.request(**req_cfg)
+
+        response = await send_with_retry_async(
+            self.get_retry_policy(request_options), send, method=method
+        )
+
+        cache = self.conditional_cache
+        if cache is not None and entry is not None and response.status_code == 304:
+            if request_options and "on_response" in request_options:
+                request_options["on_response"](entry.revalidated(response))
+            return cast(T, cache.hit(entry))
 
         if not response.is_success:
             raise ApiError(response=response)
 
+        if request_options and "on_response" in request_options:
+            request_options["on_response"](response)
+
         if self._cast_to_raw_response(res=response, cast_to=cast_to):
             return response
 
-        return self.process_response(response=response, cast_to=cast_to)
+        result: T = self.process_response(
+            response=response,
+            cast_to=cast_to,
+            response_mode=self.get_response_mode(request_options),
+            intern_table=self.get_intern_table(request_options),
+        )
+        if cache is not None and key is not None:
+            cache.store(key, response, result)
+        return result
 
     async def stream_request(
         self,
@@ -600,19 +1152,131 @@ class AsyncBaseClient(BaseClient):
         Raises:
             ApiError: If the request fails
         """
-        req_cfg = self.build_request(
+
+        async def open_stream(
+            stream_headers: Optional[Dict[str, str]],
+        ) -> Tuple[httpx.Response, Any]:
+            req_cfg = await self.build_request_async(
+                method=method,
+                path=path,
+                auth_names=auth_names,
+                query_params=query_params,
+                headers=stream_headers,
+                data=data,
+                files=files,
+                json=json,
+                content_type=content_type,
+                content=content,
+                request_options=request_options,
+            )
+            return await self._open_stream(
+                method=method,
+                path=path,
+                req_cfg=req_cfg,
+                request_options=request_options,
+            )
+
+        async def reconnect(
+            last_event_id: Optional[str],
+        ) -> Tuple[httpx.Response, Any]:
+            response, context = await open_stream(
+                _resume_headers(headers, last_event_id)
+            )
+            if not response.is_success:
+                try:
+                    await response.aread()
+                finally:
+                    await context.__aexit__(None, None, None)
+                raise ApiError(response=response)
+            return response, context
+
+        policy = self.get_retry_policy(request_options)
+        response, context = await open_stream(headers)
+        return AsyncStreamResponse(
+            response,
+            context,
+            cast_to,
+            reconnect=reconnect if policy.is_retryable_method(method) else None,
+            retry_policy=policy,
+        )
+
+    async def stream_items(
+        self,
+        *,
+        method: str,
+        path: str,
+        cast_to: Type[T],
+        auth_names: Optional[List[str]] = None,
+        query_params: Optional[QueryParams] = None,
+        headers: Optional[Dict[str, str]] = None,
+        request_options: Optional[RequestOptions] = None,
+        field: str = "data",
+    ) -> AsyncItemStream[T]:
+        """Make an asynchronous HTTP request streaming the items of a JSON envelope.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            cast_to: Type to cast every item to
+            auth_names: List of auth provider IDs
+            query_params: Query parameters
+            headers: Request headers
+            request_options: Additional request options
+            field: Name of the top-level array field holding the items
+
+        Returns:
+            AsyncItemStream yielding the items as their bytes arrive
+
+        Raises:
+            ApiError: If the request fails
+        """
+        req_cfg = await self.build_request_async(
             method=method,
             path=path,
             auth_names=auth_names,
             query_params=query_params,
             headers=headers,
-            data=data,
-            files=files,
-            json=json,
-            content_type=content_type,
-            content=content,
             request_options=request_options,
         )
-        context = self.httpx_client.stream(**req_cfg)
-        response = await context.__aenter__()
-        return AsyncStreamResponse(response, context, cast_to)
+        response, context = await self._open_stream(
+            method=method, path=path, req_cfg=req_cfg, request_options=request_options
+        )
+        if not response.is_success:
+            try:
+                await response.aread()
+            finally:
+                await context.__aexit__(None, None, None)
+            raise ApiError(response=response)
+        return AsyncItemStream(response, context, cast_to, field)
+
+    async def _open_stream(
+        self,
+        *,
+        method: str,
+        path: str,
+        req_cfg: RequestConfig,
+        request_options: Optional[RequestOptions],
+    ) -> Tuple[httpx.Response, Any]:
+        """Send a streaming request, retrying it according to the retry policy.
+
+        Returns:
+            The response and the async context manager of its stream
+        """
+        context: Optional[Any] = None
+
+        async def send() -> httpx.Response:
+            nonlocal context
+            if context is not None:
+                # release the stream of the previous, retried attempt
+                await context.__aexit__(None, None, None)
+                context = None
+            await self._throttle(path)
+            stream_context = self.httpx_client.stream(**req_cfg)
+            response = await stream_context.__aenter__()
+            context = stream_context
+            return response
+
+        response = await send_with_retry_async(
+            self.get_retry_policy(request_options), send, method=method
+        )
+        return response, context
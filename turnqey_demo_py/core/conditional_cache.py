@@ -0,0 +1,242 @@
+import collections
+import copy
+import hashlib
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple, Union
+
+import httpx
+from typing_extensions import TypedDict
+
+from .auth import AuthProvider, OAuth2
+from .path_template import compile_path_template
+from .token_store import token_store_key
+
+"""
+Conditional request caching with HTTP validators.
+
+Endpoints polled over and over mostly return what they returned last time. The
+cache in this module keeps the `ETag` and `Last-Modified` validators of their
+responses along with the decoded result, sends them back as `If-None-Match` and
+`If-Modified-Since`, and serves the decoded result again when the API answers
+`304 Not Modified`, skipping both the body transfer and its validation.
+"""
+
+# headers describing the transfer of a body rather than the body itself
+_TRANSFER_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+# (url with query, auth identity, response mode)
+CacheKey = Tuple[str, str, str]
+
+
+class ConditionalCacheStats(TypedDict):
+    """
+    Snapshot of a conditional cache's usage.
+
+    Attributes:
+        hits: Number of requests answered with `304` and served from the cache
+        misses: Number of requests to cached endpoints answered with a body
+        evictions: Number of entries dropped to stay within `max_entries`
+        size: Number of entries currently cached
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class CacheEntry:
+    """
+    Validators, body and decoded result of a cached response.
+    """
+
+    __slots__ = ("etag", "last_modified", "value", "content", "headers")
+
+    def __init__(
+        self,
+        *,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        value: Any,
+        content: bytes = b"",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.etag = etag
+        self.last_modified = last_modified
+        self.value = value
+        self.content = content
+        self.headers = headers or {}
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Returns the headers asking the API to answer `304` when unchanged.
+        """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def revalidated(self, not_modified: httpx.Response) -> httpx.Response:
+        """
+        Returns the cached response confirmed by a `304` answer, for callbacks
+        expecting the response a body was decoded from.
+        """
+        return httpx.Response(
+            200,
+            headers=self.headers,
+            content=self.content,
+            request=not_modified.request,
+        )
+
+
+class ConditionalCache:
+    """
+    Thread-safe, bounded LRU cache of `GET` responses revalidated with
+    `If-None-Match` / `If-Modified-Since`.
+
+    Only endpoints matching one of `paths` are cached, given as path templates
+    like `/clients/{clientId}/wallets`. Entries are keyed by URL and query, the
+    identity of the credentials the request was authenticated with, and the
+    response mode, so different API clients never share a cached result.
+    Responses without an `ETag` or `Last-Modified` header are not cached.
+
+    Every request served from the cache gets a deep copy of the cached result,
+    so callers may modify what they get without affecting later requests.
+    """
+
+    def __init__(self, *, paths: Iterable[str], max_entries: int = 256) -> None:
+        """
+        Args:
+            paths: Templates of the endpoint paths whose responses are cached
+            max_entries: Maximum number of responses cached, the least
+                recently used one is dropped beyond it
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._paths: List[Pattern[str]] = [compile_path_template(p) for p in paths]
+        self._entries: "collections.OrderedDict[CacheKey, CacheEntry]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def matches(self, method: str, path: str) -> bool:
+        """
+        Checks whether requests with the given method to `path` are cached.
+        """
+        return method.upper() == "GET" and any(p.match(path) for p in self._paths)
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        """
+        Returns the entry cached under `key`, marking it as recently used.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def hit(self, entry: CacheEntry) -> Any:
+        """
+        Records a `304` answer and returns a copy of the cached result of `entry`.
+        """
+        with self._lock:
+            self._hits += 1
+        return copy.deepcopy(entry.value)
+
+    def store(self, key: CacheKey, response: httpx.Response, value: Any) -> None:
+        """
+        Records a response with a body, caching a copy of `value` along with
+        the body when it has validators.
+        """
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        entry = None
+        if etag is not None or last_modified is not None:
+            entry = CacheEntry(
+                etag=etag,
+                last_modified=last_modified,
+                value=copy.deepcopy(value),
+                content=response.content,
+                headers={
+                    name: header
+                    for name, header in response.headers.items()
+                    if name.lower() not in _TRANSFER_HEADERS
+                },
+            )
+        with self._lock:
+            self._misses += 1
+            if entry is None:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> ConditionalCacheStats:
+        """
+        Returns the hit/miss counters and current size of the cache.
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._entries),
+        }
+
+    def clear(self) -> None:
+        """
+        Drops every entry and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+def cache_key(
+    *,
+    url: Union[httpx.URL, str],
+    params: Optional[Any],
+    providers: Iterable[AuthProvider],
+    response_mode: str,
+) -> CacheKey:
+    """
+    Derives the cache key of a request from its URL, query parameters, auth
+    providers and response mode.
+    """
+    full_url = str(httpx.URL(url, params=params) if params else url)
+    return (full_url, auth_identity(providers), response_mode)
+
+
+def auth_identity(providers: Iterable[AuthProvider]) -> str:
+    """
+    Derives a hash identifying the credentials of the given auth providers.
+
+    OAuth2 identities are keyed like the token store, so they survive token
+    renewals. Other providers are keyed by their configuration. Secrets are
+    only ever part of the hashed input.
+    """
+    identities = []
+    for provider in providers:
+        if isinstance(provider, OAuth2):
+            identities.append(
+                token_store_key(
+                    token_url=provider.token_url,
+                    client_id=provider.client_id,
+                    scope=provider.scope,
+                    username=provider.username,
+                )
+            )
+        else:
+            identities.append(f"{type(provider).__name__}:{provider.model_dump_json()}")
+    return hashlib.sha256("\0".join(identities).encode()).hexdigest()
@@ -0,0 +1,324 @@
+import datetime
+import warnings
+from typing import (
+    Any,
+    AsyncIterable,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import pydantic
+from typing_extensions import Literal, get_args, get_origin
+
+from .pagination import page_items
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+"""
+Columnar decoding of paginated responses into NumPy arrays.
+
+Building one model per item dominates the cost of reading large result sets.
+Frames decode the items of every page into one contiguous array per field
+instead, which analytics code can operate on directly. NumPy is an optional
+dependency, installed with the `frames` extra.
+"""
+
+# column kinds, see `Column`
+FLOAT = "float"
+TIMESTAMP = "timestamp"
+CATEGORY = "category"
+SYMBOL = "symbol"
+TEXT = "text"
+
+FrameT = TypeVar("FrameT", bound="Frame")
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def require_numpy() -> Any:
+    """
+    Returns the numpy module, raising an `ImportError` explaining how to
+    install it when missing.
+    """
+    if np is None:
+        raise ImportError(
+            "columnar frames require numpy, install it with "
+            "`pip install turnqey_demo_py[frames]`"
+        )
+    return np
+
+
+class Column:
+    """
+    A single column of a frame.
+
+    `values` holds one entry per row and `mask` is true for rows where the
+    field is null. Depending on `kind`, `values` is
+    - "float": float64 values, NaN where null
+    - "timestamp": int64 microseconds since the Unix epoch (UTC), 0 where null
+    - "category": int8 codes into the fixed `categories`, -1 where null
+    - "symbol": int32 codes into the `categories` seen so far, -1 where null
+    - "text": Python strings in an object array, None where null
+    """
+
+    __slots__ = ("kind", "values", "mask", "categories")
+
+    def __init__(
+        self,
+        kind: str,
+        values: Any,
+        mask: Any,
+        categories: Tuple[str, ...] = (),
+    ) -> None:
+        self.kind = kind
+        self.values = values
+        self.mask = mask
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"Column(kind={self.kind!r}, values={self.values!r})"
+
+    def to_list(self) -> List[Any]:
+        """
+        Decodes the column back into Python values, None where null.
+
+        Timestamps are returned as timezone-aware datetimes.
+        """
+        if self.kind in (CATEGORY, SYMBOL):
+            return [
+                None if code < 0 else self.categories[code] for code in self.values
+            ]
+        if self.kind == TIMESTAMP:
+            return [
+                None if null else _EPOCH + int(micros) * _MICROSECOND
+                for micros, null in zip(self.values, self.mask)
+            ]
+        return [
+            None if null else value for value, null in zip(self.values, self.mask)
+        ]
+
+
+def _optional_inner(annotation: Any) -> Any:
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    return args[0] if len(args) == 1 else annotation
+
+
+def _encode_floats(values: List[Any]) -> Column:
+    numpy = require_numpy()
+    mask = numpy.fromiter((v is None for v in values), dtype=bool, count=len(values))
+    floats = numpy.array(
+        [float("nan") if v is None else v for v in values], dtype=numpy.float64
+    )
+    return Column(FLOAT, floats, mask)
+
+
+def _epoch_micros(value: str) -> int:
+    parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return (parsed - _EPOCH) // _MICROSECOND
+
+
+def _encode_timestamps(values: List[Any]) -> Column:
+    numpy = require_numpy()
+    mask = numpy.fromiter((v is None for v in values), dtype=bool, count=len(values))
+    # numpy parses ISO 8601 in bulk, converting UTC offsets with a warning
+    strings = ["1970-01-01" if v is None else v.rstrip("Z") for v in values]
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            micros = numpy.array(strings, dtype="datetime64[us]").astype(numpy.int64)
+    except ValueError:
+        micros = numpy.array(
+            [0 if v is None else _epoch_micros(v) for v in values], dtype=numpy.int64
+        )
+    return Column(TIMESTAMP, micros, mask)
+
+
+def _encode_category(
+    name: str, values: List[Any], categories: Tuple[str, ...]
+) -> Column:
+    numpy = require_numpy()
+    lookup = {category: code for code, category in enumerate(categories)}
+    lookup[None] = -1  # type: ignore[index]
+    try:
+        codes = numpy.fromiter(
+            (lookup[v] for v in values), dtype=numpy.int8, count=len(values)
+        )
+    except KeyError as e:
+        raise ValueError(f"unexpected value {e.args[0]!r} for {name}") from None
+    return Column(CATEGORY, codes, codes < 0, categories)
+
+
+def _encode_symbols(values: List[Any]) -> Column:
+    numpy = require_numpy()
+    lookup: Dict[Any, int] = {None: -1}
+    codes = numpy.fromiter(
+        (lookup.setdefault(v, len(lookup) - 1) for v in values),
+        dtype=numpy.int32,
+        count=len(values),
+    )
+    del lookup[None]
+    return Column(SYMBOL, codes, codes < 0, tuple(lookup))
+
+
+def _encode_text(values: List[Any]) -> Column:
+    numpy = require_numpy()
+    mask = numpy.fromiter((v is None for v in values), dtype=bool, count=len(values))
+    strings = numpy.empty(len(values), dtype=object)
+    strings[:] = values
+    return Column(TEXT, strings, mask)
+
+
+def _concat_columns(columns: Sequence[Column]) -> Column:
+    numpy = require_numpy()
+    kind = columns[0].kind
+    mask = numpy.concatenate([column.mask for column in columns])
+    if kind != SYMBOL:
+        values = numpy.concatenate([column.values for column in columns])
+        return Column(kind, values, mask, columns[0].categories)
+
+    # merge the symbol dictionaries and remap the codes of every column
+    merged: Dict[str, int] = {}
+    parts = []
+    for column in columns:
+        codes = [merged.setdefault(s, len(merged)) for s in column.categories]
+        # the trailing -1 is picked by code -1, keeping nulls null
+        remap = numpy.array(codes + [-1], dtype=numpy.int32)
+        parts.append(remap[column.values])
+    return Column(SYMBOL, numpy.concatenate(parts), mask, tuple(merged))
+
+
+class Frame:
+    """
+    Columnar representation of a list of response items.
+
+    Subclasses set `model` to the item model and list the fields holding asset
+    symbols in `symbol_fields`, which are dictionary-encoded. The remaining
+    fields are stored by their type: floats as float64, `timestamp_fields` as
+    int64 epoch microseconds, literals as small integer codes and other
+    strings as Python objects. Columns are named after the model fields and
+    accessed as attributes or by indexing, e.g. `frame.price.values`.
+    """
+
+    model: ClassVar[Type[pydantic.BaseModel]]
+    symbol_fields: ClassVar[Tuple[str, ...]] = ()
+    timestamp_fields: ClassVar[Tuple[str, ...]] = ("timestamp",)
+    # (field name, alias, kind, categories) of every column
+    _specs: ClassVar[Tuple[Tuple[str, str, str, Tuple[str, ...]], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "model" not in cls.__dict__:
+            return
+        specs = []
+        for name, field in cls.model.model_fields.items():
+            annotation = _optional_inner(field.annotation)
+            categories: Tuple[str, ...] = ()
+            if name in cls.symbol_fields:
+                kind = SYMBOL
+            elif name in cls.timestamp_fields:
+                kind = TIMESTAMP
+            elif annotation is float:
+                kind = FLOAT
+            elif get_origin(annotation) is Literal:
+                kind, categories = CATEGORY, tuple(get_args(annotation))
+            else:
+                kind = TEXT
+            specs.append((name, field.alias or name, kind, categories))
+        cls._specs = tuple(specs)
+
+    def __init__(self, columns: Dict[str, Column]) -> None:
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("all columns of a frame must have the same length")
+        self._columns = columns
+        self._length = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str) -> Column:
+        return self._columns[name]
+
+    def __getattr__(self, name: str) -> Column:
+        columns = self.__dict__.get("_columns", {})
+        if name in columns:
+            return columns[name]
+        raise AttributeError(name)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={len(self)}, columns={self.columns})"
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        Names of the columns, in model field order.
+        """
+        return list(self._columns)
+
+    @classmethod
+    def from_records(cls: Type[FrameT], records: Iterable[Any]) -> FrameT:
+        """
+        Decodes items given as models or, as decoded JSON, as dicts.
+        """
+        rows = list(records)
+        columns: Dict[str, Column] = {}
+        for name, alias, kind, categories in cls._specs:
+            values: List[Any] = [
+                row.get(alias) if isinstance(row, dict) else getattr(row, name, None)
+                for row in rows
+            ]
+            if kind == FLOAT:
+                columns[name] = _encode_floats(values)
+            elif kind == TIMESTAMP:
+                columns[name] = _encode_timestamps(values)
+            elif kind == CATEGORY:
+                columns[name] = _encode_category(name, values, categories)
+            elif kind == SYMBOL:
+                columns[name] = _encode_symbols(values)
+            else:
+                columns[name] = _encode_text(values)
+        return cls(columns)
+
+    @classmethod
+    def concat(cls: Type[FrameT], frames: Sequence["Frame"]) -> FrameT:
+        """
+        Concatenates frames into one, copying every column once.
+        """
+        if not frames:
+            return cls.from_records([])
+        return cls(
+            {
+                name: _concat_columns([frame[name] for frame in frames])
+                for name, _, _, _ in cls._specs
+            }
+        )
+
+    @classmethod
+    def from_pages(cls: Type[FrameT], pages: Iterable[Any]) -> FrameT:
+        """
+        Decodes the items of page responses into one frame.
+        """
+        return cls.concat([cls.from_records(page_items(page)) for page in pages])
+
+    @classmethod
+    async def afrom_pages(cls: Type[FrameT], pages: AsyncIterable[Any]) -> FrameT:
+        """
+        Decodes the items of asynchronously iterated page responses into one
+        frame.
+        """
+        return cls.concat([cls.from_records(page_items(page)) async for page in pages])
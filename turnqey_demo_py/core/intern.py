@@ -0,0 +1,90 @@
+from typing import Any, Dict, FrozenSet, Iterable
+
+"""
+String interning for low-cardinality response fields.
+
+Fields such as `client_id` or `base_asset` repeat on nearly every item while
+each decoded item holds its own copy of the string. An intern table maps every
+value seen to a single shared instance, so large result sets held in memory
+keep one copy per distinct value.
+"""
+
+# fields interned unless configured otherwise, by their JSON name
+DEFAULT_INTERN_FIELDS: FrozenSet[str] = frozenset(
+    {
+        "asset",
+        "base_asset",
+        "blockchain",
+        "client_id",
+        "exchange_id",
+        "fee_asset",
+        "quote_asset",
+    }
+)
+
+
+class InternTable:
+    """
+    Bounded table of shared string instances for selected response fields.
+
+    Values of `fields` found anywhere in a decoded response are replaced with
+    the instance stored for them. Once `max_size` values are stored, further
+    values are kept as they are rather than evicting others, as the values of
+    low-cardinality fields are expected to be seen first. The table can be
+    shared by every request of a client, or passed through the request options
+    of a pager to last for the pagination.
+    """
+
+    def __init__(
+        self,
+        *,
+        fields: Iterable[str] = DEFAULT_INTERN_FIELDS,
+        max_size: int = 65536,
+    ) -> None:
+        """
+        Args:
+            fields: JSON names of the fields whose string values are interned
+            max_size: Maximum number of distinct values stored
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.fields = frozenset(fields)
+        self.max_size = max_size
+        self._values: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def clear(self) -> None:
+        """
+        Drops every stored value.
+        """
+        self._values.clear()
+
+    def intern(self, value: str) -> str:
+        """
+        Returns the shared instance of `value`, storing it while there is room.
+        """
+        stored = self._values.get(value)
+        if stored is not None:
+            return stored
+        if len(self._values) < self.max_size:
+            # concurrent callers may store the same value, either copy is fine
+            return self._values.setdefault(value, value)
+        return value
+
+    def intern_fields(self, data: Any) -> Any:
+        """
+        Interns the configured fields of decoded JSON in place and returns it.
+        """
+        if isinstance(data, list):
+            for item in data:
+                self.intern_fields(item)
+        elif isinstance(data, dict):
+            for key, value in data.items():
+                if isinstance(value, str):
+                    if key in self.fields:
+                        data[key] = self.intern(value)
+                elif isinstance(value, (dict, list)):
+                    self.intern_fields(value)
+        return data
@@ -0,0 +1,321 @@
+import collections
+import re
+from typing import Any, Deque, Generic, List, Optional, Type, TypeVar
+
+import httpx
+import pydantic_core
+
+from .validators import response_validators
+
+"""
+Incremental parsing of paginated JSON responses.
+
+Page responses are envelopes like `{"data": [...], "pagination": {...}}`. The
+parser in this module scans the body as it arrives and hands out the bytes of
+every item of the `data` array as soon as the item is complete, so items can be
+validated and consumed without holding the whole body in memory.
+"""
+
+T = TypeVar("T")
+
+# characters changing the structure outside of strings
+_STRUCTURE = re.compile(rb'["{}\[\]:,]')
+# characters ending or escaping within strings
+_STRING = re.compile(rb'["\\]')
+# complete strings, the opening quote of incomplete ones, and characters
+# changing the structure within the items of the array
+_ITEM_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"|"|[{}\[\],]', re.S)
+_QUOTE, _COMMA, _OPEN_BRACE, _OPEN_BRACKET = b'",{['
+
+_PREFIX, _ITEMS, _SUFFIX = 0, 1, 2
+
+
+class EnvelopeParser:
+    """
+    Incremental splitter of the items of a JSON envelope's array field.
+
+    Bytes are fed with `feed()`, which returns the raw JSON of every item
+    completed by them. Only the part of the body after the last complete item
+    is buffered. `close()` returns the envelope without the items once the
+    body has been fed, e.g. `{"data": [], "pagination": {...}}`. When `field`
+    is missing or not an array, no items are returned and `close()` returns
+    the envelope as is. The JSON of the items is not checked beyond their
+    boundaries, it is left to whatever decodes them.
+    """
+
+    def __init__(self, field: str = "data") -> None:
+        """
+        Args:
+            field: Name of the top-level array field holding the items
+        """
+        self.field = field.encode()
+        self._buffer = bytearray()
+        self._envelope = bytearray()
+        self._pos = 0
+        self._mode = _PREFIX
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_key: Optional[bytes] = None
+        self._awaiting_array = False
+        self._item_start = 0
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Adds bytes of the body and returns the items completed by them.
+        """
+        self._buffer += chunk
+        items: List[bytes] = []
+        buffer = self._buffer
+        pos = self._pos
+        while pos < len(buffer):
+            if self._mode == _ITEMS:
+                pos = self._scan_items(items, pos)
+                if self._mode == _ITEMS:
+                    break
+                continue
+
+            if self._in_string:
+                match = _STRING.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                if match.group() == b"\\":
+                    if match.end() >= len(buffer):
+                        # the escaped character has not arrived yet
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                pos = match.end()
+                self._in_string = False
+                if self._mode == _PREFIX and self._depth == 1:
+                    self._last_key = bytes(buffer[self._string_start + 1 : pos - 1])
+                continue
+
+            match = _STRUCTURE.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            char = match.group()
+            start, pos = match.start(), match.end()
+            if char == b'"':
+                self._in_string = True
+                self._string_start = start
+            elif char == b":":
+                self._awaiting_array = (
+                    self._mode == _PREFIX
+                    and self._depth == 1
+                    and self._last_key == self.field
+                )
+            elif char in b"[{":
+                if self._awaiting_array and char == b"[":
+                    self._mode = _ITEMS
+                    self._envelope += buffer[:pos]
+                    self._item_start = pos
+                self._awaiting_array = False
+                self._depth += 1
+            elif char in b"]}":
+                self._depth -= 1
+            else:
+                self._awaiting_array = False
+
+        if self._mode == _ITEMS:
+            # only the incomplete item is kept
+            del buffer[: self._item_start]
+            pos -= self._item_start
+            self._item_start = 0
+        self._pos = pos
+        return items
+
+    def _scan_items(self, items: List[bytes], pos: int) -> int:
+        """
+        Scans the items of the array from `pos`, returning where to resume.
+        """
+        buffer = self._buffer
+        depth = self._depth
+        # matches export the buffer, so it is only resized once they are gone
+        closed_at = None
+        for start, end in (m.span() for m in _ITEM_TOKEN.finditer(buffer, pos)):
+            char = buffer[start]
+            if char == _QUOTE:
+                if end - start == 1:
+                    # the string is not complete yet
+                    self._depth = depth
+                    return start
+            elif char == _OPEN_BRACE or char == _OPEN_BRACKET:
+                depth += 1
+            elif char == _COMMA:
+                if depth == 2:
+                    self._emit(items, start)
+                    self._item_start = end
+            else:
+                depth -= 1
+                if depth == 1:
+                    self._emit(items, start)
+                    closed_at = start
+                    break
+        self._depth = depth
+        if closed_at is None:
+            return len(buffer)
+
+        self._mode = _SUFFIX
+        # keep the rest of the envelope from the closing bracket on
+        del buffer[:closed_at]
+        self._item_start = 0
+        return 1
+
+    def _emit(self, items: List[bytes], end: int) -> None:
+        item = bytes(self._buffer[self._item_start : end]).strip()
+        if item:
+            items.append(item)
+
+    def close(self) -> Any:
+        """
+        Returns the decoded envelope without the items of `field`.
+
+        Raises:
+            ValueError: The body is incomplete or not valid JSON
+        """
+        if self._mode == _ITEMS or self._in_string:
+            raise ValueError("unexpected end of JSON body")
+        return pydantic_core.from_json(bytes(self._envelope + self._buffer))
+
+
+class ItemStream(Generic[T]):
+    """
+    Iterates over the validated items of a page response while it downloads.
+
+    Every item is validated as soon as its bytes have arrived, so the time to
+    the first item does not depend on the page size and only one item is
+    decoded at a time. Once the stream is exhausted, `envelope` holds the rest
+    of the response, e.g. its `pagination`, as decoded JSON. The connection is
+    released when the stream is exhausted or closed, use it as a context
+    manager when stopping early.
+    """
+
+    def __init__(
+        self,
+        response: httpx.Response,
+        stream_context: Any,
+        item_type: Type[T],
+        field: str = "data",
+    ) -> None:
+        """
+        Args:
+            response: The streamed HTTP response
+            stream_context: Context manager of the stream
+            item_type: Type the items are validated into
+            field: Name of the top-level array field holding the items
+        """
+        self.response = response
+        self.envelope: Optional[Any] = None
+        self._context = stream_context
+        self._validator = response_validators.get(item_type)
+        self._parser = EnvelopeParser(field)
+        self._chunks = response.iter_bytes()
+        self._pending: Deque[bytes] = collections.deque()
+        self._done = False
+
+    def __iter__(self) -> "ItemStream[T]":
+        return self
+
+    def __next__(self) -> T:
+        while not self._pending:
+            if self._done:
+                raise StopIteration
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self._done = True
+                try:
+                    self.envelope = self._parser.close()
+                finally:
+                    self.close()
+                raise
+            except BaseException:
+                self.close()
+                raise
+            self._pending.extend(self._parser.feed(chunk))
+        return self._validator.validate_json(self._pending.popleft())
+
+    def __enter__(self) -> "ItemStream[T]":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Releases the connection, stopping the stream.
+        """
+        self._done = True
+        if self._context is not None:
+            context, self._context = self._context, None
+            context.__exit__(None, None, None)
+
+
+class AsyncItemStream(Generic[T]):
+    """
+    Asynchronous version of `ItemStream`, iterated with `async for`.
+    """
+
+    def __init__(
+        self,
+        response: httpx.Response,
+        stream_context: Any,
+        item_type: Type[T],
+        field: str = "data",
+    ) -> None:
+        """
+        Args:
+            response: The streamed HTTP response
+            stream_context: Async context manager of the stream
+            item_type: Type the items are validated into
+            field: Name of the top-level array field holding the items
+        """
+        self.response = response
+        self.envelope: Optional[Any] = None
+        self._context = stream_context
+        self._validator = response_validators.get(item_type)
+        self._parser = EnvelopeParser(field)
+        self._chunks = response.aiter_bytes()
+        self._pending: Deque[bytes] = collections.deque()
+        self._done = False
+
+    def __aiter__(self) -> "AsyncItemStream[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        while not self._pending:
+            if self._done:
+                raise StopAsyncIteration
+            try:
+                chunk = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                self._done = True
+                try:
+                    self.envelope = self._parser.close()
+                finally:
+                    await self.aclose()
+                raise
+            except BaseException:
+                await self.aclose()
+                raise
+            self._pending.extend(self._parser.feed(chunk))
+        return self._validator.validate_json(self._pending.popleft())
+
+    async def __aenter__(self) -> "AsyncItemStream[T]":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Releases the connection, stopping the stream.
+        """
+        self._done = True
+        if self._context is not None:
+            context, self._context = self._context, None
+            await context.__aexit__(None, None, None)
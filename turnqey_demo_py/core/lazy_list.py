@@ -0,0 +1,275 @@
+import functools
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableSequence,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+import pydantic
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+from typing_extensions import get_args, get_origin
+
+from .validators import response_validators
+
+"""
+Lazily validated lists for list fields of response models.
+
+Paginated responses often carry thousands of items while callers only look at
+the pagination or a few of the items. A `LazyList` keeps the decoded items and
+validates each one on first access instead of validating the whole page up
+front. Response models get lazy lists through `lazy_model`, which the "lazy"
+response mode decodes responses with.
+"""
+
+T = TypeVar("T")
+
+# marks items that have not been validated yet
+_PENDING: Any = object()
+
+# lazy variant of every response model decoded lazily so far, keyed by the model
+_lazy_models: Dict[Type[pydantic.BaseModel], Type[pydantic.BaseModel]] = {}
+_lazy_models_lock = threading.Lock()
+
+
+class _ItemValidator:
+    """
+    Validates the items of a lazy list with the shared validator of their
+    type. Unlike a closure, it can be pickled along with the list.
+    """
+
+    __slots__ = ("item_type",)
+
+    def __init__(self, item_type: Any) -> None:
+        self.item_type = item_type
+
+    def __call__(self, raw: Any) -> Any:
+        return response_validators.get(self.item_type).validate_python(raw)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (_ItemValidator, (self.item_type,))
+
+
+class LazyList(MutableSequence[T]):
+    """
+    A list validating its items on first access and caching the result.
+
+    Indexing, slicing, iteration, `len()` and comparisons behave like a list,
+    slices are lazy lists themselves. As items are only validated when
+    accessed, invalid items raise `pydantic.ValidationError` on access rather
+    than when the response is decoded.
+
+    It is not a `list` subclass, so `isinstance(items, list)` is False. Pickling
+    and copying validate every item and keep the validated ones only.
+    """
+
+    __slots__ = ("_raw", "_items", "_validate")
+
+    def __init__(
+        self,
+        raw: Iterable[Any] = (),
+        validate: Optional[Callable[[Any], T]] = None,
+    ) -> None:
+        """
+        Args:
+            raw: The decoded items
+            validate: Converts a decoded item on first access, items are kept
+                as they are when omitted
+        """
+        self._raw: List[Any] = list(raw)
+        self._items: List[Any] = [_PENDING] * len(self._raw)
+        self._validate = validate
+
+    def _materialize(self, index: int) -> T:
+        item = self._items[index]
+        if item is _PENDING:
+            raw = self._raw[index]
+            item = raw if self._validate is None else self._validate(raw)
+            self._items[index] = item
+            # the validated item replaces the decoded one
+            self._raw[index] = None
+        return item
+
+    @property
+    def validated_count(self) -> int:
+        """
+        Number of items validated so far.
+        """
+        return sum(1 for item in self._items if item is not _PENDING)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LazyList[T]": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, "LazyList[T]"]:
+        if isinstance(index, slice):
+            sliced: LazyList[T] = LazyList(validate=self._validate)
+            sliced._raw = self._raw[index]
+            sliced._items = self._items[index]
+            return sliced
+        return self._materialize(index)
+
+    def __iter__(self) -> Iterator[T]:
+        index = 0
+        while index < len(self._items):
+            yield self._materialize(index)
+            index += 1
+
+    @overload
+    def __setitem__(self, index: int, value: T) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[T]) -> None: ...
+
+    def __setitem__(self, index: Union[int, slice], value: Any) -> None:
+        if isinstance(index, slice):
+            values = list(value)
+            self._items[index] = values
+            self._raw[index] = [None] * len(values)
+        else:
+            self._items[index] = value
+            self._raw[index] = None
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        del self._items[index]
+        del self._raw[index]
+
+    def insert(self, index: int, value: T) -> None:
+        self._items.insert(index, value)
+        self._raw.insert(index, None)
+
+    def copy(self) -> "LazyList[T]":
+        """
+        Returns a shallow copy, sharing the items validated so far.
+        """
+        return self[:]
+
+    def __add__(self, other: Iterable[T]) -> List[T]:
+        return list(self) + list(other)
+
+    def __radd__(self, other: Iterable[T]) -> List[T]:
+        return list(other) + list(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, LazyList)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (_validated, (self.__class__, list(self)))
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        args = get_args(source)
+        item_type = args[0] if args else Any
+        from_list = functools.partial(cls, validate=_ItemValidator(item_type))
+
+        list_schema = core_schema.list_schema(handler.generate_schema(item_type))
+        lazy_schema = core_schema.no_info_after_validator_function(
+            from_list, core_schema.list_schema(core_schema.any_schema())
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=lazy_schema,
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), lazy_schema]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                list, return_schema=list_schema
+            ),
+            # document the items like a regular list of the item type
+            metadata={
+                "pydantic_js_functions": [
+                    lambda _schema, json_handler: json_handler(list_schema)
+                ]
+            },
+        )
+
+
+def _validated(cls: Any, items: List[Any]) -> LazyList[Any]:
+    # restores a pickled lazy list, whose items were all validated
+    lazy: LazyList[Any] = cls()
+    lazy._raw = [None] * len(items)
+    lazy._items = items
+    return lazy
+
+
+def lazy_model(tp: Any) -> Any:
+    """
+    Returns a subclass of the model `tp` whose list fields are lazy lists.
+
+    Instances of the subclass are instances of `tp` as well, only their list
+    fields hold `LazyList`s. Types other than models, and models without list
+    fields, are returned as they are. Subclasses are built once per model.
+    """
+    if not (isinstance(tp, type) and issubclass(tp, pydantic.BaseModel)):
+        return tp
+    lazy = _lazy_models.get(tp)
+    if lazy is not None:
+        return lazy
+
+    with _lazy_models_lock:
+        lazy = _lazy_models.get(tp)
+        if lazy is None:
+            fields: Dict[str, Any] = {}
+            for name, field in tp.model_fields.items():
+                annotation = _lazy_annotation(field.annotation)
+                if annotation is not None:
+                    fields[name] = (annotation, field)
+            lazy = tp
+            if fields:
+                lazy = pydantic.create_model(  # type: ignore[call-overload]
+                    tp.__name__,
+                    __base__=tp,
+                    __module__=tp.__module__,
+                    **fields,
+                )
+                setattr(lazy, "__reduce__", _reduce_lazy_model)
+            _lazy_models[tp] = lazy
+    return lazy
+
+
+def _lazy_annotation(annotation: Any) -> Optional[Any]:
+    # the lazy list version of a `List[T]` or `Optional[List[T]]` annotation
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin in (list, List) and args:
+        return LazyList[args[0]]  # type: ignore[valid-type]
+    if origin is Union and type(None) in args:
+        members = [a for a in args if a is not type(None)]
+        inner = _lazy_annotation(members[0]) if len(members) == 1 else None
+        return None if inner is None else Optional[inner]
+    return None
+
+
+def _reduce_lazy_model(self: pydantic.BaseModel) -> Tuple[Any, ...]:
+    # lazy models are not importable by name, they are rebuilt from their model
+    model = type(self).__bases__[0]
+    return (_new_lazy_model, (model,), self.__getstate__())
+
+
+def _new_lazy_model(model: Type[pydantic.BaseModel]) -> pydantic.BaseModel:
+    lazy = lazy_model(model)
+    return lazy.__new__(lazy)
@@ -0,0 +1,126 @@
+import threading
+from typing import Dict, Optional
+
+"""
+Adaptive page size selection for paginated endpoints.
+
+Small pages spend most of their time on round trips while large pages are slow
+to serve and decode. The tuner learns a page size per endpoint from the observed
+latency and payload size of the pages requested so far.
+"""
+
+
+class PageSizeTuner:
+    """
+    Thread-safe per-endpoint page size tuner.
+
+    Endpoints are keyed by their path template, e.g. `/clients/{clientId}/trades`.
+    After every page the size is scaled towards the one expected to take
+    `target_latency` seconds, capped so a page stays below `max_page_bytes`, and
+    kept within `min_size` and `max_size`. A single page moves the size by at
+    most a factor of two and changes below 20% are ignored, so the size settles
+    instead of oscillating. Learned sizes can be read with `learned_sizes()` and
+    pinned through `pinned` or `pin()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_size: int = 100,
+        min_size: int = 10,
+        max_size: int = 1000,
+        target_latency: float = 1.0,
+        max_page_bytes: int = 4 * 1024 * 1024,
+        pinned: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Args:
+            initial_size: Page size used for endpoints not observed yet
+            min_size: Smallest page size the tuner picks
+            max_size: Largest page size the tuner picks
+            target_latency: Seconds a page should take to request and decode
+            max_page_bytes: Largest response body a page should produce
+            pinned: Fixed page sizes keyed by path template, never tuned
+        """
+        if not 1 <= min_size <= max_size:
+            raise ValueError("page sizes must satisfy 1 <= min_size <= max_size")
+        if target_latency <= 0:
+            raise ValueError("target_latency must be greater than zero")
+        if max_page_bytes < 1:
+            raise ValueError("max_page_bytes must be at least 1")
+        self.initial_size = min(max(initial_size, min_size), max_size)
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.max_page_bytes = max_page_bytes
+        self._pinned: Dict[str, int] = dict(pinned or {})
+        self._sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def size_for(self, endpoint: str) -> int:
+        """
+        Returns the page size to request next from `endpoint`.
+        """
+        with self._lock:
+            if endpoint in self._pinned:
+                return self._pinned[endpoint]
+            return self._sizes.get(endpoint, self.initial_size)
+
+    def pin(self, endpoint: str, size: int) -> None:
+        """
+        Fixes the page size of `endpoint`, disabling tuning for it.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        with self._lock:
+            self._pinned[endpoint] = size
+
+    def learned_sizes(self) -> Dict[str, int]:
+        """
+        Returns the current page size of every observed or pinned endpoint.
+
+        The result can be passed back as `pinned` to reuse the learned sizes.
+        """
+        with self._lock:
+            return {**self._sizes, **self._pinned}
+
+    def record(
+        self,
+        endpoint: str,
+        *,
+        page_size: int,
+        items: int,
+        elapsed: float,
+        num_bytes: Optional[int],
+    ) -> None:
+        """
+        Records a page requested from `endpoint` and adjusts its page size.
+
+        Args:
+            endpoint: Path template of the endpoint
+            page_size: Number of items requested
+            items: Number of items returned
+            elapsed: Seconds taken to request and decode the page
+            num_bytes: Size of the response body, if known
+        """
+        if items == 0:
+            return
+
+        # a short final page says little about the cost of a full one
+        scale = self.target_latency / max(elapsed, 1e-6)
+        if items < page_size:
+            scale = min(scale, 1.0)
+        desired = page_size * scale
+        if num_bytes:
+            desired = min(desired, self.max_page_bytes * items / num_bytes)
+
+        with self._lock:
+            if endpoint in self._pinned:
+                return
+            current = self._sizes.get(endpoint, self.initial_size)
+            desired = min(max(desired, current / 2), current * 2)
+            size = int(min(max(desired, self.min_size), self.max_size))
+            if abs(size - current) >= 0.2 * current:
+                self._sizes[endpoint] = size
+            else:
+                self._sizes.setdefault(endpoint, current)
@@ -0,0 +1,637 @@
+import asyncio
+import concurrent.futures
+import copy
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+import httpx
+from pydantic import BaseModel
+
+from .page_size import PageSizeTuner
+from .request import RequestOptions
+
+"""
+Auto-pagination for list endpoints.
+
+Paginated endpoints return one page of `data` along with a `pagination` object
+describing the page number, page count and total item count. The pagers in this
+module request pages lazily and yield their items one by one.
+"""
+
+# default number of items requested per page by the pagers
+DEFAULT_PAGE_SIZE = 100
+
+ItemT = TypeVar("ItemT")
+
+# fetches a page given its page number, page size and request options
+FetchPage = Callable[[int, int, RequestOptions], Any]
+AsyncFetchPage = Callable[[int, int, RequestOptions], Awaitable[Any]]
+
+
+def page_field(page: Any, name: str) -> Any:
+    """
+    Returns a field of a page response decoded as a model or, with the "raw"
+    response mode, as a dict.
+    """
+    if isinstance(page, dict):
+        return page.get(name)
+    return getattr(page, name, None)
+
+
+def page_items(page: Any) -> Sequence[Any]:
+    """
+    Returns the items of a page response, treating a missing `data` as empty.
+
+    Lazily validated items are returned without validating them.
+    """
+    return page_field(page, "data") or []
+
+
+def drop_page_items(page: Any, count: int) -> Any:
+    """
+    Returns a copy of a page response without its first `count` items.
+    """
+    items = page_items(page)[count:]
+    if isinstance(page, dict):
+        return {**page, "data": items}
+    if isinstance(page, BaseModel):
+        return page.model_copy(update={"data": items})
+    page = copy.copy(page)
+    object.__setattr__(page, "data", items)
+    return page
+
+
+def has_next_page(page: Any, *, page_number: int, page_size: int, seen: int) -> bool:
+    """
+    Determines whether another page follows a page response.
+
+    Uses `pagination.pages` when given, `pagination.total` otherwise, and falls
+    back to checking whether the page was full.
+
+    Args:
+        page: The page response
+        page_number: Number of the page that was requested
+        page_size: Number of items that were requested per page
+        seen: Number of items returned by this and all previous pages
+    """
+    count = len(page_field(page, "data") or [])
+    if count == 0:
+        return False
+
+    pagination = page_field(page, "pagination")
+    pages = None if pagination is None else page_field(pagination, "pages")
+    total = None if pagination is None else page_field(pagination, "total")
+    if pages is not None:
+        return page_number < pages
+    if total is not None:
+        return seen < total
+    return count >= page_size
+
+
+def last_page_number(page: Any, *, page_size: int) -> Optional[int]:
+    """
+    Returns the number of the last page reported by a page response, if known.
+
+    Uses `pagination.pages` when given and derives it from `pagination.total`
+    otherwise, using the page size reported by the server since it may cap the
+    requested one.
+    """
+    pagination = page_field(page, "pagination")
+    if pagination is None:
+        return None
+    pages = page_field(pagination, "pages")
+    if pages is not None:
+        return pages
+    total = page_field(pagination, "total")
+    if total is not None:
+        limit = page_field(pagination, "limit") or page_size
+        return -(-total // limit)
+    return None
+
+
+def aligned_page_size(offset: int, page_size: int, current: int) -> int:
+    """
+    Picks a page size close to `page_size` whose pages start exactly at `offset`.
+
+    Page numbers are relative to the page size, so changing it mid-iteration
+    only lines up with the items consumed so far when `offset` is a multiple
+    of the new size. Sizes are tried from `page_size` down to the `current`
+    size, or to half of `page_size` when shrinking, keeping the `current` size,
+    which `offset` is a multiple of, when none lines up.
+    """
+    for size in range(page_size, min(current, page_size // 2), -1):
+        if offset % size == 0:
+            return size
+    return current
+
+
+class _Pager:
+    """
+    Configuration shared by the sync and async pagers.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch_page: Any,
+        page_size: Optional[int] = None,
+        start_page: int = 1,
+        request_options: Optional[RequestOptions] = None,
+        endpoint: Optional[str] = None,
+        tuner: Optional[PageSizeTuner] = None,
+    ) -> None:
+        """
+        Args:
+            fetch_page: Requests a page given its page number, page size and
+                request options
+            page_size: Number of items requested per page, chosen by `tuner`
+                when omitted
+            start_page: Page number to start from
+            request_options: Request options passed to every page request
+            endpoint: Path template of the endpoint, keying its tuned page size
+            tuner: Page size tuner used when `page_size` is omitted
+        """
+        if page_size is not None and page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if start_page < 1:
+            raise ValueError("start_page must be at least 1")
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self.start_page = start_page
+        self.request_options: RequestOptions = request_options or {}
+        self.endpoint = endpoint
+        self.tuner = tuner
+
+    @property
+    def adaptive(self) -> bool:
+        """
+        Whether the page size is tuned from the pages requested so far.
+        """
+        return (
+            self._page_size is None
+            and self.tuner is not None
+            and self.endpoint is not None
+        )
+
+    @property
+    def page_size(self) -> int:
+        """
+        Number of items requested per page.
+        """
+        if self._page_size is not None:
+            return self._page_size
+        if self.tuner is not None and self.endpoint is not None:
+            return self.tuner.size_for(self.endpoint)
+        return DEFAULT_PAGE_SIZE
+
+    def _page_options(self, body_sizes: List[int]) -> RequestOptions:
+        """
+        Returns the request options of a page request, recording the size of
+        the response body into `body_sizes` when the page size is tuned.
+        """
+        if not self.adaptive:
+            return self.request_options
+
+        on_response = self.request_options.get("on_response")
+
+        def record_size(response: httpx.Response) -> None:
+            body_sizes.append(len(response.content))
+            if on_response is not None:
+                on_response(response)
+
+        options: RequestOptions = {**self.request_options, "on_response": record_size}
+        return options
+
+    def _observe(
+        self, page: Any, *, page_size: int, elapsed: float, body_sizes: List[int]
+    ) -> None:
+        if self.tuner is None or self.endpoint is None or not self.adaptive:
+            return
+        self.tuner.record(
+            self.endpoint,
+            page_size=page_size,
+            items=len(page_field(page, "data") or []),
+            elapsed=elapsed,
+            num_bytes=body_sizes[-1] if body_sizes else None,
+        )
+
+
+class _PagePlan:
+    """
+    Page number and page size of the next page of a sequential iteration.
+
+    The server may cap the requested page size, and numbers pages by the size
+    it applied. Page numbers are therefore counted up while the requested size
+    stays the same, and only derived from the number of items seen when the
+    tuner changes the size, using the page size the server reported. Once a
+    capped page does not start at the next item, the capped page holding it is
+    requested instead, and the items preceding it are dropped.
+    """
+
+    def __init__(self, pager: "_Pager") -> None:
+        self._pager = pager
+        self.page_size = pager.page_size
+        self.page_number = pager.start_page
+        # items before the next page, a multiple of the last served page size
+        self.offset = (pager.start_page - 1) * self.page_size
+        self.served = self.page_size
+        # page size the server capped requests to, once seen
+        self._cap: Optional[int] = None
+        # leading items of the next page that precede `offset`
+        self._skip = 0
+
+    def _served_size(self, page: Any) -> int:
+        pagination = page_field(page, "pagination")
+        limit = None if pagination is None else page_field(pagination, "limit")
+        if isinstance(limit, int) and 0 < limit < self.page_size:
+            return limit
+        return self.page_size
+
+    def _move(self, page_size: int) -> None:
+        self.page_size = page_size
+        self.page_number = self.offset // page_size + 1
+
+    def advance(self, page: Any) -> Optional[Any]:
+        """
+        Moves past `page`, returning it without the items seen already, or
+        returns None when the server capped its size so that it does not start
+        at the next item, and the capped page holding that item must be
+        requested instead.
+        """
+        served = self._served_size(page)
+        if served < self.page_size:
+            self._cap = served
+            if (self.page_number - 1) * served != self.offset:
+                self._move(served)
+                self._skip = self.offset % served
+                return None
+
+        if self._skip:
+            page = drop_page_items(page, self._skip)
+            self._skip = 0
+        self.offset += len(page_items(page))
+        self.served = served
+        size = self.page_size
+        if self._pager.adaptive:
+            size = self._pager.page_size
+            if self._cap is not None:
+                size = min(size, self._cap)
+        if size == self.page_size:
+            self.page_number += 1
+        else:
+            self._move(aligned_page_size(self.offset, size, served))
+        return page
+
+
+class SyncPager(_Pager, Generic[ItemT]):
+    """
+    Lazily iterates over every item of a paginated endpoint.
+
+    Only one page is requested and held in memory at a time, the next page is
+    requested once all items of the current one have been consumed. Iterating
+    the pager again starts over from `start_page`. When the page size is
+    omitted and a tuner is given, the size is tuned after every page.
+    """
+
+    _fetch_page: FetchPage
+
+    def __iter__(self) -> Iterator[ItemT]:
+        for page in self.iter_pages():
+            items = page_items(page)
+            # release the page itself, only its items are needed from here on
+            del page
+            yield from items
+
+    def iter_pages(self) -> Iterator[Any]:
+        """
+        Iterates over the page responses instead of their items.
+        """
+        plan = _PagePlan(self)
+        while True:
+            page_number, page_size = plan.page_number, plan.page_size
+            body_sizes: List[int] = []
+            started = time.monotonic()
+            page = self._fetch_page(
+                page_number, page_size, self._page_options(body_sizes)
+            )
+            self._observe(
+                page,
+                page_size=page_size,
+                elapsed=time.monotonic() - started,
+                body_sizes=body_sizes,
+            )
+            unseen = plan.advance(page)
+            if unseen is None:
+                continue
+            more = has_next_page(
+                page, page_number=page_number, page_size=plan.served, seen=plan.offset
+            )
+            yield unseen
+            del page, unseen
+            if not more:
+                return
+
+    def parallel(
+        self,
+        *,
+        workers: int = 8,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> Iterator[ItemT]:
+        """
+        Iterates over every item in page order, fetching pages on a thread pool.
+
+        The first page is requested on its own to learn the page count, the
+        remaining pages are then requested by `workers` threads sharing the
+        client's connection pool. When a later page reports a larger total, the
+        additional pages are requested as well. Pages not yet requested are
+        cancelled once the iteration stops early. Endpoints reporting neither a
+        page count nor a total are iterated sequentially.
+
+        Args:
+            workers: Number of pages requested at the same time
+            executor: Executor to run the page requests on instead of a thread
+                pool created for this iteration
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        return self._iter_parallel(
+            workers=workers, window=2 * workers, executor=executor
+        )
+
+    def prefetch(
+        self,
+        *,
+        depth: int = 1,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> Iterator[ItemT]:
+        """
+        Iterates over every item in page order, requesting the next pages in
+        the background while the current one is consumed.
+
+        At most `depth` pages are requested or waiting ahead of the page being
+        consumed, so no more than `depth + 1` pages are held in memory.
+        Endpoints reporting neither a page count nor a total are iterated
+        without prefetching.
+
+        Args:
+            depth: Number of pages requested ahead of the consumer
+            executor: Executor to run the page requests on instead of a thread
+                pool created for this iteration
+        """
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        return self._iter_parallel(workers=depth, window=depth, executor=executor)
+
+    def _iter_parallel(
+        self,
+        *,
+        workers: int,
+        window: int,
+        executor: Optional[concurrent.futures.Executor],
+    ) -> Iterator[ItemT]:
+        page_size = self.page_size
+        first = self._fetch_page(
+            self.start_page, page_size, self.request_options
+        )
+        last = last_page_number(first, page_size=page_size)
+        more = has_next_page(
+            first,
+            page_number=self.start_page,
+            page_size=page_size,
+            seen=(self.start_page - 1) * page_size + len(page_items(first)),
+        )
+        items = page_items(first)
+        del first
+
+        if last is None:
+            yield from items
+            del items
+            if more:
+                yield from SyncPager[ItemT](
+                    fetch_page=self._fetch_page,
+                    page_size=page_size,
+                    start_page=self.start_page + 1,
+                    request_options=self.request_options,
+                )
+            return
+
+        last_number = last
+        pool = executor or concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="turnqey-pages"
+        )
+        # pages are scheduled in a window ahead of the consumer so memory stays
+        # bounded when the consumer is slower than the network
+        futures: Dict[int, "concurrent.futures.Future[Any]"] = {}
+        scheduled = self.start_page
+
+        def schedule() -> None:
+            nonlocal scheduled
+            while scheduled < last_number and len(futures) < window:
+                scheduled += 1
+                futures[scheduled] = pool.submit(
+                    self._fetch_page, scheduled, page_size, self.request_options
+                )
+
+        try:
+            schedule()
+            yield from items
+            del items
+            while futures:
+                page = futures.pop(min(futures)).result()
+                reported = last_page_number(page, page_size=page_size)
+                if reported is not None and reported > last_number:
+                    last_number = reported
+                items = page_items(page)
+                del page
+                schedule()
+                yield from items
+                del items
+        finally:
+            for future in futures.values():
+                future.cancel()
+            if executor is None:
+                pool.shutdown(wait=False)
+
+
+class AsyncPager(_Pager, Generic[ItemT]):
+    """
+    Lazily iterates over every item of a paginated endpoint with `async for`.
+
+    Asynchronous version of `SyncPager`.
+    """
+
+    _fetch_page: AsyncFetchPage
+
+    async def __aiter__(self) -> AsyncIterator[ItemT]:
+        async for page in self.iter_pages():
+            items = page_items(page)
+            # release the page itself, only its items are needed from here on
+            del page
+            for item in items:
+                yield item
+
+    async def iter_pages(self) -> AsyncIterator[Any]:
+        """
+        Iterates over the page responses instead of their items.
+        """
+        plan = _PagePlan(self)
+        while True:
+            page_number, page_size = plan.page_number, plan.page_size
+            body_sizes: List[int] = []
+            started = time.monotonic()
+            page = await self._fetch_page(
+                page_number, page_size, self._page_options(body_sizes)
+            )
+            self._observe(
+                page,
+                page_size=page_size,
+                elapsed=time.monotonic() - started,
+                body_sizes=body_sizes,
+            )
+            unseen = plan.advance(page)
+            if unseen is None:
+                continue
+            more = has_next_page(
+                page, page_number=page_number, page_size=plan.served, seen=plan.offset
+            )
+            yield unseen
+            del page, unseen
+            if not more:
+                return
+
+    def concurrent(
+        self, *, concurrency: int = 8, ordered: bool = True
+    ) -> AsyncIterator[ItemT]:
+        """
+        Iterates over every item, fetching the remaining pages concurrently.
+
+        The first page is requested on its own to learn the page count, the
+        remaining pages are then requested with at most `concurrency` requests
+        in flight. When a later page reports a larger total, the additional
+        pages are requested as well, and pages past a shrunken total simply
+        yield no items. Endpoints reporting neither a page count nor a total
+        are iterated sequentially.
+
+        Args:
+            concurrency: Maximum number of page requests in flight
+            ordered: Yield items in page order when true, otherwise yield the
+                items of each page as soon as it arrives
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        return self._iter_concurrent(
+            concurrency=concurrency, ordered=ordered, window=2 * concurrency
+        )
+
+    def prefetch(self, *, depth: int = 1) -> AsyncIterator[ItemT]:
+        """
+        Iterates over every item in page order, requesting the next pages in
+        the background while the current one is consumed.
+
+        At most `depth` pages are requested or waiting ahead of the page being
+        consumed, so no more than `depth + 1` pages are held in memory.
+        Endpoints reporting neither a page count nor a total are iterated
+        without prefetching.
+
+        Args:
+            depth: Number of pages requested ahead of the consumer
+        """
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        return self._iter_concurrent(concurrency=depth, ordered=True, window=depth)
+
+    async def _iter_concurrent(
+        self, *, concurrency: int, ordered: bool, window: int
+    ) -> AsyncIterator[ItemT]:
+        page_size = self.page_size
+        first = await self._fetch_page(
+            self.start_page, page_size, self.request_options
+        )
+        last = last_page_number(first, page_size=page_size)
+        more = has_next_page(
+            first,
+            page_number=self.start_page,
+            page_size=page_size,
+            seen=(self.start_page - 1) * page_size + len(page_items(first)),
+        )
+        items = page_items(first)
+        del first
+
+        if last is None:
+            for item in items:
+                yield item
+            del items
+            if more:
+                rest = AsyncPager[ItemT](
+                    fetch_page=self._fetch_page,
+                    page_size=page_size,
+                    start_page=self.start_page + 1,
+                    request_options=self.request_options,
+                )
+                async for item in rest:
+                    yield item
+            return
+
+        last_number = last
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page_number: int) -> Any:
+            async with semaphore:
+                return await self._fetch_page(
+                    page_number, page_size, self.request_options
+                )
+
+        # pages are scheduled in a window ahead of the consumer so memory stays
+        # bounded when the consumer is slower than the network
+        tasks: Dict[int, "asyncio.Future[Any]"] = {}
+        scheduled = self.start_page
+
+        def schedule() -> None:
+            nonlocal scheduled
+            while scheduled < last_number and len(tasks) < window:
+                scheduled += 1
+                tasks[scheduled] = asyncio.ensure_future(fetch(scheduled))
+
+        try:
+            schedule()
+            for item in items:
+                yield item
+            del items
+            while tasks:
+                if ordered:
+                    page_number = min(tasks)
+                    page = await tasks.pop(page_number)
+                else:
+                    done, _ = await asyncio.wait(
+                        tasks.values(), return_when=asyncio.FIRST_COMPLETED
+                    )
+                    page_number = next(n for n, t in tasks.items() if t in done)
+                    page = tasks.pop(page_number).result()
+
+                reported = last_page_number(page, page_size=page_size)
+                if reported is not None and reported > last_number:
+                    last_number = reported
+                items = page_items(page)
+                del page
+                schedule()
+                for item in items:
+                    yield item
+                del items
+        finally:
+            for task in tasks.values():
+                if task.done() and not task.cancelled():
+                    # retrieve failures of pages no longer awaited
+                    task.exception()
+                task.cancel()
@@ -0,0 +1,16 @@
+import re
+from typing import Pattern
+
+"""
+Matching of request paths against endpoint path templates.
+"""
+
+
+def compile_path_template(template: str) -> Pattern[str]:
+    """
+    Compiles a path template like `/clients/{clientId}/trades` into a regex
+    matching any concrete path for it.
+    """
+    parts = re.split(r"\{[^/{}]+\}", template.strip("/"))
+    pattern = "[^/]+".join(re.escape(p) for p in parts)
+    return re.compile(f"^/?{pattern}/?$")
@@ -0,0 +1,137 @@
+import asyncio
+import math
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
+
+from typing_extensions import NotRequired, TypedDict
+
+from .path_template import compile_path_template
+
+"""
+Client-side rate limiting using token buckets.
+
+Requests are paced before they are sent so that fanning out over many
+endpoints does not trip the API's own throttling.
+"""
+
+
+class RateLimit(TypedDict):
+    """
+    Rate limit settings for a single bucket.
+
+    Attributes:
+        requests_per_second: Sustained number of requests allowed per second
+        burst: Number of requests that may be sent back to back before pacing
+            kicks in, defaults to one second worth of requests
+    """
+
+    requests_per_second: float
+    burst: NotRequired[int]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilling at a constant rate up to its burst size.
+
+    Callers reserve a token up front and are told how long to wait for it, which
+    lets the same bucket pace both blocking threads and asyncio tasks.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than zero")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token from the bucket, returning the seconds to wait before using it.
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated_at)
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Paces requests through a global bucket and optional per-path buckets.
+
+    Per-path buckets are keyed by the endpoint's path template, e.g.
+    `/clients/{clientId}/trades`, and apply to every path matching it. A request
+    waits until both the global and its path bucket allow it.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        path_limits: Optional[Dict[str, RateLimit]] = None,
+    ) -> None:
+        """
+        Args:
+            requests_per_second: Sustained rate shared by all requests, `None` disables the global bucket
+            burst: Burst size of the global bucket, defaults to one second worth of requests
+            path_limits: Additional limits keyed by path template
+        """
+        self._global: Optional[TokenBucket] = None
+        if requests_per_second is not None:
+            self._global = _build_bucket(requests_per_second, burst)
+
+        self._paths: List[Tuple[Pattern[str], TokenBucket]] = []
+        for template, limit in (path_limits or {}).items():
+            bucket = _build_bucket(limit["requests_per_second"], limit.get("burst"))
+            self._paths.append((compile_path_template(template), bucket))
+
+    def _buckets_for(self, path: str) -> List[TokenBucket]:
+        buckets = [] if self._global is None else [self._global]
+        for pattern, bucket in self._paths:
+            if pattern.match(path):
+                buckets.append(bucket)
+                break
+        return buckets
+
+    def reserve(self, path: str) -> float:
+        """
+        Reserves a request to `path`, returning the seconds to wait before sending it.
+        """
+        return max([b.reserve() for b in self._buckets_for(path)], default=0.0)
+
+    def acquire(self, path: str) -> None:
+        """
+        Blocks the calling thread until a request to `path` may be sent.
+        """
+        delay = self.reserve(path)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, path: str) -> None:
+        """
+        Waits without blocking the event loop until a request to `path` may be sent.
+        """
+        delay = self.reserve(path)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _build_bucket(rate: float, burst: Optional[int]) -> TokenBucket:
+    return TokenBucket(rate=rate, burst=burst or max(1, math.ceil(rate)))
@@ -0,0 +1,117 @@
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Tuple, Type, TypeVar
+
+import pydantic
+
+"""
+Lightweight slotted records mirroring response models.
+
+Pydantic models keep an instance `__dict__` along with validation bookkeeping
+for every item, which adds up on large result sets. Records store the same
+fields in `__slots__` instead and are built without validation, trading the
+model methods for a much smaller footprint per item.
+"""
+
+RecordT = TypeVar("RecordT", bound="Record")
+
+# record type of every model with one, keyed by the model
+record_types: Dict[Type[pydantic.BaseModel], Type["Record"]] = {}
+
+
+class _RecordMeta(type):
+    def __new__(
+        mcs,
+        name: str,
+        bases: Tuple[type, ...],
+        namespace: Dict[str, Any],
+        model: Optional[Type[pydantic.BaseModel]] = None,
+        **kwargs: Any,
+    ) -> "_RecordMeta":
+        if model is not None:
+            # slots have to be known before the class is created
+            namespace["__slots__"] = tuple(model.model_fields)
+            namespace["_model"] = model
+            namespace["_fields"] = tuple(model.model_fields)
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        if model is not None:
+            record_types[model] = cls  # type: ignore[assignment]
+        return cls
+
+
+class Record(metaclass=_RecordMeta):
+    """
+    Base of the slotted records mirroring a response model.
+
+    Subclasses pass the model as a class keyword, e.g.
+    `class TradeRecord(Record, model=models.Trade)`, and get one slot per model
+    field, named like the model attributes. Fields not given are None.
+    """
+
+    __slots__ = ()
+
+    _model: ClassVar[Type[pydantic.BaseModel]]
+    _fields: ClassVar[Tuple[str, ...]] = ()
+
+    def __init__(self, **values: Any) -> None:
+        for name in self._fields:
+            object.__setattr__(self, name, values.pop(name, None))
+        if values:
+            raise TypeError(
+                f"{type(self).__name__} got unexpected fields: {', '.join(values)}"
+            )
+
+    if TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any: ...
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._astuple() == other._astuple()  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{n}={v!r}" for n, v in self._asdict().items())
+        return f"{type(self).__name__}({fields})"
+
+    def _astuple(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def _asdict(self) -> Dict[str, Any]:
+        """
+        Returns the fields as a dict keyed by attribute name.
+        """
+        return {name: getattr(self, name) for name in self._fields}
+
+    @classmethod
+    def from_model(cls: Type[RecordT], model: pydantic.BaseModel) -> RecordT:
+        """
+        Creates a record holding the field values of a model.
+        """
+        return cls(**{name: getattr(model, name) for name in cls._fields})
+
+    def to_model(self) -> Any:
+        """
+        Validates the record into its model, leaving None fields unset.
+
+        Records held by its fields, e.g. the items of a page, are validated
+        into their models as well.
+        """
+        return self._model.model_validate(
+            {
+                name: _to_models(value)
+                for name, value in self._asdict().items()
+                if value is not None
+            }
+        )
+
+
+def _to_models(value: Any) -> Any:
+    # validates the records within a field value into their models
+    if isinstance(value, Record):
+        return value.to_model()
+    if isinstance(value, list):
+        return [_to_models(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_models(item) for key, item in value.items()}
+    return value
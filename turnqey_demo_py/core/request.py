@@ -1,12 +1,15 @@
-from typing import Any, Dict, Type, Union, Sequence, List
+from typing import Any, Callable, Dict, Type, Union, Sequence, List
 from urllib.parse import quote_plus
 
 import httpx
-from typing_extensions import TypedDict, Required, NotRequired
-from pydantic import TypeAdapter, BaseModel
+from typing_extensions import Literal, TypedDict, Required, NotRequired
+from pydantic import BaseModel
 
+from .intern import InternTable
 from .type_utils import NotGiven
 from .query import QueryParams
+from .retry import RetryPolicy
+from .validators import request_validators
 
 """
 Request configuration and utility functions for handling HTTP requests.
@@ -39,6 +42,17 @@ class RequestConfig(TypedDict):
     extensions: NotRequired[httpx._types.RequestExtensions]
 
 
+# how JSON responses are decoded:
+# - "model": validated into the typed response models (default)
+# - "lazy": like "model", with the items of list fields such as `data` validated
+#   on first access
+# - "raw": plain dicts/lists as decoded from the JSON body, without validation
+# - "construct": response models built with `model_construct`, without validation
+# - "record": like "construct", with models having a record type, including the
+#   responses holding their items, built as unvalidated slotted records
+ResponseMode = Literal["model", "lazy", "raw", "construct", "record"]
+
+
 class RequestOptions(TypedDict):
     """
     Additional options for customizing request behavior.
@@ -50,11 +64,19 @@ class RequestOptions(TypedDict):
         timeout: Number of seconds to await an API call before timing out
         additional_headers: Extra headers to include in the request
         additional_params: Extra query parameters to include in the request
+        retry_policy: Overrides the client's retry policy for this request
+        on_response: Called with the successful HTTP response before it is parsed
+        response_mode: Overrides the client's response mode for this request
+        intern_table: Overrides the client's intern table for this request
     """
 
     timeout: NotRequired[int]
     additional_headers: NotRequired[Dict[str, str]]
     additional_params: NotRequired[QueryParams]
+    retry_policy: NotRequired[RetryPolicy]
+    on_response: NotRequired[Callable[[httpx.Response], None]]
+    response_mode: NotRequired[ResponseMode]
+    intern_table: NotRequired[InternTable]
 
 
 def default_request_options() -> RequestOptions:
@@ -82,6 +104,10 @@ def model_dump(item: Any) -> Any:
         return item
 
 
+# types whose values are already encodable when given as an exact instance
+_PRIMITIVE_TYPES = (int, str, float, bool)
+
+
 def to_encodable(
     *, item: Any, dump_with: Union[Type, Union[Type, Any], List[Type]]
 ) -> Any:
@@ -89,10 +115,15 @@ def to_encodable(
     Validates and converts an item to an encodable format using a specified type.
     Uses Pydantic's TypeAdapter for validation and converts the result
     to a format suitable for encoding in requests.
+
+    Primitive values that already match `dump_with` exactly are returned
+    untouched, all other values are validated with an adapter cached in
+    `request_validators`.
     """
+    if dump_with in _PRIMITIVE_TYPES and type(item) is dump_with:
+        return item
     filtered_item = filter_not_given(item)
-    adapter: TypeAdapter = TypeAdapter(dump_with)
-    validated_item = adapter.validate_python(filtered_item)
+    validated_item = request_validators.get(dump_with).validate_python(filtered_item)
     return model_dump(validated_item)
 
 
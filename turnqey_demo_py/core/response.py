@@ -1,7 +1,32 @@
-import json
-from typing import Any, Union, Dict, Type, TypeVar, List, Generic, Optional
+import asyncio
+import collections
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from pydantic import BaseModel
+from typing_extensions import Annotated, get_args, get_origin
 import httpx
+import pydantic_core
+
+from .lazy_list import LazyList
+from .record import record_types
+from .retry import RetryPolicy, default_retry_policy
+from .sse import ServerSentEvent, SSEDecoder, parse_sse_event
+from .validators import response_validators
 
 """
 Provides functionality for handling Server-Sent Events (SSE) streams and response data encoding.
@@ -27,29 +52,210 @@ def from_encodable(*, data: Any, load_with: Type[EncodableT]) -> Any:
     """
     Converts raw data into a specified type using Pydantic validation.
 
-    Uses a dynamic Pydantic model to validate and convert incoming data
-    into the specified target type.
+    Validators are built once per target type and cached in the process-wide
+    `response_validators` registry.
     """
+    return response_validators.get(load_with).validate_python(data)
 
-    class Caster(BaseModel):
-        data: load_with  # type: ignore
 
-    return Caster(data=data).data
+def from_json(
+    *, data: Union[str, bytes, bytearray], load_with: Type[EncodableT]
+) -> Any:
+    """
+    Validates a JSON document straight into a specified type.
+
+    The document is parsed and validated in a single pass by pydantic-core, so
+    no intermediate dict/list tree is built. Validators are shared with
+    `from_encodable`.
+    """
+    return response_validators.get(load_with).validate_json(data)
+
+
+def construct_encodable(*, data: Any, load_with: Any, records: bool = False) -> Any:
+    """
+    Builds a specified type from trusted, already decoded JSON data without
+    validating it.
+
+    Models, including nested ones, are created with `model_construct`, lists
+    and dicts are walked into, and every other value is kept as decoded, e.g.
+    numbers are not coerced. Values of unions between several models are kept
+    as decoded since the matching member cannot be told without validation.
+    With `records`, models having a record type are built as records instead.
+    Models holding record items, like the pages of record-typed items, have a
+    record type of their own, so records never end up in a model field typed
+    as a model.
+    """
+    if data is None:
+        return None
+
+    origin = get_origin(load_with)
+    args = get_args(load_with)
+    if origin is Annotated:
+        return construct_encodable(data=data, load_with=args[0], records=records)
+    if origin is Union:
+        members = [a for a in args if a is not type(None)]
+        if len(members) == 1:
+            return construct_encodable(
+                data=data, load_with=members[0], records=records
+            )
+        return data
+    if origin in (list, List, LazyList) and isinstance(data, list) and args:
+        return [
+            construct_encodable(data=item, load_with=args[0], records=records)
+            for item in data
+        ]
+    if origin in (dict, Dict) and isinstance(data, dict) and len(args) == 2:
+        return {
+            key: construct_encodable(data=value, load_with=args[1], records=records)
+            for key, value in data.items()
+        }
+    if (
+        isinstance(load_with, type)
+        and issubclass(load_with, BaseModel)
+        and isinstance(data, dict)
+    ):
+        values = {}
+        for name, field in load_with.model_fields.items():
+            key = field.alias or name
+            if key in data:
+                values[name] = construct_encodable(
+                    data=data[key], load_with=field.annotation, records=records
+                )
+        record = record_types.get(load_with) if records else None
+        if record is not None:
+            return record(**values)
+        return load_with.model_construct(**values)
+    return data
+
+
+def _has_data_key(value: Any) -> bool:
+    # whether the validated payload was an object with a top-level `data` key
+    if isinstance(value, dict):
+        return "data" in value
+    if isinstance(value, BaseModel):
+        return "data" in value.model_fields_set
+    return False
+
+
+def from_sse_data(*, data: str, load_with: Type[EncodableT]) -> Any:
+    """
+    Converts the data of an SSE event into a specified type.
+
+    JSON payloads that are not already an object with a `data` key are wrapped
+    in one, non-JSON payloads are passed through as the `data` string. Objects
+    with a `data` key are validated straight from the JSON text.
+    """
+    if data.lstrip().startswith("{"):
+        try:
+            value = response_validators.get(load_with).validate_json(data)
+        except ValueError:
+            pass
+        else:
+            if _has_data_key(value):
+                return value
+
+    try:
+        parsed_data = pydantic_core.from_json(data)
+    except ValueError:
+        return from_encodable(data={"data": data}, load_with=load_with)
+    if not isinstance(parsed_data, dict) or "data" not in parsed_data:
+        parsed_data = {"data": parsed_data}
+    return from_encodable(data=parsed_data, load_with=load_with)
 
 
 T = TypeVar("T")
 
 
-class StreamResponse(Generic[T]):
+# reopens a dropped stream, resuming after the given last event id
+Reconnect = Callable[[Optional[str]], Tuple[httpx.Response, Any]]
+AsyncReconnect = Callable[[Optional[str]], Awaitable[Tuple[httpx.Response, Any]]]
+
+
+class _SSEEvents(Generic[T]):
+    """
+    Event buffering and reconnection state shared by the synchronous and
+    asynchronous SSE streams.
+    """
+
+    cast_to: Type[T]
+
+    def _init_events(self, retry_policy: Optional[RetryPolicy]) -> None:
+        self._decoder = SSEDecoder()
+        self._messages: Deque[str] = collections.deque()
+        self._retry_policy = retry_policy or default_retry_policy()
+        # consecutive reconnects without an event received in between
+        self._reconnects = 0
+        self._done = False
+        self.last_event_id: Optional[str] = None
+        self.retry: Optional[int] = None
+
+    def _feed(self, chunk: bytes) -> None:
+        self._messages.extend(self._decoder.feed(chunk))
+
+    def _flush(self) -> None:
+        message = self._decoder.flush()
+        if message is not None:
+            self._messages.append(message)
+
+    def _next_event(self) -> Optional[ServerSentEvent[T]]:
+        """
+        Returns the next buffered event carrying data, if any.
+        """
+        while self._messages:
+            event = parse_sse_event(self._messages.popleft())
+            if event.id is not None:
+                self.last_event_id = event.id
+            if event.retry is not None:
+                self.retry = event.retry
+            if event.data:
+                self._reconnects = 0
+                return ServerSentEvent(
+                    from_sse_data(data=event.data, load_with=self.cast_to),
+                    event=event.event,
+                    id=self.last_event_id,
+                    retry=self.retry,
+                )
+        return None
+
+    def _can_reconnect(self) -> bool:
+        return self._reconnects + 1 < self._retry_policy.max_attempts
+
+    def _reconnect_delay(self) -> float:
+        """
+        Returns the seconds to wait before reconnecting, as advised by the
+        server or else as computed by the retry policy.
+        """
+        self._reconnects += 1
+        if self.retry is not None:
+            return self.retry / 1000
+        return self._retry_policy.compute_delay(attempt=self._reconnects)
+
+    def _resume(self, response: httpx.Response, stream_context: Any) -> None:
+        self.response = response
+        self._context = stream_context
+        # the incomplete event of the dropped stream is discarded
+        self._decoder = SSEDecoder()
+
+
+class StreamResponse(_SSEEvents[T]):
     """
     Handles synchronous streaming of Server-Sent Events (SSE).
 
     Processes a streaming HTTP response by buffering chunks of data
     and parsing them according to SSE format, converting each event
-    into the specified type.
+    into the specified type. When the connection drops and the stream
+    can be reopened, it reconnects after the delay advised by the server,
+    sending the `Last-Event-ID` received, and iteration carries on.
     """
 
-    def __init__(self, response: httpx.Response, stream_context, cast_to: Type[T]):
+    def __init__(
+        self,
+        response: httpx.Response,
+        stream_context,
+        cast_to: Type[T],
+        reconnect: Optional[Reconnect] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
         """
         Initialize the stream processor with response and conversion settings.
 
@@ -57,13 +263,15 @@ class StreamResponse(Generic[T]):
             response: The HTTP response containing the SSE stream
             stream_context: Context manager for the stream
             cast_to: Target type for converting parsed events
+            reconnect: Reopens the stream after a dropped connection
+            retry_policy: Bounds the consecutive reconnects and their delay
         """
         self.response = response
         self._context = stream_context
         self.cast_to = cast_to
         self.iterator = response.iter_bytes()
-        self.buffer = bytearray()
-        self.position = 0
+        self._reconnect = reconnect
+        self._init_events(retry_policy)
 
     def __iter__(self):
         """Enables iteration over the stream events."""
@@ -79,97 +287,59 @@ class StreamResponse(Generic[T]):
         Raises:
             StopIteration: When the stream is exhausted
         """
-        try:
-            while True:
-                event = self._process_buffer()
-                if event:
-                    return event
+        return self._next_sse().data
 
-                chunk = next(self.iterator)
-                self.buffer += chunk
-
-        except StopIteration:
-            event = self._process_buffer(final=True)
-            if event:
-                return event
-            self._context.__exit__(None, None, None)
-            raise
-
-    def _process_buffer(self, final=False) -> Optional[T]:
+    def events(self) -> Iterator[ServerSentEvent[T]]:
         """
-        Processes the current buffer to extract complete SSE events.
-
-        Searches for event boundaries and parses complete events,
-        handling both JSON and non-JSON payloads.
-
-        Args:
-            final: Whether this is the final processing of the buffer
+        Iterates over the remaining events along with their type and id.
         """
-        while self.position < len(self.buffer):
-            for boundary in [b"\r\n\r\n", b"\n\n", b"\r\r"]:
-                if (self.position + len(boundary)) <= len(self.buffer):
-                    if (
-                        self.buffer[self.position : self.position + len(boundary)]
-                        == boundary
-                    ):
-                        message = self.buffer[: self.position].decode()
-                        self.buffer = self.buffer[self.position + len(boundary) :]
-                        self.position = 0
-
-                        data = self._parse_sse(message)
-                        if data:
-                            try:
-                                parsed_data = json.loads(data)
-                                if (
-                                    not isinstance(parsed_data, dict)
-                                    or "data" not in parsed_data
-                                ):
-                                    parsed_data = {"data": parsed_data}
-                                return from_encodable(
-                                    data=parsed_data, load_with=self.cast_to
-                                )
-                            except json.JSONDecodeError:
-                                return from_encodable(
-                                    data={"data": data}, load_with=self.cast_to
-                                )
-                        return None
-
-            self.position += 1
-
-        if final and self.buffer:
-            message = self.buffer.decode()
-            data = self._parse_sse(message)
-            if data:
-                try:
-                    parsed_data = json.loads(data)
-                    if not isinstance(parsed_data, dict) or "data" not in parsed_data:
-                        parsed_data = {"data": parsed_data}
-                    return from_encodable(data=parsed_data, load_with=self.cast_to)
-                except json.JSONDecodeError:
-                    return from_encodable(data={"data": data}, load_with=self.cast_to)
-
-        return None
+        while True:
+            try:
+                yield self._next_sse()
+            except StopIteration:
+                return
 
-    def _parse_sse(self, message: str) -> Optional[str]:
+    def close(self) -> None:
         """
-        Parses an SSE message to extract the data field.
-
-        Handles multi-line data fields and empty data fields according
-        to the SSE specification.
+        Releases the connection, stopping the stream.
         """
-        data = []
-        for line in message.split("\n"):
-            if line.startswith("data:"):
-                data.append(line[5:].strip())
-            elif line.strip() == "data:":  # Handle empty data field
-                data.append("")
-
-        if data:
-            return "\n".join(data)
-        return None
+        self._done = True
+        if self._context is not None:
+            context, self._context = self._context, None
+            context.__exit__(None, None, None)
+
+    def _next_sse(self) -> ServerSentEvent[T]:
+        while True:
+            event = self._next_event()
+            if event is not None:
+                return event
+            if self._done:
+                raise StopIteration
+
+            try:
+                chunk = next(self.iterator)
+            except StopIteration:
+                self._flush()
+                self.close()
+                continue
+            except httpx.TransportError:
+                if self._reconnect is None or not self._can_reconnect():
+                    self.close()
+                    raise
+                self._reopen(self._reconnect)
+                continue
+            self._feed(chunk)
+
+    def _reopen(self, reconnect: Reconnect) -> None:
+        self.close()
+        time.sleep(self._reconnect_delay())
+        response, stream_context = reconnect(self.last_event_id)
+        self._resume(response, stream_context)
+        self.iterator = response.iter_bytes()
+        self._done = False
 
 
-class AsyncStreamResponse(Generic[T]):
+class AsyncStreamResponse(_SSEEvents[T]):
     """
     Handles asynchronous streaming of Server-Sent Events (SSE).
 
@@ -177,7 +347,14 @@ class AsyncStreamResponse(Generic[T]):
     but compatible with async/await syntax.
     """
 
-    def __init__(self, response: httpx.Response, stream_context, cast_to: Type[T]):
+    def __init__(
+        self,
+        response: httpx.Response,
+        stream_context,
+        cast_to: Type[T],
+        reconnect: Optional[AsyncReconnect] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
         """
         Initialize the async stream processor.
 
@@ -185,13 +362,15 @@ class AsyncStreamResponse(Generic[T]):
             response: The HTTP response containing the SSE stream
             stream_context: Async context manager for the stream
             cast_to: Target type for converting parsed events
+            reconnect: Reopens the stream after a dropped connection
+            retry_policy: Bounds the consecutive reconnects and their delay
         """
         self.response = response
         self._context = stream_context
         self.cast_to = cast_to
         self.iterator = response.aiter_bytes()
-        self.buffer = bytearray()
-        self.position = 0
+        self._reconnect = reconnect
+        self._init_events(retry_policy)
 
     def __aiter__(self):
         """Enables async iteration over the stream events."""
@@ -207,87 +386,53 @@ class AsyncStreamResponse(Generic[T]):
         Raises:
             StopAsyncIteration: When the stream is exhausted
         """
-        try:
-            while True:
-                event = self._process_buffer()
-                if event:
-                    return event
-
-                chunk = await self.iterator.__anext__()
-                self.buffer += chunk
-
-        except StopAsyncIteration:
-            event = self._process_buffer(final=True)
-            if event:
-                return event
-            await self._context.__aexit__(None, None, None)
-            raise
+        return (await self._next_sse()).data
 
-    def _process_buffer(self, final=False) -> Optional[T]:
+    async def events(self) -> AsyncIterator[ServerSentEvent[T]]:
         """
-        Processes the current buffer to extract complete SSE events.
-
-        Identical to the synchronous version's buffer processing.
+        Iterates over the remaining events along with their type and id.
         """
-        while self.position < len(self.buffer):
-            for boundary in [b"\r\n\r\n", b"\n\n", b"\r\r"]:
-                if (self.position + len(boundary)) <= len(self.buffer):
-                    if (
-                        self.buffer[self.position : self.position + len(boundary)]
-                        == boundary
-                    ):
-                        message = self.buffer[: self.position].decode()
-                        self.buffer = self.buffer[self.position + len(boundary) :]
-                        self.position = 0
-
-                        data = self._parse_sse(message)
-                        if data:
-                            try:
-                                parsed_data = json.loads(data)
-                                if (
-                                    not isinstance(parsed_data, dict)
-                                    or "data" not in parsed_data
-                                ):
-                                    parsed_data = {"data": parsed_data}
-                                return from_encodable(
-                                    data=parsed_data, load_with=self.cast_to
-                                )
-                            except json.JSONDecodeError:
-                                return from_encodable(
-                                    data={"data": data}, load_with=self.cast_to
-                                )
-                        return None
-
-            self.position += 1
-
-        if final and self.buffer:
-            message = self.buffer.decode()
-            data = self._parse_sse(message)
-            if data:
-                try:
-                    parsed_data = json.loads(data)
-                    if not isinstance(parsed_data, dict) or "data" not in parsed_data:
-                        parsed_data = {"data": parsed_data}
-                    return from_encodable(data=parsed_data, load_with=self.cast_to)
-                except json.JSONDecodeError:
-                    return from_encodable(data={"data": data}, load_with=self.cast_to)
+        while True:
+            try:
+                yield await self._next_sse()
+            except StopAsyncIteration:
+                return
 
-        return None
-
-    def _parse_sse(self, message: str) -> Optional[str]:
+    async def aclose(self) -> None:
         """
-        Parses an SSE message to extract the data field.
-
-        Identical to the synchronous version's SSE parsing.
+        Releases the connection, stopping the stream.
         """
-        data = []
-        for line in message.split("\n"):
-            line = line.strip()
-            if line.startswith("data:"):
-                data.append(line[5:].strip())
-            elif line == "data:":  # Handle empty data field
-                data.append("")
-
-        if data:
-            return "\n".join(data)
-        return None
+        self._done = True
+        if self._context is not None:
+            context, self._context = self._context, None
+            await context.__aexit__(None, None, None)
+
+    async def _next_sse(self) -> ServerSentEvent[T]:
+        while True:
+            event = self._next_event()
+            if event is not None:
+                return event
+            if self._done:
+                raise StopAsyncIteration
+
+            try:
+                chunk = await self.iterator.__anext__()
+            except StopAsyncIteration:
+                self._flush()
+                await self.aclose()
+                continue
+            except httpx.TransportError:
+                if self._reconnect is None or not self._can_reconnect():
+                    await self.aclose()
+                    raise
+                await self._reopen(self._reconnect)
+                continue
+            self._feed(chunk)
+
+    async def _reopen(self, reconnect: AsyncReconnect) -> None:
+        await self.aclose()
+        await asyncio.sleep(self._reconnect_delay())
+        response, stream_context = await reconnect(self.last_event_id)
+        self._resume(response, stream_context)
+        self.iterator = response.aiter_bytes()
+        self._done = False
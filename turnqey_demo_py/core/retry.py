@@ -0,0 +1,225 @@
+import asyncio
+import datetime
+import email.utils
+import random
+import time
+from typing import Awaitable, Callable, List, Optional, Union
+
+import httpx
+from pydantic import BaseModel
+
+"""
+Retry handling for HTTP requests.
+
+Provides a configurable retry policy with exponential backoff, full jitter and
+`Retry-After` support, along with synchronous and asynchronous send loops that
+apply it.
+"""
+
+# a status code (e.g. `502`) or a status class (e.g. `"5xx"`)
+RetryableStatus = Union[int, str]
+
+
+class RetryPolicy(BaseModel):
+    """
+    Configures when and how failed requests are retried.
+
+    The delay before retry `n` is drawn uniformly from
+    `[0, min(max_delay, initial_delay * backoff_factor ** (n - 1))]` ("full jitter"),
+    unless the server sent a `Retry-After` header which is honored instead.
+
+    Attributes:
+        max_attempts: Total number of attempts including the first one, `1` disables retries
+        initial_delay: Upper bound in seconds of the delay before the first retry
+        max_delay: Upper bound in seconds of any backoff delay
+        backoff_factor: Multiplier applied to the delay bound after each attempt
+        retry_statuses: Status codes (`429`) or status classes (`"5xx"`) that are retried
+        retry_methods: HTTP methods that are considered idempotent and safe to retry
+        retry_transport_errors: Whether connection errors and timeouts are retried
+        respect_retry_after: Whether to wait for the duration given by a `Retry-After` header
+        max_retry_after: Upper bound in seconds for a `Retry-After` delay
+    """
+
+    max_attempts: int = 3
+    initial_delay: float = 0.5
+    max_delay: float = 8.0
+    backoff_factor: float = 2.0
+    retry_statuses: List[RetryableStatus] = [408, 429, "5xx"]
+    retry_methods: List[str] = ["GET", "PUT", "DELETE"]
+    retry_transport_errors: bool = True
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+
+    def is_retryable_method(self, method: str) -> bool:
+        """
+        Checks whether requests with the given HTTP method may be retried.
+        """
+        return method.upper() in (m.upper() for m in self.retry_methods)
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """
+        Checks whether a response status code matches one of `retry_statuses`.
+        """
+        for status in self.retry_statuses:
+            if isinstance(status, int):
+                if status == status_code:
+                    return True
+            elif status.lower() == f"{status_code // 100}xx":
+                return True
+        return False
+
+    def should_retry_response(
+        self,
+        *,
+        response: httpx.Response,
+        method: str,
+        attempt: int,
+        force: bool = False,
+    ) -> bool:
+        """
+        Decides whether a response received on attempt number `attempt` should be retried.
+
+        Args:
+            force: Retry regardless of `retry_methods`, for requests known to be safe to repeat
+        """
+        return (
+            attempt < self.max_attempts
+            and (force or self.is_retryable_method(method))
+            and self.is_retryable_status(response.status_code)
+        )
+
+    def should_retry_error(
+        self,
+        *,
+        error: Exception,
+        method: str,
+        attempt: int,
+        force: bool = False,
+    ) -> bool:
+        """
+        Decides whether an exception raised on attempt number `attempt` should be retried.
+
+        Args:
+            force: Retry regardless of `retry_methods`, for requests known to be safe to repeat
+        """
+        return (
+            attempt < self.max_attempts
+            and (force or self.is_retryable_method(method))
+            and self.retry_transport_errors
+            and isinstance(error, httpx.TransportError)
+        )
+
+    def compute_delay(
+        self, *, attempt: int, response: Optional[httpx.Response] = None
+    ) -> float:
+        """
+        Computes the number of seconds to wait before the attempt following `attempt`.
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = _parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        bound = min(
+            self.max_delay, self.initial_delay * (self.backoff_factor ** (attempt - 1))
+        )
+        return random.uniform(0, bound)
+
+
+def default_retry_policy() -> RetryPolicy:
+    """
+    Provides the retry policy used when none is configured.
+
+    Retries are opt-in: by default every request is sent once and dropped
+    streams are not reopened. Configure `RetryPolicy()` to retry idempotent
+    requests failing with a connection error, `408`, `429` or a `5xx` status.
+    """
+    return RetryPolicy(max_attempts=1)
+
+
+def send_with_retry(
+    policy: RetryPolicy,
+    send: Callable[[], httpx.Response],
+    *,
+    method: str,
+    force: bool = False,
+) -> httpx.Response:
+    """
+    Calls `send` until it returns a response that should not be retried.
+
+    Retried responses are closed before waiting. When attempts run out the last
+    response is returned, or the last transport error is re-raised.
+    """
+    attempt = 1
+    while True:
+        try:
+            response = send()
+        except Exception as e:
+            if not policy.should_retry_error(
+                error=e, method=method, attempt=attempt, force=force
+            ):
+                raise
+            delay = policy.compute_delay(attempt=attempt)
+        else:
+            if not policy.should_retry_response(
+                response=response, method=method, attempt=attempt, force=force
+            ):
+                return response
+            delay = policy.compute_delay(attempt=attempt, response=response)
+            response.close()
+
+        time.sleep(delay)
+        attempt += 1
+
+
+async def send_with_retry_async(
+    policy: RetryPolicy,
+    send: Callable[[], Awaitable[httpx.Response]],
+    *,
+    method: str,
+    force: bool = False,
+) -> httpx.Response:
+    """
+    Asynchronous version of `send_with_retry`, waiting without blocking the event loop.
+    """
+    attempt = 1
+    while True:
+        try:
+            response = await send()
+        except Exception as e:
+            if not policy.should_retry_error(
+                error=e, method=method, attempt=attempt, force=force
+            ):
+                raise
+            delay = policy.compute_delay(attempt=attempt)
+        else:
+            if not policy.should_retry_response(
+                response=response, method=method, attempt=attempt, force=force
+            ):
+                return response
+            delay = policy.compute_delay(attempt=attempt, response=response)
+            await response.aclose()
+
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a `Retry-After` header given either as seconds or as an HTTP date.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
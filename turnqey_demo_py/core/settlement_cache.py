@@ -0,0 +1,191 @@
+"""
+Persistent caching of historical settlement prices.
+
+The settlement price of an asset for a past date never changes, yet reports
+fetch the same ones over and over. The cache in this module keeps their
+response bodies in an SQLite database keyed by API base URL, date and symbol.
+It is shared by every process using the same file.
+"""
+
+import datetime
+import os
+import sqlite3
+import threading
+from typing import Callable, List, Optional
+
+import httpx
+
+from .request import RequestOptions, default_request_options
+
+# bumped with every change of the table, older tables are dropped
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE settlement_prices (
+    base_url TEXT NOT NULL,
+    date TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (base_url, date, symbol)
+) WITHOUT ROWID
+"""
+
+
+def _default_path() -> str:
+    # per-user location, never a file other users can write to
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_dir, "turnqey_demo_py", "settlement-prices.sqlite3")
+
+
+def _utc_today() -> datetime.date:
+    return datetime.datetime.now(datetime.timezone.utc).date()
+
+
+class SettlementPriceCache:
+    """
+    On-disk cache of settlement price responses for past dates.
+
+    Prices are cached per API base URL, so clients of different environments
+    never share them. Only dates before the current UTC date are cached, and
+    their entries never expire. Requests for today or future dates, or for
+    dates that are not ISO formatted, always reach the API. The database runs
+    in WAL mode, so any number of processes can read it while one of them
+    writes, and every thread uses its own connection.
+
+    Symbols are keyed exactly as given, so `btc` and `BTC` are cached
+    separately, callers should spell symbols consistently.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        timeout: float = 30.0,
+        today: Callable[[], datetime.date] = _utc_today,
+    ) -> None:
+        """
+        Args:
+            path: Path of the SQLite database, defaults to
+                `turnqey_demo_py/settlement-prices.sqlite3` in `$XDG_CACHE_HOME`
+                or `~/.cache`, whose directories are created private to the
+                current user
+            timeout: Seconds to wait for another process holding a write lock
+            today: Returns the current date, before which dates are cached
+        """
+        if path is None:
+            path = _default_path()
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        self.path = path
+        self.timeout = timeout
+        self._today = today
+        self._local = threading.local()
+        with self._connect() as connection:
+            # processes opening the file at once upgrade it one at a time
+            connection.execute("BEGIN IMMEDIATE")
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version != _SCHEMA_VERSION:
+                connection.execute("DROP TABLE IF EXISTS settlement_prices")
+                connection.execute(_SCHEMA)
+                connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def _connect(self) -> sqlite3.Connection:
+        connection: Optional[sqlite3.Connection] = getattr(
+            self._local, "connection", None
+        )
+        # connections are not shared with forked processes
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def cache_date(self, date: str) -> Optional[str]:
+        """
+        Returns the key under which prices for `date` are cached, or None when
+        they must not be cached.
+        """
+        try:
+            parsed = datetime.date.fromisoformat(date)
+        except ValueError:
+            return None
+        if parsed >= self._today():
+            return None
+        return parsed.isoformat()
+
+    def get(self, base_url: str, date: str, symbol: str) -> Optional[bytes]:
+        """
+        Returns the response body cached for `date` and `symbol` by the API at
+        `base_url`, if any.
+        """
+        key = self.cache_date(date)
+        if key is None:
+            return None
+        row = (
+            self._connect()
+            .execute(
+                "SELECT body FROM settlement_prices"
+                " WHERE base_url = ? AND date = ? AND symbol = ?",
+                (base_url, key, symbol),
+            )
+            .fetchone()
+        )
+        return None if row is None else bytes(row[0])
+
+    def put(self, base_url: str, date: str, symbol: str, body: bytes) -> None:
+        """
+        Stores the response body for `date` and `symbol` of the API at
+        `base_url`, unless the date must not be cached or a body is already
+        stored.
+        """
+        key = self.cache_date(date)
+        if key is None:
+            return
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO settlement_prices"
+                " (base_url, date, symbol, body) VALUES (?, ?, ?, ?)",
+                (base_url, key, symbol, body),
+            )
+
+    def __len__(self) -> int:
+        row = self._connect().execute("SELECT COUNT(*) FROM settlement_prices")
+        return int(row.fetchone()[0])
+
+    def clear(self) -> None:
+        """
+        Drops every cached price.
+        """
+        with self._connect() as connection:
+            connection.execute("DELETE FROM settlement_prices")
+
+    def close(self) -> None:
+        """
+        Closes the connection of the calling thread.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+def capture_body(
+    request_options: Optional[RequestOptions], bodies: List[bytes]
+) -> RequestOptions:
+    """
+    Returns a copy of `request_options` also appending the body of the
+    successful response to `bodies`.
+    """
+    options: RequestOptions = {**(request_options or default_request_options())}
+    on_response = options.get("on_response")
+
+    def capture(response: httpx.Response) -> None:
+        bodies.append(response.content)
+        if on_response is not None:
+            on_response(response)
+
+    options["on_response"] = capture
+    return options
@@ -0,0 +1,152 @@
+import re
+from typing import Generic, List, Optional, TypeVar
+
+"""
+Incremental tokenizing of Server-Sent Events (SSE) streams.
+
+Events are separated by a blank line, i.e. two consecutive line endings of
+any of the `\\r\\n`, `\\n` or `\\r` styles. The decoder below finds event
+boundaries in a single pass over the received bytes, keeping a read offset
+into its buffer instead of copying the remainder after every event. The
+fields of every event are then parsed into a `ServerSentEvent`.
+"""
+
+T = TypeVar("T")
+
+# a blank line ending an event, in any of the line ending styles
+_BOUNDARY = re.compile(rb"\r\n\r\n|\n\n|\r\r")
+_LINE_END = re.compile(r"\r\n|\r|\n")
+# longest boundary minus one, the overlap rescanned when more bytes arrive
+_OVERLAP = 3
+# consumed bytes tolerated at the start of the buffer before compacting it
+_COMPACT_THRESHOLD = 64 * 1024
+
+
+class SSEDecoder:
+    """
+    Splits a stream of bytes into the raw messages of its events.
+
+    Bytes are searched for boundaries once, apart from the few bytes at the
+    end of a chunk that may start a boundary completed by the next one, so
+    decoding takes time linear in the size of the stream however the events
+    are spread over chunks. Consumed bytes are dropped from the buffer only
+    once they make up most of it.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        # start of the first message not returned yet
+        self._start = 0
+        # position from which the buffer has not been searched yet
+        self._scan = 0
+
+    def feed(self, chunk: bytes) -> List[str]:
+        """
+        Adds bytes of the stream and returns the messages they complete.
+        """
+        buffer = self._buffer
+        buffer += chunk
+        messages: List[str] = []
+        while True:
+            match = _BOUNDARY.search(buffer, self._scan)
+            if match is None:
+                break
+            messages.append(buffer[self._start : match.start()].decode())
+            self._start = self._scan = match.end()
+        self._scan = max(self._start, len(buffer) - _OVERLAP)
+        self._compact()
+        return messages
+
+    def flush(self) -> Optional[str]:
+        """
+        Returns the message left unterminated at the end of the stream, if any.
+        """
+        rest = self._buffer[self._start :]
+        self._buffer = bytearray()
+        self._start = self._scan = 0
+        return rest.decode() if rest else None
+
+    def _compact(self) -> None:
+        start = self._start
+        if start == len(self._buffer):
+            self._buffer.clear()
+            self._start = self._scan = 0
+        elif start >= _COMPACT_THRESHOLD and start >= len(self._buffer) // 2:
+            del self._buffer[:start]
+            self._start = 0
+            self._scan -= start
+
+
+class ServerSentEvent(Generic[T]):
+    """
+    An event received from a Server-Sent Events stream.
+
+    Attributes:
+        data: Payload of the event, joined from its `data:` lines
+        event: Type of the event, "message" unless named by the server
+        id: Last event id received by the time of the event, if any
+        retry: Reconnection delay advised by the server, in milliseconds
+    """
+
+    __slots__ = ("data", "event", "id", "retry")
+
+    def __init__(
+        self,
+        data: T,
+        *,
+        event: str = "message",
+        id: Optional[str] = None,
+        retry: Optional[int] = None,
+    ) -> None:
+        self.data = data
+        self.event = event
+        self.id = id
+        self.retry = retry
+
+    def __repr__(self) -> str:
+        return (
+            f"ServerSentEvent(data={self.data!r}, event={self.event!r}, "
+            f"id={self.id!r}, retry={self.retry!r})"
+        )
+
+
+def parse_sse_event(message: str) -> ServerSentEvent[Optional[str]]:
+    """
+    Parses the fields of an SSE message.
+
+    The data is None when the message has no data field. `id` and `retry` are
+    those set by the message itself, None when it does not set them.
+    """
+    data: List[str] = []
+    event = "message"
+    event_id: Optional[str] = None
+    retry: Optional[int] = None
+    for line in _LINE_END.split(message):
+        line = line.strip()
+        if not line or line.startswith(":"):
+            # blank lines and comments, e.g. keep-alives
+            continue
+        name, _, value = line.partition(":")
+        value = value.strip()
+        if name == "data":
+            data.append(value)
+        elif name == "event":
+            event = value or "message"
+        elif name == "id":
+            if "\0" not in value:
+                event_id = value
+        elif name == "retry":
+            if value.isdigit():
+                retry = int(value)
+
+    return ServerSentEvent(
+        "\n".join(data) if data else None, event=event, id=event_id, retry=retry
+    )
+
+
+def parse_sse_data(message: str) -> Optional[str]:
+    """
+    Returns the data of an SSE message, joining multi-line data fields, or
+    None when the message has no data field.
+    """
+    return parse_sse_event(message).data
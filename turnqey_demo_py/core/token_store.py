@@ -0,0 +1,200 @@
+import abc
+import contextlib
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import time
+from typing import Any, ContextManager, Iterator, List, Optional
+
+from typing_extensions import TypedDict
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on windows
+    fcntl = None  # type: ignore
+
+"""
+Token stores sharing OAuth2 access tokens between processes.
+
+Worker fleets running many processes per host can share one access token per
+identity instead of each process requesting its own on startup and expiry.
+"""
+
+
+class StoredToken(TypedDict):
+    """
+    An access token persisted in a token store.
+
+    Attributes:
+        access_token: The access token value
+        expires_at: Unix timestamp at which the token expires
+    """
+
+    access_token: str
+    expires_at: float
+
+
+class TokenStore(abc.ABC):
+    """
+    Abstract base class for access token storage shared between processes.
+
+    Implementations must never log or otherwise expose the stored tokens.
+    """
+
+    @abc.abstractmethod
+    def load(self, key: str) -> Optional[StoredToken]:
+        """
+        Returns the token stored under `key`, if any.
+        """
+
+    @abc.abstractmethod
+    def save(self, key: str, token: StoredToken) -> None:
+        """
+        Stores `token` under `key`, replacing any previous token.
+        """
+
+    def lock(self, key: str) -> ContextManager[bool]:
+        """
+        Returns a context manager holding an exclusive lock on `key` across
+        processes, so only one process requests a new token at a time.
+
+        It enters as False when the lock could not be acquired in time, the
+        token is then refreshed without the store.
+        """
+        return contextlib.nullcontext(True)
+
+
+def _default_directory() -> str:
+    # per-user locations, never a directory other users can write to
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "turnqey_demo_py-tokens")
+    return os.path.join(os.path.expanduser("~"), ".cache", "turnqey_demo_py", "tokens")
+
+
+def token_store_key(
+    *,
+    token_url: str,
+    client_id: Optional[str],
+    scope: Optional[List[str]],
+    username: Optional[str] = None,
+) -> str:
+    """
+    Derives the store key of an OAuth2 identity.
+
+    The key is a hash, so store file names do not reveal client ids, and it
+    never includes client secrets or passwords.
+    """
+    identity = [token_url, client_id, sorted(scope or []), username]
+    return hashlib.sha256(json.dumps(identity).encode()).hexdigest()
+
+
+class FileTokenStore(TokenStore):
+    """
+    Stores tokens as files in a directory only accessible by the current user.
+
+    The directory must be owned by the current user with mode `0700`, a
+    directory other users could read or plant files in is refused.
+
+    Writes atomically replace the token file so concurrent readers never see a
+    partial token, and refreshes are serialized with `flock` on platforms that
+    support it. A process waiting longer than `lock_timeout` for another one
+    to finish its refresh requests a token of its own instead.
+    """
+
+    def __init__(
+        self, directory: Optional[str] = None, *, lock_timeout: float = 10.0
+    ) -> None:
+        """
+        Args:
+            directory: Directory holding the token files, created if missing.
+                Defaults to `turnqey_demo_py-tokens` in `$XDG_RUNTIME_DIR`, or
+                to `~/.cache/turnqey_demo_py/tokens`
+            lock_timeout: Seconds to wait for another process refreshing the
+                same token
+
+        Raises:
+            PermissionError: If the directory is not private to the current user
+        """
+        self.directory = directory or _default_directory()
+        self.lock_timeout = lock_timeout
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        self._check_private(self.directory)
+
+    @staticmethod
+    def _check_private(directory: str) -> None:
+        # ownership is not available on windows
+        if not hasattr(os, "getuid"):
+            return
+        st = os.lstat(directory)
+        if (
+            not stat.S_ISDIR(st.st_mode)
+            or st.st_uid != os.getuid()
+            or stat.S_IMODE(st.st_mode) != 0o700
+        ):
+            raise PermissionError(
+                f"refusing to store tokens in {directory}, it must be a directory "
+                "owned by the current user with mode 0700"
+            )
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{key}{suffix}")
+
+    def load(self, key: str) -> Optional[StoredToken]:
+        try:
+            with open(self._path(key, ".json"), "r") as f:
+                data: Any = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            not isinstance(data, dict)
+            or not isinstance(data.get("access_token"), str)
+            or not isinstance(data.get("expires_at"), (int, float))
+        ):
+            return None
+        return {"access_token": data["access_token"], "expires_at": data["expires_at"]}
+
+    def save(self, key: str, token: StoredToken) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{key}.")
+        try:
+            os.chmod(tmp_path, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {
+                        "access_token": token["access_token"],
+                        "expires_at": token["expires_at"],
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self._path(key, ".json"))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    def _acquire(self, fd: int) -> bool:
+        # poll, a blocking flock could wait forever on a stuck process
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.05)
+
+    @contextlib.contextmanager
+    def _flock(self, key: str) -> Iterator[bool]:
+        fd = os.open(self._path(key, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            yield fcntl is None or self._acquire(fd)
+        finally:
+            # closing the descriptor releases the lock
+            os.close(fd)
+
+    def lock(self, key: str) -> ContextManager[bool]:
+        return self._flock(key)
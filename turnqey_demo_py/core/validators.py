@@ -0,0 +1,98 @@
+import threading
+from typing import Any, Dict, Optional
+
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
+
+"""
+Process-wide caching of pydantic validators.
+
+Building a pydantic validator compiles a core schema for the target type, which
+is far more expensive than running the validator itself. The registries in this
+module build one `TypeAdapter` per type the first time it is needed and reuse it
+for every subsequent request or response.
+"""
+
+
+class ValidatorStats(TypedDict):
+    """
+    Snapshot of a validator registry's cache usage.
+
+    Attributes:
+        hits: Number of lookups served from the cache
+        misses: Number of lookups that had to build a new validator
+        size: Number of validators currently cached
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+
+class ValidatorRegistry:
+    """
+    Thread-safe cache of pydantic `TypeAdapter` instances keyed by type.
+
+    Types that cannot be used as dictionary keys are still supported, a fresh
+    adapter is built for them on every lookup and counted as a miss.
+    """
+
+    def __init__(self) -> None:
+        self._adapters: Dict[Any, TypeAdapter] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, tp: Any) -> TypeAdapter:
+        """
+        Returns the cached validator for `tp`, building it on first use.
+        """
+        try:
+            adapter: Optional[TypeAdapter] = self._adapters.get(tp)
+        except TypeError:
+            # unhashable type hint, nothing to cache it under
+            with self._lock:
+                self._misses += 1
+            return TypeAdapter(tp)
+
+        if adapter is not None:
+            with self._lock:
+                self._hits += 1
+            return adapter
+
+        with self._lock:
+            adapter = self._adapters.get(tp)
+            if adapter is None:
+                adapter = TypeAdapter(tp)
+                self._adapters[tp] = adapter
+                self._misses += 1
+            else:
+                self._hits += 1
+        return adapter
+
+    def stats(self) -> ValidatorStats:
+        """
+        Returns the hit/miss counters and current size of the cache.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._adapters),
+            }
+
+    def clear(self) -> None:
+        """
+        Drops all cached validators and resets the counters.
+        """
+        with self._lock:
+            self._adapters.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+# shared registry used to decode response payloads
+response_validators = ValidatorRegistry()
+
+# shared registry used to encode query parameters and request bodies
+request_validators = ValidatorRegistry()
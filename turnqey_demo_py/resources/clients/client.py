@@ -2,9 +2,13 @@ import typing
 
 from turnqey_demo_py.core import (
     AsyncBaseClient,
+    AsyncItemStream,
+    AsyncPager,
+    ItemStream,
     QueryParams,
     RequestOptions,
     SyncBaseClient,
+    SyncPager,
     default_request_options,
     encode_query_param,
     to_encodable,
@@ -155,6 +159,117 @@ class ClientsClient:
             request_options=request_options or default_request_options(),
         )
 
+    def iter_list(
+        self,
+        *,
+        page_size: typing.Optional[int] = None,
+        start_page: int = 1,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> SyncPager[models.Client]:
+        """
+        Iterate over all clients
+
+        Lazily yields the items of every page returned by `list`, requesting
+        the next page once the current one has been consumed
+
+        GET /clients
+
+        Args:
+            page_size: Number of items requested per page, defaults to the size
+                chosen by the client's page size tuner or 100 without one
+            start_page: Page number to start iterating from
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Pager yielding the items of all pages
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        for item in client.clients.iter_list():
+            print(item)
+        ```
+        """
+        return SyncPager(
+            fetch_page=lambda page, limit, options: self.list(
+                limit=limit,
+                page=page,
+                request_options=options,
+            ),
+            page_size=page_size,
+            start_page=start_page,
+            request_options=request_options,
+            endpoint="/clients",
+            tuner=self._base_client.page_size_tuner,
+        )
+
+    def stream_list(
+        self,
+        *,
+        limit: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> ItemStream[models.Client]:
+        """
+        Get all clients
+
+        Yields the items of the page returned by `list` as soon as they
+        have been received, instead of decoding the whole response first
+
+        GET /clients
+
+        Args:
+            limit: Number of items per page
+            page: Page number for pagination
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Stream yielding the items of the page
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        with client.clients.stream_list() as items:
+            for item in items:
+                print(item)
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(limit, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "limit",
+                to_encodable(item=limit, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "page",
+                to_encodable(item=page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.stream_items(
+            method="GET",
+            path="/clients",
+            auth_names=["clientCredentials"],
+            query_params=_query,
+            cast_to=models.Client,
+            request_options=request_options or default_request_options(),
+        )
+
     def get(
         self, *, client_id: str, request_options: typing.Optional[RequestOptions] = None
     ) -> models.Client:
@@ -404,6 +519,117 @@ class AsyncClientsClient:
             request_options=request_options or default_request_options(),
         )
 
+    def aiter_list(
+        self,
+        *,
+        page_size: typing.Optional[int] = None,
+        start_page: int = 1,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> AsyncPager[models.Client]:
+        """
+        Iterate over all clients
+
+        Lazily yields the items of every page returned by `list`, requesting
+        the next page once the current one has been consumed
+
+        GET /clients
+
+        Args:
+            page_size: Number of items requested per page, defaults to the size
+                chosen by the client's page size tuner or 100 without one
+            start_page: Page number to start iterating from
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Pager yielding the items of all pages
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async for item in client.clients.aiter_list():
+            print(item)
+        ```
+        """
+        return AsyncPager(
+            fetch_page=lambda page, limit, options: self.list(
+                limit=limit,
+                page=page,
+                request_options=options,
+            ),
+            page_size=page_size,
+            start_page=start_page,
+            request_options=request_options,
+            endpoint="/clients",
+            tuner=self._base_client.page_size_tuner,
+        )
+
+    async def stream_list(
+        self,
+        *,
+        limit: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> AsyncItemStream[models.Client]:
+        """
+        Get all clients
+
+        Yields the items of the page returned by `list` as soon as they
+        have been received, instead of decoding the whole response first
+
+        GET /clients
+
+        Args:
+            limit: Number of items per page
+            page: Page number for pagination
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Stream yielding the items of the page
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async with await client.clients.stream_list() as items:
+            async for item in items:
+                print(item)
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(limit, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "limit",
+                to_encodable(item=limit, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "page",
+                to_encodable(item=page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        return await self._base_client.stream_items(
+            method="GET",
+            path="/clients",
+            auth_names=["clientCredentials"],
+            query_params=_query,
+            cast_to=models.Client,
+            request_options=request_options or default_request_options(),
+        )
+
     async def get(
         self, *, client_id: str, request_options: typing.Optional[RequestOptions] = None
     ) -> models.Client:
@@ -2,15 +2,19 @@ import typing
 
 from turnqey_demo_py.core import (
     AsyncBaseClient,
+    AsyncItemStream,
+    AsyncPager,
+    ItemStream,
     QueryParams,
     RequestOptions,
     SyncBaseClient,
+    SyncPager,
     default_request_options,
     encode_query_param,
     to_encodable,
     type_utils,
 )
-from turnqey_demo_py.types import models
+from turnqey_demo_py.types import frames, models
 
 
 class DepositsWithdrawalsClient:
@@ -106,6 +110,216 @@ class DepositsWithdrawalsClient:
             request_options=request_options or default_request_options(),
         )
 
+    def iter_get(
+        self,
+        *,
+        client_id: str,
+        date_from: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        date_to: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        page_size: typing.Optional[int] = None,
+        start_page: int = 1,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> SyncPager[models.DepositWithdrawal]:
+        """
+        Iterate over client deposits and withdrawals
+
+        Lazily yields the items of every page returned by `get`, requesting
+        the next page once the current one has been consumed
+
+        GET /clients/{clientId}/deposits-withdrawals
+
+        Args:
+            dateFrom: Start date for filtering (YYYY-MM-DD)
+            dateTo: End date for filtering (YYYY-MM-DD)
+            clientId: ID of the client
+            page_size: Number of items requested per page, defaults to the size
+                chosen by the client's page size tuner or 100 without one
+            start_page: Page number to start iterating from
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Pager yielding the items of all pages
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        for deposit_withdrawal in client.clients.deposits_withdrawals.iter_get(
+            client_id="3e4666bf-d5e5-4aa7-b8ce-cefe41c7568a"
+        ):
+            print(deposit_withdrawal)
+        ```
+        """
+        return SyncPager(
+            fetch_page=lambda page, limit, options: self.get(
+                client_id=client_id,
+                date_from=date_from,
+                date_to=date_to,
+                limit=limit,
+                page=page,
+                request_options=options,
+            ),
+            page_size=page_size,
+            start_page=start_page,
+            request_options=request_options,
+            endpoint="/clients/{clientId}/deposits-withdrawals",
+            tuner=self._base_client.page_size_tuner,
+        )
+
+    def stream_get(
+        self,
+        *,
+        client_id: str,
+        date_from: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        date_to: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        limit: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> ItemStream[models.DepositWithdrawal]:
+        """
+        Get client deposits and withdrawals
+
+        Yields the items of the page returned by `get` as soon as they
+        have been received, instead of decoding the whole response first
+
+        GET /clients/{clientId}/deposits-withdrawals
+
+        Args:
+            dateFrom: Start date for filtering (YYYY-MM-DD)
+            dateTo: End date for filtering (YYYY-MM-DD)
+            limit: Number of items per page
+            page: Page number for pagination
+            clientId: ID of the client
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Stream yielding the items of the page
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        with client.clients.deposits_withdrawals.stream_get(
+            client_id="3e4666bf-d5e5-4aa7-b8ce-cefe41c7568a"
+        ) as items:
+            for item in items:
+                print(item)
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(date_from, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "dateFrom",
+                to_encodable(item=date_from, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(date_to, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "dateTo",
+                to_encodable(item=date_to, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(limit, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "limit",
+                to_encodable(item=limit, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "page",
+                to_encodable(item=page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.stream_items(
+            method="GET",
+            path=f"/clients/{client_id}/deposits-withdrawals",
+            auth_names=["clientCredentials"],
+            query_params=_query,
+            cast_to=models.DepositWithdrawal,
+            request_options=request_options or default_request_options(),
+        )
+
+    def get_frame(
+        self,
+        *,
+        client_id: str,
+        date_from: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        date_to: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        page_size: typing.Optional[int] = None,
+        start_page: int = 1,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> frames.DepositWithdrawalFrame:
+        """
+        Get client deposits and withdrawals as a columnar frame
+
+        Decodes the items of every page returned by `get` into NumPy arrays
+        instead of models, requires numpy from the `frames` extra
+
+        GET /clients/{clientId}/deposits-withdrawals
+
+        Args:
+            dateFrom: Start date for filtering (YYYY-MM-DD)
+            dateTo: End date for filtering (YYYY-MM-DD)
+            clientId: ID of the client
+            page_size: Number of items requested per page, defaults to the size
+                chosen by the client's page size tuner or 100 without one
+            start_page: Page number to start iterating from
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Frame holding the items of all pages
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+            ImportError: numpy is not installed
+
+        Examples:
+        ```py
+        frame = client.clients.deposits_withdrawals.get_frame(
+            client_id="3e4666bf-d5e5-4aa7-b8ce-cefe41c7568a"
+        )
+        ```
+        """
+        pager = self.iter_get(
+            client_id=client_id,
+            date_from=date_from,
+            date_to=date_to,
+            page_size=page_size,
+            start_page=start_page,
+            request_options={**(request_options or {}), "response_mode": "raw"},
+        )
+        return frames.DepositWithdrawalFrame.from_pages(pager.iter_pages())
+
 
 class AsyncDepositsWithdrawalsClient:
     def __init__(self, *, base_client: AsyncBaseClient):
@@ -199,3 +413,213 @@ class AsyncDepositsWithdrawalsClient:
             cast_to=models.ClientsDepositsWithdrawalsGetResponse,
             request_options=request_options or default_request_options(),
         )
+
+    def aiter_get(
+        self,
+        *,
+        client_id: str,
+        date_from: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        date_to: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        page_size: typing.Optional[int] = None,
+        start_page: int = 1,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> AsyncPager[models.DepositWithdrawal]:
+        """
+        Iterate over client deposits and withdrawals
+
+        Lazily yields the items of every page returned by `get`, requesting
+        the next page once the current one has been consumed
+
+        GET /clients/{clientId}/deposits-withdrawals
+
+        Args:
+            dateFrom: Start date for filtering (YYYY-MM-DD)
+            dateTo: End date for filtering (YYYY-MM-DD)
+            clientId: ID of the client
+            page_size: Number of items requested per page, defaults to the size
+                chosen by the client's page size tuner or 100 without one
+            start_page: Page number to start iterating from
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Pager yielding the items of all pages
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async for deposit_withdrawal in client.clients.deposits_withdrawals.aiter_get(
+            client_id="3e4666bf-d5e5-4aa7-b8ce-cefe41c7568a"
+        ):
+            print(deposit_withdrawal)
+        ```
+        """
+        return AsyncPager(
+            fetch_page=lambda page, limit, options: self.get(
+                client_id=client_id,
+                date_from=date_from,
+                date_to=date_to,
+                limit=limit,
+                page=page,
+                request_options=options,
+            ),
+            page_size=page_size,
+            start_page=start_page,
+            request_options=request_options,
+            endpoint="/clients/{clientId}/deposits-withdrawals",
+            tuner=self._base_client.page_size_tuner,
+        )
+
+    async def stream_get(
+        self,
+        *,
+        client_id: str,
+        date_from: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        date_to: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        limit: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> AsyncItemStream[models.DepositWithdrawal]:
+        """
+        Get client deposits and withdrawals
+
+        Yields the items of the page returned by `get` as soon as they
+        have been received, instead of decoding the whole response first
+
+        GET /clients/{clientId}/deposits-withdrawals
+
+        Args:
+            dateFrom: Start date for filtering (YYYY-MM-DD)
+            dateTo: End date for filtering (YYYY-MM-DD)
+            limit: Number of items per page
+            page: Page number for pagination
+            clientId: ID of the client
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Stream yielding the items of the page
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async with await client.clients.deposits_withdrawals.stream_get(
+            client_id="3e4666bf-d5e5-4aa7-b8ce-cefe41c7568a"
+        ) as items:
+            async for item in items:
+                print(item)
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(date_from, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "dateFrom",
+                to_encodable(item=date_from, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(date_to, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "dateTo",
+                to_encodable(item=date_to, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(limit, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "limit",
+                to_encodable(item=limit, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "page",
+                to_encodable(item=page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        return await self._base_client.stream_items(
+            method="GET",
+            path=f"/clients/{client_id}/deposits-withdrawals",
+            auth_names=["clientCredentials"],
+            query_params=_query,
+            cast_to=models.DepositWithdrawal,
+            request_options=request_options or default_request_options(),
+        )
+
+    async def get_frame(
+        self,
+        *,
+        client_id: str,
+        date_from: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        date_to: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        page_size: typing.Optional[int] = None,
+        start_page: int = 1,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> frames.DepositWithdrawalFrame:
+        """
+        Get client deposits and withdrawals as a columnar frame
+
+        Decodes the items of every page returned by `get` into NumPy arrays
+        instead of models, requires numpy from the `frames` extra
+
+        GET /clients/{clientId}/deposits-withdrawals
+
+        Args:
+            dateFrom: Start date for filtering (YYYY-MM-DD)
+            dateTo: End date for filtering (YYYY-MM-DD)
+            clientId: ID of the client
+            page_size: Number of items requested per page, defaults to the size
+                chosen by the client's page size tuner or 100 without one
+            start_page: Page number to start iterating from
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Frame holding the items of all pages
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+            ImportError: numpy is not installed
+
+        Examples:
+        ```py
+        frame = await client.clients.deposits_withdrawals.get_frame(
+            client_id="3e4666bf-d5e5-4aa7-b8ce-cefe41c7568a"
+        )
+        ```
+        """
+        pager = self.aiter_get(
+            client_id=client_id,
+            date_from=date_from,
+            date_to=date_to,
+            page_size=page_size,
+            start_page=start_page,
+            request_options={**(request_options or {}), "response_mode": "raw"},
+        )
+        return await frames.DepositWithdrawalFrame.afrom_pages(pager.iter_pages())
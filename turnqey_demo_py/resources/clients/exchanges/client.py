@@ -2,9 +2,13 @@ import typing
 
 from turnqey_demo_py.core import (
     AsyncBaseClient,
+    AsyncItemStream,
+    AsyncPager,
+    ItemStream,
     QueryParams,
     RequestOptions,
     SyncBaseClient,
+    SyncPager,
     default_request_options,
     encode_query_param,
     to_encodable,
@@ -80,6 +84,126 @@ class ExchangesClient:
             request_options=request_options or default_request_options(),
         )
 
+    def iter_get(
+        self,
+        *,
+        client_id: str,
+        page_size: typing.Optional[int] = None,
+        start_page: int = 1,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> SyncPager[models.Exchange]:
+        """
+        Iterate over client exchanges
+
+        Lazily yields the items of every page returned by `get`, requesting
+        the next page once the current one has been consumed
+
+        GET /clients/{clientId}/exchanges
+
+        Args:
+            clientId: ID of the client
+            page_size: Number of items requested per page, defaults to the size
+                chosen by the client's page size tuner or 100 without one
+            start_page: Page number to start iterating from
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Pager yielding the items of all pages
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        for exchange in client.clients.exchanges.iter_get(
+            client_id="3e4666bf-d5e5-4aa7-b8ce-cefe41c7568a"
+        ):
+            print(exchange)
+        ```
+        """
+        return SyncPager(
+            fetch_page=lambda page, limit, options: self.get(
+                client_id=client_id,
+                limit=limit,
+                page=page,
+                request_options=options,
+            ),
+            page_size=page_size,
+            start_page=start_page,
+            request_options=request_options,
+            endpoint="/clients/{clientId}/exchanges",
+            tuner=self._base_client.page_size_tuner,
+        )
+
+    def stream_get(
+        self,
+        *,
+        client_id: str,
+        limit: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> ItemStream[models.Exchange]:
+        """
+        Get client exchanges
+
+        Yields the items of the page returned by `get` as soon as they
+        have been received, instead of decoding the whole response first
+
+        GET /clients/{clientId}/exchanges
+
+        Args:
+            limit: Number of items per page
+            page: Page number for pagination
+            clientId: ID of the client
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Stream yielding the items of the page
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        with client.clients.exchanges.stream_get(
+            client_id="3e4666bf-d5e5-4aa7-b8ce-cefe41c7568a"
+        ) as items:
+            for item in items:
+                print(item)
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(limit, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "limit",
+                to_encodable(item=limit, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "page",
+                to_encodable(item=page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.stream_items(
+            method="GET",
+            path=f"/clients/{client_id}/exchanges",
+            auth_names=["clientCredentials"],
+            query_params=_query,
+            cast_to=models.Exchange,
+            request_options=request_options or default_request_options(),
+        )
+
     def create(
         self,
         *,
@@ -207,6 +331,126 @@ class AsyncExchangesClient:
             request_options=request_options or default_request_options(),
         )
 
+    def aiter_get(
+        self,
+        *,
+        client_id: str,
+        page_size: typing.Optional[int] = None,
+        start_page: int = 1,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> AsyncPager[models.Exchange]:
+        """
+        Iterate over client exchanges
+
+        Lazily yields the items of every page returned by `get`, requesting
+        the next page once the current one has been consumed
+
+        GET /clients/{clientId}/exchanges
+
+        Args:
+            clientId: ID of the client
+            page_size: Number of items requested per page, defaults to the size
+                chosen by the client's page size tuner or 100 without one
+            start_page: Page number to start iterating from
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Pager yielding the items of all pages
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async for exchange in client.clients.exchanges.aiter_get(
+            client_id="3e4666bf-d5e5-4aa7-b8ce-cefe41c7568a"
+        ):
+            print(exchange)
+        ```
+        """
+        return AsyncPager(
+            fetch_page=lambda page, limit, options: self.get(
+                client_id=client_id,
+                limit=limit,
+                page=page,
+                request_options=options,
+            ),
+            page_size=page_size,
+            start_page=start_page,
+            request_options=request_options,
+            endpoint="/clients/{clientId}/exchanges",
+            tuner=self._base_client.page_size_tuner,
+        )
+
+    async def stream_get(
+        self,
+        *,
+        client_id: str,
+        limit: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> AsyncItemStream[models.Exchange]:
+        """
+        Get client exchanges
+
+        Yields the items of the page returned by `get` as soon as they
+        have been received, instead of decoding the whole response first
+
+        GET /clients/{clientId}/exchanges
+
+        Args:
+            limit: Number of items per page
+            page: Page number for pagination
+            clientId: ID of the client
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Stream yielding the items of the page
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async with await client.clients.exchanges.stream_get(
+            client_id="3e4666bf-d5e5-4aa7-b8ce-cefe41c7568a"
+        ) as items:
+            async for item in items:
+                print(item)
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(limit, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "limit",
+                to_encodable(item=limit, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "page",
+                to_encodable(item=page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        return await self._base_client.stream_items(
+            method="GET",
+            path=f"/clients/{client_id}/exchanges",
+            auth_names=["clientCredentials"],
+            query_params=_query,
+            cast_to=models.Exchange,
+            request_options=request_options or default_request_options(),
+        )
+
     async def create(
         self,
         *,
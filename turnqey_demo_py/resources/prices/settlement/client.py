@@ -1,3 +1,4 @@
+import asyncio
 import typing
 
 from turnqey_demo_py.core import (
@@ -5,6 +6,7 @@ from turnqey_demo_py.core import (
     QueryParams,
     RequestOptions,
     SyncBaseClient,
+    capture_body,
     default_request_options,
     encode_query_param,
     to_encodable,
@@ -28,6 +30,11 @@ class SettlementClient:
 
         Retrieve settlement price for an asset
 
+        With a settlement cache configured on the client, prices of past dates
+        are served from it once fetched. They are keyed by `symbol_field` as
+        given, e.g. `btc` and `BTC` are cached separately. Requests with
+        `additional_params` always reach the API.
+
         GET /settlement-price
 
         Args:
@@ -62,7 +69,22 @@ class SettlementClient:
             style="form",
             explode=True,
         )
-        return self._base_client.request(
+        cache = self._base_client.settlement_cache
+        if request_options and request_options.get("additional_params"):
+            # extra query parameters may change the price returned
+            cache = None
+        base_url = self._base_client.get_base_url()
+        bodies: typing.List[bytes] = []
+        if cache is not None:
+            cached = cache.get(base_url, date, symbol_field)
+            if cached is not None:
+                return self._base_client.process_content(
+                    content=cached,
+                    cast_to=models.SettlementPrice,
+                    request_options=request_options,
+                )
+            request_options = capture_body(request_options, bodies)
+        price: models.SettlementPrice = self._base_client.request(
             method="GET",
             path="/settlement-price",
             auth_names=["clientCredentials"],
@@ -70,6 +92,9 @@ class SettlementClient:
             cast_to=models.SettlementPrice,
             request_options=request_options or default_request_options(),
         )
+        if cache is not None and bodies:
+            cache.put(base_url, date, symbol_field, bodies[0])
+        return price
 
 
 class AsyncSettlementClient:
@@ -88,6 +113,11 @@ class AsyncSettlementClient:
 
         Retrieve settlement price for an asset
 
+        With a settlement cache configured on the client, prices of past dates
+        are served from it once fetched. They are keyed by `symbol_field` as
+        given, e.g. `btc` and `BTC` are cached separately. Requests with
+        `additional_params` always reach the API.
+
         GET /settlement-price
 
         Args:
@@ -122,7 +152,26 @@ class AsyncSettlementClient:
             style="form",
             explode=True,
         )
-        return await self._base_client.request(
+        cache = self._base_client.settlement_cache
+        if request_options and request_options.get("additional_params"):
+            # extra query parameters may change the price returned
+            cache = None
+        base_url = self._base_client.get_base_url()
+        bodies: typing.List[bytes] = []
+        if cache is not None:
+            # the cache reads and writes a file, off the event loop
+            loop = asyncio.get_running_loop()
+            cached = await loop.run_in_executor(
+                None, cache.get, base_url, date, symbol_field
+            )
+            if cached is not None:
+                return self._base_client.process_content(
+                    content=cached,
+                    cast_to=models.SettlementPrice,
+                    request_options=request_options,
+                )
+            request_options = capture_body(request_options, bodies)
+        price: models.SettlementPrice = await self._base_client.request(
             method="GET",
             path="/settlement-price",
             auth_names=["clientCredentials"],
@@ -130,3 +179,8 @@ class AsyncSettlementClient:
             cast_to=models.SettlementPrice,
             request_options=request_options or default_request_options(),
         )
+        if cache is not None and bodies:
+            await loop.run_in_executor(
+                None, cache.put, base_url, date, symbol_field, bodies[0]
+            )
+        return price
@@ -0,0 +1,13 @@
+from .deposit_withdrawal_frame import DepositWithdrawalFrame
+from .holding_price_frame import HoldingPriceFrame
+from .trade_frame import TradeFrame
+from .transaction_frame import TransactionFrame
+from .transfer_frame import TransferFrame
+
+__all__ = [
+    "DepositWithdrawalFrame",
+    "HoldingPriceFrame",
+    "TradeFrame",
+    "TransactionFrame",
+    "TransferFrame",
+]
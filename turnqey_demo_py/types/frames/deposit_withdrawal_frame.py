@@ -0,0 +1,11 @@
+from turnqey_demo_py.core.frame import Frame
+from turnqey_demo_py.types import models
+
+
+class DepositWithdrawalFrame(Frame):
+    """
+    Columnar deposits and withdrawals
+    """
+
+    model = models.DepositWithdrawal
+    symbol_fields = ("asset",)
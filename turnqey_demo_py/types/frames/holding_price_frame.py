@@ -0,0 +1,11 @@
+from turnqey_demo_py.core.frame import Frame
+from turnqey_demo_py.types import models
+
+
+class HoldingPriceFrame(Frame):
+    """
+    Columnar holding prices
+    """
+
+    model = models.HoldingPrice
+    symbol_fields = ("symbol_field",)
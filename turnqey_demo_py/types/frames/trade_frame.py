@@ -0,0 +1,11 @@
+from turnqey_demo_py.core.frame import Frame
+from turnqey_demo_py.types import models
+
+
+class TradeFrame(Frame):
+    """
+    Columnar trades
+    """
+
+    model = models.Trade
+    symbol_fields = ("base_asset", "quote_asset", "fee_asset")
@@ -0,0 +1,11 @@
+from turnqey_demo_py.core.frame import Frame
+from turnqey_demo_py.types import models
+
+
+class TransactionFrame(Frame):
+    """
+    Columnar transactions
+    """
+
+    model = models.Transaction
+    symbol_fields = ("asset",)
@@ -0,0 +1,11 @@
+from turnqey_demo_py.core.frame import Frame
+from turnqey_demo_py.types import models
+
+
+class TransferFrame(Frame):
+    """
+    Columnar transfers
+    """
+
+    model = models.Transfer
+    symbol_fields = ("asset", "fee_asset")
@@ -0,0 +1,25 @@
+from .balance_record import BalanceRecord
+from .clients_balances_get_response_record import ClientsBalancesGetResponseRecord
+from .clients_trades_get_response_record import ClientsTradesGetResponseRecord
+from .clients_transactions_get_response_record import (
+    ClientsTransactionsGetResponseRecord,
+)
+from .holding_price_record import HoldingPriceRecord
+from .price_record import PriceRecord
+from .prices_get_response_record import PricesGetResponseRecord
+from .prices_holding_get_response_record import PricesHoldingGetResponseRecord
+from .trade_record import TradeRecord
+from .transaction_record import TransactionRecord
+
+__all__ = [
+    "BalanceRecord",
+    "ClientsBalancesGetResponseRecord",
+    "ClientsTradesGetResponseRecord",
+    "ClientsTransactionsGetResponseRecord",
+    "HoldingPriceRecord",
+    "PriceRecord",
+    "PricesGetResponseRecord",
+    "PricesHoldingGetResponseRecord",
+    "TradeRecord",
+    "TransactionRecord",
+]
@@ -0,0 +1,10 @@
+from turnqey_demo_py.core.record import Record
+from turnqey_demo_py.types import models
+
+
+class ClientsTransactionsGetResponseRecord(
+    Record, model=models.ClientsTransactionsGetResponse
+):
+    """
+    Slotted ClientsTransactionsGetResponse
+    """
@@ -0,0 +1,8 @@
+from turnqey_demo_py.core.record import Record
+from turnqey_demo_py.types import models
+
+
+class TransactionRecord(Record, model=models.Transaction):
+    """
+    Slotted Transaction
+    """